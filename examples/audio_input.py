@@ -149,7 +149,9 @@ def example_file_through_effect(plugin_path, input_path, sample_rate, buffer_siz
     try:
         while pos < file_frames and running:
             end = min(pos + feed_block, file_frames)
-            chunk = data[:, pos:end]
+            # A column slice is not C-contiguous; convert it once here
+            # rather than having write_input() copy it implicitly.
+            chunk = minihost.as_audio(data[:, pos:end])
 
             # Pad/truncate channels to match device
             if chunk.shape[0] < channels:
@@ -34,6 +34,7 @@ import time
 import numpy as np
 
 import minihost
+from minihost._metrics import peak as peak_level
 
 
 def create_test_midi():
@@ -69,7 +70,7 @@ def render_with_mode(plugin_path, midi_file, label, tail_seconds,
     elapsed = time.monotonic() - start
 
     duration = audio.shape[1] / 48000.0
-    peak = float(np.max(np.abs(audio)))
+    peak = peak_level(audio)
     peak_db = 20.0 * np.log10(peak) if peak > 0 else -120.0
 
     # Find the actual tail: last sample above threshold
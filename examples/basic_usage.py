@@ -16,6 +16,7 @@ except ImportError:
     HAS_NUMPY = False
 
 import minihost
+from minihost._metrics import peak as peak_level
 
 
 def get_plugin_path():
@@ -57,18 +58,107 @@ def example_offline_processing():
     print(f"Loaded: {plugin.num_params} parameters")
 
     # Create buffers
-    input_audio = np.zeros((2, 512), dtype=np.float32)
-    output_audio = np.zeros((2, 512), dtype=np.float32)
-
-    # Send a note and process
-    midi_events = [
-        (0, 0x90, 60, 100),    # Note on: C4, velocity 100
-        (256, 0x80, 60, 0),    # Note off after 256 samples
-    ]
+    input_audio = np.zeros((2, plugin.max_block_size), dtype=np.float32)
+    output_audio = np.zeros((2, plugin.max_block_size), dtype=np.float32)
+
+    # Send a note and process. A structured event array is copied into the
+    # plugin in one go (a list of tuples works too).
+    midi_events = minihost.make_midi_events(2)
+    midi_events[0] = (0, 0x90, 60, 100)    # Note on: C4, velocity 100
+    midi_events[1] = (256, 0x80, 60, 0)    # Note off after 256 samples
     plugin.process_midi(input_audio, output_audio, midi_events)
 
     # Check output
-    peak = np.max(np.abs(output_audio))
+    peak = peak_level(output_audio)
+    print(f"Peak output level: {peak:.4f}")
+    print()
+
+
+def example_offline_processing_signal():
+    """Process a test tone through the plugin (useful for effects)."""
+    print("=== Offline Processing (sine input) ===")
+
+    if not HAS_NUMPY:
+        print("(skipped - numpy not installed)")
+        print()
+        return
+
+    from minihost._testsignals import fill_sine
+
+    path = get_plugin_path()
+    plugin = minihost.Plugin(path, sample_rate=48000, max_block_size=512)
+
+    input_audio = np.zeros((2, plugin.max_block_size), dtype=np.float32)
+    output_audio = np.zeros((2, plugin.max_block_size), dtype=np.float32)
+
+    # Refill the same input buffer per block; the returned position keeps
+    # the tone phase-continuous across blocks.
+    pos = 0
+    for _ in range(8):
+        pos = fill_sine(input_audio, 440.0, 48000, phase=pos, amplitude=0.5)
+        plugin.process(input_audio, output_audio)
+
+    peak = peak_level(output_audio)
+    print(f"Peak output level: {peak:.4f}")
+    print()
+
+
+def example_offline_processing_int16():
+    """Process 16-bit PCM blocks without converting them in Python."""
+    print("=== Offline Processing (int16 PCM) ===")
+
+    if not HAS_NUMPY:
+        print("(skipped - numpy not installed)")
+        print()
+        return
+
+    path = get_plugin_path()
+    plugin = minihost.Plugin(path, sample_rate=48000, max_block_size=512)
+    block = plugin.max_block_size
+
+    # A PCM source (e.g. WAV data) kept as int16: half the memory of float32.
+    # process_int16 scales to float for the plugin and back at the boundary.
+    t = np.arange(block * 8) / 48000.0
+    pcm = (np.sin(2 * np.pi * 440.0 * t) * 16384).astype(np.int16)
+    source = np.stack([pcm, pcm])
+    out_block = np.zeros((2, block), dtype=np.int16)
+
+    peak = 0
+    for start in range(0, source.shape[1], block):
+        plugin.process_int16(np.ascontiguousarray(source[:, start:start + block]), out_block)
+        peak = max(peak, int(np.abs(out_block.astype(np.int32)).max()))
+
+    print(f"Peak output level: {peak / 32768.0:.4f}")
+    print()
+
+
+def example_planar_processing():
+    """Process audio kept as one 1-D buffer per channel."""
+    print("=== Planar Processing ===")
+
+    if not HAS_NUMPY:
+        print("(skipped - numpy not installed)")
+        print()
+        return
+
+    from minihost._testsignals import fill_sine
+
+    path = get_plugin_path()
+    plugin = minihost.Plugin(path, sample_rate=48000, max_block_size=512)
+
+    # Each channel is its own buffer; process_planar uses them in place
+    block = plugin.max_block_size
+    in_bufs = [np.zeros(block, dtype=np.float32) for _ in range(2)]
+    out_bufs = [np.zeros(block, dtype=np.float32) for _ in range(2)]
+
+    pos = 0
+    for _ in range(8):
+        for buf in in_bufs:
+            fill_sine(buf, 440.0, 48000, phase=pos, amplitude=0.5)
+        pos += block
+        plugin.process_planar(in_bufs, out_bufs)
+
+    peak = max(peak_level(buf) for buf in out_bufs)
     print(f"Peak output level: {peak:.4f}")
     print()
 
@@ -84,17 +174,23 @@ def example_realtime_playback():
     with minihost.AudioDevice(plugin) as audio:
         print(f"Playing at {audio.sample_rate:.0f} Hz")
 
-        # Play a chord using send_midi (queues events to audio thread)
-        audio.send_midi(0x90, 60, 80)   # C4 note on
-        audio.send_midi(0x90, 64, 80)   # E4 note on
-        audio.send_midi(0x90, 67, 80)   # G4 note on
+        # Play a chord (queues events to audio thread). send_midi_batch
+        # submits all three note-ons at once so they start together.
+        if HAS_NUMPY:
+            chord_on = np.array(
+                [[0x90, 60, 80], [0x90, 64, 80], [0x90, 67, 80]],  # C4, E4, G4
+                dtype=np.uint8,
+            )
+            audio.send_midi_batch(chord_on)
+        else:
+            audio.send_midi(0x90, 60, 80)   # C4 note on
+            audio.send_midi(0x90, 64, 80)   # E4 note on
+            audio.send_midi(0x90, 67, 80)   # G4 note on
 
         time.sleep(1.0)
 
-        # Release notes
-        audio.send_midi(0x80, 60, 0)    # C4 note off
-        audio.send_midi(0x80, 64, 0)    # E4 note off
-        audio.send_midi(0x80, 67, 0)    # G4 note off
+        # Release notes: All Notes Off on every channel, in one batch
+        audio.all_notes_off()
 
         time.sleep(0.5)
 
@@ -150,10 +246,11 @@ def example_parameters():
 
     plugin = minihost.Plugin(path, sample_rate=48000)
 
-    # List first 5 parameters
-    for i in range(min(5, plugin.num_params)):
-        info = plugin.get_param_info(i)
-        value = plugin.get_param(i)
+    # List first 5 parameters (one call each for metadata and values;
+    # the range is clamped if the plugin has fewer)
+    infos = plugin.get_param_infos(0, 5)
+    values = plugin.get_params(0, 5)
+    for i, (info, value) in enumerate(zip(infos, values)):
         print(f"  [{i}] {info['name']}: {value:.3f} ({info['current_value_str']})")
 
     print()
@@ -172,9 +269,12 @@ def example_state():
         plugin.set_param(0, 0.75)
         print(f"Changed param 0: {original:.3f} -> {plugin.get_param(0):.3f}")
 
-    # Save state
-    state = plugin.get_state()
-    print(f"Saved state: {len(state)} bytes")
+    # Save state into a reusable buffer (grown on demand, never shrunk), so
+    # repeated snapshots -- A/B comparisons, preset sweeps -- don't allocate
+    state_buf = bytearray(65536)
+    n = plugin.get_state_into(state_buf)
+    state = memoryview(state_buf)[:n]
+    print(f"Saved state: {n} bytes")
 
     # Reset parameter
     if plugin.num_params > 0:
@@ -203,6 +303,9 @@ if __name__ == "__main__":
         example_parameters()
         example_state()
         example_offline_processing()
+        example_offline_processing_signal()
+        example_offline_processing_int16()
+        example_planar_processing()
         example_realtime_playback()
         # example_virtual_midi()  # Uncomment to test virtual MIDI
     except SystemExit:
@@ -42,6 +42,7 @@ import sys
 import numpy as np
 
 import minihost
+from minihost._metrics import peak
 
 DELAY_PATH = os.environ.get(
     "MINIHOST_DELAY",
@@ -99,7 +100,7 @@ def pure_python_pipeline() -> None:
     )
     samples = np.random.uniform(-0.2, 0.2, size=(2, SAMPLE_RATE)).astype(np.float32)
     out = fx(samples, sample_rate=SAMPLE_RATE)
-    peak_dbfs = 20.0 * np.log10(np.max(np.abs(out)) + 1e-12)
+    peak_dbfs = 20.0 * np.log10(peak(out) + 1e-12)
     print(f"Part 2: pure-python pipeline -> shape {out.shape}, peak {peak_dbfs:.1f} dBFS")
 
 
@@ -131,7 +132,7 @@ def augmentation_pipeline() -> None:
         if plugin is not None:
             plugin.close()
 
-    peaks = [float(np.max(np.abs(v))) for v in variants]
+    peaks = [peak(v) for v in variants]
     print(f"Part 3: 3 augmented variants, peaks {[round(p, 4) for p in peaks]}")
 
 
@@ -23,8 +23,8 @@ Options:
 import argparse
 import os
 import sys
-import time
 import signal
+import threading
 
 import minihost
 
@@ -134,8 +134,12 @@ def main():
               file=sys.stderr)
         sys.exit(1)
 
-    if not os.path.exists(plugin_path):
-        print(f"Error: Plugin not found: {plugin_path}", file=sys.stderr)
+    # A single stat() checks the path; unlike os.path.exists() it keeps the
+    # reason (missing vs. permission denied) for the error message.
+    try:
+        os.stat(plugin_path)
+    except OSError as e:
+        print(f"Error: Plugin not found: {plugin_path} ({e.strerror})", file=sys.stderr)
         sys.exit(1)
 
     # Handle --info
@@ -143,6 +147,16 @@ def main():
         show_plugin_info(plugin_path)
         return
 
+    # Validate the MIDI port before the (possibly slow) plugin load
+    midi_input_name = None
+    if args.midi is not None:
+        inputs = minihost.midi_get_input_ports()
+        if not 0 <= args.midi < len(inputs):
+            print(f"Error: MIDI port {args.midi} not found. "
+                  f"Use --list-midi to see available ports.", file=sys.stderr)
+            sys.exit(1)
+        midi_input_name = inputs[args.midi]["name"]
+
     # Load the plugin
     print(f"Loading: {plugin_path}")
     try:
@@ -162,16 +176,11 @@ def main():
     print(f"  Parameters: {plugin.num_params}")
     print(f"  Latency: {plugin.latency_samples} samples")
 
-    # Determine MIDI configuration
+    # MIDI configuration (port validated above, before loading the plugin)
     midi_input_port = -1
     if args.midi is not None:
         midi_input_port = args.midi
-        inputs = minihost.midi_get_input_ports()
-        if midi_input_port >= len(inputs):
-            print(f"Error: MIDI port {midi_input_port} not found. "
-                  f"Use --list-midi to see available ports.", file=sys.stderr)
-            sys.exit(1)
-        print(f"  MIDI Input: [{midi_input_port}] {inputs[midi_input_port]['name']}")
+        print(f"  MIDI Input: [{midi_input_port}] {midi_input_name}")
 
     # Open audio device
     print(f"\nOpening audio device...")
@@ -198,12 +207,12 @@ def main():
         except Exception as e:
             print(f"Warning: Could not create virtual MIDI port: {e}", file=sys.stderr)
 
-    # Setup signal handler for clean shutdown
-    running = True
+    # Setup signal handler for clean shutdown. The main thread blocks on
+    # the event instead of polling, so it sleeps until a signal arrives.
+    stop_event = threading.Event()
 
     def on_signal(sig, frame):
-        nonlocal running
-        running = False
+        stop_event.set()
         print("\nStopping...")
 
     signal.signal(signal.SIGINT, on_signal)
@@ -216,11 +225,11 @@ def main():
     if not args.midi and not args.virtual_midi:
         print("(No MIDI input configured. Use --midi N or --virtual-midi NAME)")
 
-    # Main loop
-    try:
-        while running:
-            time.sleep(0.1)
-    except KeyboardInterrupt:
+    # Wait for Ctrl+C / SIGTERM; on_signal replaces the default SIGINT
+    # handler, so no KeyboardInterrupt is raised. Python signal handlers run
+    # only between bytecodes, and on Windows an untimed wait() never
+    # returns to let them, so it wakes once a second there.
+    while not stop_event.wait(1.0 if os.name == "nt" else None):
         pass
 
     # Cleanup
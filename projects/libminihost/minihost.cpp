@@ -541,6 +541,24 @@ extern "C" int mh_get_info(MH_Plugin* p, MH_Info* out_info)
     return 1;
 }
 
+extern "C" int mh_get_desc(MH_Plugin* p, MH_PluginDesc* out_desc)
+{
+    if (!p || !out_desc || !p->inst) return 0;
+
+    const PluginDescription desc = p->inst->getPluginDescription();
+    std::snprintf(out_desc->name, sizeof(out_desc->name), "%s", desc.name.toRawUTF8());
+    std::snprintf(out_desc->vendor, sizeof(out_desc->vendor), "%s", desc.manufacturerName.toRawUTF8());
+    std::snprintf(out_desc->version, sizeof(out_desc->version), "%s", desc.version.toRawUTF8());
+    std::snprintf(out_desc->format, sizeof(out_desc->format), "%s", desc.pluginFormatName.toRawUTF8());
+    std::snprintf(out_desc->unique_id, sizeof(out_desc->unique_id), "%08X", desc.uniqueId);
+    std::snprintf(out_desc->path, sizeof(out_desc->path), "%s", p->path.c_str());
+    out_desc->accepts_midi  = p->inst->acceptsMidi() ? 1 : 0;
+    out_desc->produces_midi = p->inst->producesMidi() ? 1 : 0;
+    out_desc->num_inputs    = p->inCh;
+    out_desc->num_outputs   = p->outCh;
+    return 1;
+}
+
 extern "C" int mh_process_midi_io(MH_Plugin* p,
                                   const float* const* inputs,
                                   float* const* outputs,
@@ -1774,6 +1792,33 @@ extern "C" double mh_get_sample_rate(MH_Plugin* p)
     return p->sampleRate;
 }
 
+// Bundle extensions the directory scan collects (searched recursively, in
+// this order). The single source for both scan entry points and for
+// mh_scan_directory_extension.
+static const char* const kScanDirectoryExtensions[] = {
+    ".vst3",
+   #if JUCE_MAC
+    ".component",   // AudioUnit - macOS only
+   #endif
+   #if JUCE_PLUGINHOST_LV2
+    ".lv2",
+   #endif
+};
+
+static void findScannablePlugins(const File& dir, Array<File>& out)
+{
+    for (const char* ext : kScanDirectoryExtensions)
+        dir.findChildFiles(out, File::findDirectories, true, String("*") + ext);
+}
+
+extern "C" const char* mh_scan_directory_extension(int index)
+{
+    constexpr int n = (int) (sizeof(kScanDirectoryExtensions) / sizeof(kScanDirectoryExtensions[0]));
+    if (index < 0 || index >= n)
+        return nullptr;
+    return kScanDirectoryExtensions[index];
+}
+
 extern "C" int mh_scan_directory(const char* directory_path,
                                  MH_ScanCallback callback,
                                  void* user_data)
@@ -1787,21 +1832,8 @@ extern "C" int mh_scan_directory(const char* directory_path,
 
     int count = 0;
 
-    // Find all .vst3 and .component files recursively
     Array<File> pluginFiles;
-
-    // VST3 plugins (.vst3 bundles)
-    dir.findChildFiles(pluginFiles, File::findDirectories, true, "*.vst3");
-
-    // AudioUnit plugins (.component bundles) - macOS only
-   #if JUCE_MAC
-    dir.findChildFiles(pluginFiles, File::findDirectories, true, "*.component");
-   #endif
-
-    // LV2 plugins (.lv2 bundles)
-   #if JUCE_PLUGINHOST_LV2
-    dir.findChildFiles(pluginFiles, File::findDirectories, true, "*.lv2");
-   #endif
+    findScannablePlugins(dir, pluginFiles);
 
     // Create one format manager for the entire scan instead of one per plugin.
     AudioPluginFormatManager fm;
@@ -2051,14 +2083,7 @@ static int scanDirectoryWithFm(AudioPluginFormatManager& fm,
 
     int count = 0;
     Array<File> pluginFiles;
-
-    dir.findChildFiles(pluginFiles, File::findDirectories, true, "*.vst3");
-   #if JUCE_MAC
-    dir.findChildFiles(pluginFiles, File::findDirectories, true, "*.component");
-   #endif
-   #if JUCE_PLUGINHOST_LV2
-    dir.findChildFiles(pluginFiles, File::findDirectories, true, "*.lv2");
-   #endif
+    findScannablePlugins(dir, pluginFiles);
 
     for (const auto& pluginFile : pluginFiles)
     {
@@ -14,7 +14,7 @@
 //        mh_set_param, mh_get_param, mh_get_param_info,
 //        mh_morph_capture, mh_morph_apply, mh_morph_lerp,
 //        mh_morph_lerp_per_param, mh_morph,
-//        mh_get_num_params, mh_get_info, mh_get_path,
+//        mh_get_num_params, mh_get_info, mh_get_desc, mh_get_path,
 //        mh_get_latency_samples, mh_get_tail_seconds,
 //        mh_get_bypass, mh_set_bypass,
 //        mh_set_transport, mh_param_to_text, mh_param_from_text,
@@ -27,7 +27,7 @@
 //        mh_begin_param_gesture, mh_end_param_gesture,
 //        mh_set_change_callback / mh_set_param_value_callback /
 //        mh_set_param_gesture_callback,
-//        mh_api_version, mh_api_version_string
+//        mh_api_version, mh_api_version_string, mh_scan_directory_extension
 //
 //   3. NOT SAFE TO OVERLAP mh_process (calls releaseResources/prepareToPlay
 //      or otherwise reconfigures the plugin's audio pipeline):
@@ -255,6 +255,13 @@ void* mh_get_juce_processor(MH_Plugin* p);
 
 int mh_get_info(MH_Plugin* p, MH_Info* out_info);
 
+// Fills out_desc for an already-open plugin: the same fields mh_probe
+// reports, read from the instance instead of re-scanning the file. path is
+// the one passed to mh_open; accepts_midi / produces_midi are authoritative
+// (as in mh_get_info); num_inputs / num_outputs are the active main-bus
+// channel counts. Returns 1 on success, 0 on failure.
+int mh_get_desc(MH_Plugin* p, MH_PluginDesc* out_desc);
+
 // Non-interleaved buffers: inputs[ch][nframes], outputs[ch][nframes]
 // If in/out pointers are NULL, the host will supply silence / discard output.
 int mh_process(MH_Plugin* p,
@@ -538,13 +545,20 @@ double mh_get_sample_rate(MH_Plugin* p);
 typedef void (*MH_ScanCallback)(const MH_PluginDesc* desc, void* user_data);
 
 // Scan a directory for plugins
-// Recursively searches for .vst3 and .component (AU) files
+// Recursively searches for the bundle types listed by
+// mh_scan_directory_extension (.vst3, .component on macOS, .lv2 when built
+// with LV2 hosting)
 // Calls callback for each valid plugin found (invalid plugins are silently skipped)
 // Returns number of plugins found, or -1 on error (e.g., directory doesn't exist)
 int mh_scan_directory(const char* directory_path,
                       MH_ScanCallback callback,
                       void* user_data);
 
+// Extensions mh_scan_directory collects, including the leading dot (e.g.
+// ".vst3"). Returns the index-th entry, or NULL past the end; the strings
+// are static and must not be freed.
+const char* mh_scan_directory_extension(int index);
+
 // Double precision processing
 // Process audio using 64-bit floating point samples
 // Returns 1 on success, 0 on failure
@@ -81,6 +81,29 @@ int mh_midi_ringbuffer_push(MH_MidiRingBuffer* rb, const MH_MidiEvent* event) {
     return 1;
 }
 
+int mh_midi_ringbuffer_push_batch(MH_MidiRingBuffer* rb, const MH_MidiEvent* events, int count) {
+    if (!rb || !events || count <= 0) return 0;
+
+    int write = rb->write_pos.load(std::memory_order_relaxed);
+    int read = rb->read_pos.load(std::memory_order_acquire);
+
+    // One slot stays empty to distinguish full from empty
+    int free_slots = (read - write - 1) & rb->mask;
+    if (count > free_slots) {
+        return 0;  // Not enough room for the whole batch
+    }
+
+    for (int i = 0; i < count; i++) {
+        rb->buffer[write] = events[i];
+        write = (write + 1) & rb->mask;
+    }
+
+    // Publish all writes at once
+    rb->write_pos.store(write, std::memory_order_release);
+
+    return count;
+}
+
 int mh_midi_ringbuffer_pop(MH_MidiRingBuffer* rb, MH_MidiEvent* event) {
     if (!rb || !event) return 0;
 
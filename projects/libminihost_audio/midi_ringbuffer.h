@@ -27,6 +27,11 @@ void mh_midi_ringbuffer_free(MH_MidiRingBuffer* rb);
 // Returns 1 on success, 0 if buffer is full
 int mh_midi_ringbuffer_push(MH_MidiRingBuffer* rb, const MH_MidiEvent* event);
 
+// Push `count` events as one unit (producer thread). Either every event is
+// queued, with a single publish of the write position, or none are.
+// Returns count on success, 0 if there is not enough free space
+int mh_midi_ringbuffer_push_batch(MH_MidiRingBuffer* rb, const MH_MidiEvent* events, int count);
+
 // Pop a single event from the ring buffer (consumer/audio thread)
 // Returns 1 on success, 0 if buffer is empty
 int mh_midi_ringbuffer_pop(MH_MidiRingBuffer* rb, MH_MidiEvent* event);
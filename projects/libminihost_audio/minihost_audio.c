@@ -859,6 +859,35 @@ int mh_audio_send_midi(MH_AudioDevice* dev, unsigned char status, unsigned char
     return mh_midi_ringbuffer_push(dev->midi_in_buffer, &event);
 }
 
+int mh_audio_send_midi_batch(MH_AudioDevice* dev, const unsigned char* data, int count) {
+    if (!dev || !dev->midi_in_buffer || !data || count <= 0) return 0;
+
+    // The ring holds at most 256 events, so a larger batch can never fit.
+    MH_MidiEvent events[256];
+    if (count > 256) return 0;
+
+    for (int i = 0; i < count; i++) {
+        events[i].sample_offset = 0;  // Processed at start of next audio buffer
+        events[i].status = data[i * 3];
+        events[i].data1 = data[i * 3 + 1];
+        events[i].data2 = data[i * 3 + 2];
+    }
+
+    return mh_midi_ringbuffer_push_batch(dev->midi_in_buffer, events, count) == count;
+}
+
+// CC 123 (All Notes Off), value 0, on channels 0..15
+static const unsigned char k_all_notes_off[16 * 3] = {
+    0xB0, 123, 0,  0xB1, 123, 0,  0xB2, 123, 0,  0xB3, 123, 0,
+    0xB4, 123, 0,  0xB5, 123, 0,  0xB6, 123, 0,  0xB7, 123, 0,
+    0xB8, 123, 0,  0xB9, 123, 0,  0xBA, 123, 0,  0xBB, 123, 0,
+    0xBC, 123, 0,  0xBD, 123, 0,  0xBE, 123, 0,  0xBF, 123, 0,
+};
+
+int mh_audio_all_notes_off(MH_AudioDevice* dev) {
+    return mh_audio_send_midi_batch(dev, k_all_notes_off, 16);
+}
+
 // Internal callback that reads from the audio ring buffer
 static void audio_ringbuffer_input_callback(float* const* buffer, int nframes, void* user_data) {
     MH_AudioDevice* dev = (MH_AudioDevice*)user_data;
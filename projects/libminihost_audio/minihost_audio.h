@@ -155,6 +155,20 @@ int mh_audio_is_midi_output_virtual(MH_AudioDevice* dev);
 // Returns 1 on success, 0 on failure (e.g., queue full)
 int mh_audio_send_midi(MH_AudioDevice* dev, unsigned char status, unsigned char data1, unsigned char data2);
 
+// Send several MIDI events to the plugin in one call (thread-safe, can be
+// called while playing). data holds `count` 3-byte messages laid out as
+// [status, data1, data2, status, data1, data2, ...]. The batch is queued
+// as a unit: all events are delivered at the start of the same audio
+// buffer, or none are queued if the queue lacks room for all of them.
+// Returns 1 on success, 0 on failure (e.g., queue full)
+int mh_audio_send_midi_batch(MH_AudioDevice* dev, const unsigned char* data, int count);
+
+// Queue All Notes Off (CC 123) on all 16 MIDI channels as a single batch
+// (see mh_audio_send_midi_batch). Use to silence held notes, e.g. on stop
+// or as a panic button.
+// Returns 1 on success, 0 on failure (e.g., queue full)
+int mh_audio_all_notes_off(MH_AudioDevice* dev);
+
 // Enable ring-buffer-based audio input for effect processing.
 // Creates an internal ring buffer and installs an input callback that reads from it.
 // Call mh_audio_write_input() from any thread to push audio data.
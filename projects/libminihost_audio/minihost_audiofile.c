@@ -55,10 +55,87 @@ void mh_audio_data_free(MH_AudioData* data) {
     free(data);
 }
 
-static int write_wav(const char* path, const float* data,
-                     unsigned int channels, unsigned int frames,
-                     unsigned int sample_rate, int bit_depth,
-                     char* err, size_t err_size) {
+// Frames converted per chunk when writing 16/24-bit WAV.
+#define WAV_CHUNK_FRAMES 4096
+
+struct MH_AudioReader {
+    ma_decoder decoder;
+};
+
+MH_AudioReader* mh_audio_reader_open(const char* path, char* err, size_t err_size) {
+    if (!path) {
+        if (err && err_size > 0) snprintf(err, err_size, "Path is NULL");
+        return NULL;
+    }
+
+    MH_AudioReader* reader = (MH_AudioReader*)malloc(sizeof(MH_AudioReader));
+    if (!reader) {
+        if (err && err_size > 0) snprintf(err, err_size, "Out of memory");
+        return NULL;
+    }
+
+    // Same decoder configuration as mh_audio_read: interleaved f32 at the
+    // file's native channel count and sample rate.
+    ma_decoder_config config = ma_decoder_config_init(ma_format_f32, 0, 0);
+    ma_result result = ma_decoder_init_file(path, &config, &reader->decoder);
+    if (result != MA_SUCCESS) {
+        free(reader);
+        if (err && err_size > 0) {
+            snprintf(err, err_size, "Failed to decode audio file: %s (error %d)", path, result);
+        }
+        return NULL;
+    }
+    return reader;
+}
+
+unsigned int mh_audio_reader_channels(const MH_AudioReader* reader) {
+    return reader ? reader->decoder.outputChannels : 0;
+}
+
+unsigned int mh_audio_reader_sample_rate(const MH_AudioReader* reader) {
+    return reader ? reader->decoder.outputSampleRate : 0;
+}
+
+unsigned long long mh_audio_reader_length(MH_AudioReader* reader) {
+    if (!reader) return 0;
+    ma_uint64 length = 0;
+    if (ma_decoder_get_length_in_pcm_frames(&reader->decoder, &length) != MA_SUCCESS) {
+        return 0;
+    }
+    return (unsigned long long)length;
+}
+
+unsigned int mh_audio_reader_read(MH_AudioReader* reader, float* out,
+                                  unsigned int frames) {
+    if (!reader || !out || frames == 0) return 0;
+    // Frames decoded before an error are still returned; the next call then
+    // yields 0, ending the stream where mh_audio_read would stop.
+    ma_uint64 read = 0;
+    ma_decoder_read_pcm_frames(&reader->decoder, out, frames, &read);
+    return (unsigned int)read;
+}
+
+void mh_audio_reader_close(MH_AudioReader* reader) {
+    if (!reader) return;
+    ma_decoder_uninit(&reader->decoder);
+    free(reader);
+}
+
+struct MH_AudioWriter {
+    ma_encoder encoder;
+    ma_format format;
+    unsigned int channels;
+    void* converted;    // one WAV_CHUNK_FRAMES chunk of s16/s24 scratch
+};
+
+MH_AudioWriter* mh_audio_writer_open(const char* path, unsigned int channels,
+                                     unsigned int sample_rate, int bit_depth,
+                                     char* err, size_t err_size) {
+    if (!path) {
+        if (err && err_size > 0) snprintf(err, err_size, "Path is NULL");
+        return NULL;
+    }
+
     ma_format format;
     switch (bit_depth) {
         case 16: format = ma_format_s16; break;
@@ -67,50 +144,80 @@ static int write_wav(const char* path, const float* data,
         default:
             if (err && err_size > 0)
                 snprintf(err, err_size, "Unsupported bit depth: %d (use 16, 24, or 32)", bit_depth);
-            return 0;
+            return NULL;
+    }
+
+    MH_AudioWriter* writer = (MH_AudioWriter*)malloc(sizeof(MH_AudioWriter));
+    if (!writer) {
+        if (err && err_size > 0) snprintf(err, err_size, "Out of memory");
+        return NULL;
+    }
+    writer->format = format;
+    writer->channels = channels;
+    writer->converted = NULL;
+
+    // Integer output is converted and written in fixed-size chunks, so it
+    // needs one chunk of scratch memory instead of a second full-length
+    // copy of the audio. The dither state advances identically either way.
+    if (format != ma_format_f32) {
+        size_t chunk_bytes = (size_t)WAV_CHUNK_FRAMES * channels
+                             * ma_get_bytes_per_sample(format);
+        writer->converted = malloc(chunk_bytes);
+        if (!writer->converted) {
+            free(writer);
+            if (err && err_size > 0) snprintf(err, err_size, "Out of memory");
+            return NULL;
+        }
     }
 
     ma_encoder_config config = ma_encoder_config_init(
         ma_encoding_format_wav, format, channels, sample_rate);
 
-    ma_encoder encoder;
-    ma_result result = ma_encoder_init_file(path, &config, &encoder);
+    ma_result result = ma_encoder_init_file(path, &config, &writer->encoder);
     if (result != MA_SUCCESS) {
+        free(writer->converted);
+        free(writer);
         if (err && err_size > 0) {
             snprintf(err, err_size, "Failed to open file for writing: %s (error %d)", path, result);
         }
-        return 0;
+        return NULL;
     }
 
-    ma_uint64 total_samples = (ma_uint64)frames * channels;
+    return writer;
+}
+
+int mh_audio_writer_write(MH_AudioWriter* writer, const float* data,
+                          unsigned int frames, char* err, size_t err_size) {
+    if (!writer || (!data && frames > 0)) {
+        if (err && err_size > 0) snprintf(err, err_size, "Invalid arguments");
+        return 0;
+    }
 
-    if (format == ma_format_f32) {
+    ma_result result = MA_SUCCESS;
+    if (writer->format == ma_format_f32) {
         ma_uint64 written = 0;
-        result = ma_encoder_write_pcm_frames(&encoder, data, frames, &written);
+        result = ma_encoder_write_pcm_frames(&writer->encoder, data, frames, &written);
     } else {
-        size_t bytes_per_sample = ma_get_bytes_per_sample(format);
-        size_t buffer_size = total_samples * bytes_per_sample;
-
-        void* converted = malloc(buffer_size);
-        if (!converted) {
-            ma_encoder_uninit(&encoder);
-            if (err && err_size > 0) snprintf(err, err_size, "Out of memory");
-            return 0;
-        }
+        unsigned int channels = writer->channels;
+        ma_uint64 done = 0;
+        while (done < frames && result == MA_SUCCESS) {
+            ma_uint64 n = frames - done;
+            if (n > WAV_CHUNK_FRAMES) n = WAV_CHUNK_FRAMES;
+            const float* src = data + done * channels;
+            ma_uint64 count = n * channels;
+
+            if (writer->format == ma_format_s16) {
+                ma_pcm_f32_to_s16(writer->converted, src, count, ma_dither_mode_triangle);
+            } else {
+                ma_pcm_f32_to_s24(writer->converted, src, count, ma_dither_mode_triangle);
+            }
 
-        if (format == ma_format_s16) {
-            ma_pcm_f32_to_s16(converted, data, total_samples, ma_dither_mode_triangle);
-        } else if (format == ma_format_s24) {
-            ma_pcm_f32_to_s24(converted, data, total_samples, ma_dither_mode_triangle);
+            ma_uint64 written = 0;
+            result = ma_encoder_write_pcm_frames(&writer->encoder, writer->converted, n, &written);
+            done += n;
         }
-
-        ma_uint64 written = 0;
-        result = ma_encoder_write_pcm_frames(&encoder, converted, frames, &written);
-        free(converted);
     }
 
-    ma_encoder_uninit(&encoder);
-
     if (result != MA_SUCCESS) {
         if (err && err_size > 0) {
             snprintf(err, err_size, "Failed to write audio data (error %d)", result);
@@ -121,6 +228,25 @@ static int write_wav(const char* path, const float* data,
     return 1;
 }
 
+void mh_audio_writer_close(MH_AudioWriter* writer) {
+    if (!writer) return;
+    ma_encoder_uninit(&writer->encoder);
+    free(writer->converted);
+    free(writer);
+}
+
+static int write_wav(const char* path, const float* data,
+                     unsigned int channels, unsigned int frames,
+                     unsigned int sample_rate, int bit_depth,
+                     char* err, size_t err_size) {
+    MH_AudioWriter* writer = mh_audio_writer_open(path, channels, sample_rate,
+                                                  bit_depth, err, err_size);
+    if (!writer) return 0;
+    int ok = mh_audio_writer_write(writer, data, frames, err, err_size);
+    mh_audio_writer_close(writer);
+    return ok;
+}
+
 #define FLAC_BLOCKSIZE 4096
 
 static int write_flac(const char* path, const float* data,
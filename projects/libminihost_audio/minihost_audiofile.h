@@ -27,6 +27,32 @@ MH_AudioData* mh_audio_read(const char* path, char* err, size_t err_size);
 // Free decoded audio data.
 void mh_audio_data_free(MH_AudioData* data);
 
+// Incremental reader: decode a file block by block instead of all at once,
+// so a caller that converts the samples (e.g. de-interleaves them into its
+// own planar buffer) never holds the whole file twice.
+typedef struct MH_AudioReader MH_AudioReader;
+
+// Open an audio file for reading (same formats as mh_audio_read).
+// Returns NULL on error (writes message to err buffer).
+// Caller must close with mh_audio_reader_close().
+MH_AudioReader* mh_audio_reader_open(const char* path, char* err, size_t err_size);
+
+unsigned int mh_audio_reader_channels(const MH_AudioReader* reader);
+unsigned int mh_audio_reader_sample_rate(const MH_AudioReader* reader);
+
+// Total length in frames as reported by the decoder, or 0 if unknown.
+// Treat it as a sizing hint: the stream may end early.
+unsigned long long mh_audio_reader_length(MH_AudioReader* reader);
+
+// Decode up to `frames` frames of interleaved float32 into `out`
+// (frames * channels floats). Returns the number of frames decoded;
+// 0 means end of stream (a decode error also ends the stream, as in
+// mh_audio_read).
+unsigned int mh_audio_reader_read(MH_AudioReader* reader, float* out,
+                                  unsigned int frames);
+
+void mh_audio_reader_close(MH_AudioReader* reader);
+
 // Write interleaved float32 data to an audio file (WAV or FLAC).
 // bit_depth: 16, 24, or 32 (32 = IEEE float).
 // Returns 1 on success, 0 on error.
@@ -35,6 +61,27 @@ int mh_audio_write(const char* path, const float* data,
                    unsigned int sample_rate, int bit_depth,
                    char* err, size_t err_size);
 
+// Incremental WAV writer: append interleaved float32 blocks as they are
+// produced, so a caller rendering a long file never holds all of it in
+// memory. Same sample formats and dithering as mh_audio_write (which is
+// built on it for WAV output); the path's extension is not checked.
+typedef struct MH_AudioWriter MH_AudioWriter;
+
+// Open a WAV file for writing. bit_depth: 16, 24, or 32 (32 = IEEE float).
+// Returns NULL on error (writes message to err buffer).
+// Caller must close with mh_audio_writer_close().
+MH_AudioWriter* mh_audio_writer_open(const char* path, unsigned int channels,
+                                     unsigned int sample_rate, int bit_depth,
+                                     char* err, size_t err_size);
+
+// Append `frames` frames of interleaved float32 (frames * channels floats).
+// Returns 1 on success, 0 on error.
+int mh_audio_writer_write(MH_AudioWriter* writer, const float* data,
+                          unsigned int frames, char* err, size_t err_size);
+
+// Finalize the WAV header and close the file.
+void mh_audio_writer_close(MH_AudioWriter* writer);
+
 // Broadcast Wave Format (BWF) metadata written into a WAV `bext` chunk
 // (EBU Tech 3285). All string fields are optional (NULL is treated as empty)
 // and are truncated to the field's fixed size. Dates/times follow the BWF
@@ -9,6 +9,11 @@
 #include <vector>
 #include <mutex>
 #include <memory>
+#include <atomic>
+
+// Bumped by the observer's hot-plug callbacks whenever a port appears or
+// disappears, so callers can cache an enumeration until it changes.
+static std::atomic<unsigned long long> g_port_generation{0};
 
 // Global observer for port enumeration (lazy initialized)
 static std::unique_ptr<libremidi::observer> g_observer;
@@ -17,7 +22,19 @@ static std::mutex g_observer_mutex;
 static libremidi::observer& get_observer() {
     std::lock_guard<std::mutex> lock(g_observer_mutex);
     if (!g_observer) {
-        g_observer = std::make_unique<libremidi::observer>();
+        libremidi::observer_configuration conf;
+        auto bump_in = [](const libremidi::input_port&) {
+            g_port_generation.fetch_add(1, std::memory_order_relaxed);
+        };
+        auto bump_out = [](const libremidi::output_port&) {
+            g_port_generation.fetch_add(1, std::memory_order_relaxed);
+        };
+        conf.input_added = bump_in;
+        conf.input_removed = bump_in;
+        conf.output_added = bump_out;
+        conf.output_removed = bump_out;
+        conf.notify_in_constructor = false;
+        g_observer = std::make_unique<libremidi::observer>(conf);
     }
     return *g_observer;
 }
@@ -80,6 +97,14 @@ int mh_midi_enumerate_outputs(MH_MidiPortCallback callback, void* user_data) {
     }
 }
 
+unsigned long long mh_midi_port_generation(void) {
+    try {
+        get_observer();
+    } catch (...) {
+    }
+    return g_port_generation.load(std::memory_order_relaxed);
+}
+
 int mh_midi_get_num_inputs(void) {
     try {
         auto& obs = get_observer();
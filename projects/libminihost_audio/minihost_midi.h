@@ -30,6 +30,14 @@ int mh_midi_enumerate_inputs(MH_MidiPortCallback callback, void* user_data);
 // Returns number of ports found, or -1 on error
 int mh_midi_enumerate_outputs(MH_MidiPortCallback callback, void* user_data);
 
+// Port-list generation counter. Incremented whenever a MIDI input or output
+// port is added or removed (as reported by the backend's hot-plug
+// notifications). Two equal values mean a cached enumeration is still
+// current -- provided the backend delivers those notifications, which not
+// all do (CoreMIDI, for one, only through the run loop of the thread that
+// created the observer). Cheap: an atomic load, no device walk.
+unsigned long long mh_midi_port_generation(void);
+
 // Get number of MIDI input ports
 int mh_midi_get_num_inputs(void);
 
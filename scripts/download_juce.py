@@ -11,7 +11,6 @@ import sys
 import tarfile
 import tempfile
 import urllib.request
-import zipfile
 from pathlib import Path
 
 JUCE_VERSION = os.environ.get("JUCE_VERSION", "8.0.12")
@@ -36,27 +35,23 @@ PROJECT_ROOT = SCRIPT_DIR.parent
 JUCE_DIR = Path(os.environ.get("JUCE_DIR", PROJECT_ROOT / "thirdparty" / "JUCE"))
 
 
-def download_file(url: str, dest: Path) -> None:
-    """Download a file from URL to destination."""
-    print(f"Downloading from {url}...")
-    urllib.request.urlretrieve(url, dest)
+def download_and_extract(url: str, dest_dir: Path) -> None:
+    """Stream a tar.gz archive from URL straight into dest_dir.
 
-
-def extract_archive(archive_path: Path, dest_dir: Path) -> None:
-    """Extract a tar.gz or zip archive."""
-    print("Extracting...")
-    if archive_path.suffix == ".zip" or archive_path.name.endswith(".zip"):
-        with zipfile.ZipFile(archive_path, "r") as zf:
-            zf.extractall(dest_dir)
-    else:
-        # Assume tar.gz
-        with tarfile.open(archive_path, "r:gz") as tf:
-            # Use filter="data" for Python 3.12+ to avoid deprecation warning
-            # and ensure safe extraction (no absolute paths, no parent traversal)
-            if hasattr(tarfile, "data_filter"):
-                tf.extractall(dest_dir, filter="data")
-            else:
-                tf.extractall(dest_dir)
+    The response is read in tarfile's streaming mode ("r|gz"), so members
+    are unpacked as the bytes arrive instead of after a full download to a
+    temporary archive file.
+    """
+    print(f"Downloading and extracting from {url}...")
+    with urllib.request.urlopen(url) as resp, tarfile.open(
+        fileobj=resp, mode="r|gz"
+    ) as tf:
+        # Use filter="data" for Python 3.12+ to avoid deprecation warning
+        # and ensure safe extraction (no absolute paths, no parent traversal)
+        if hasattr(tarfile, "data_filter"):
+            tf.extractall(dest_dir, filter="data")
+        else:
+            tf.extractall(dest_dir)
 
 
 def main() -> int:
@@ -81,36 +76,34 @@ def main() -> int:
             f"https://github.com/juce-framework/JUCE/archive/{archive_ref}.tar.gz"
         )
 
-    # Create temp directory for download
-    with tempfile.TemporaryDirectory() as tmpdir:
+    # Ensure parent directory exists
+    JUCE_DIR.parent.mkdir(parents=True, exist_ok=True)
+
+    # Extract into a temp directory next to the destination, so the final
+    # move is a same-filesystem rename rather than a copy of the whole tree.
+    with tempfile.TemporaryDirectory(dir=JUCE_DIR.parent, prefix=".juce-") as tmpdir:
         tmpdir_path = Path(tmpdir)
 
         # Download archive (use tar.gz which works on all platforms with Python)
-        archive_path = tmpdir_path / "juce.tar.gz"
-
         try:
-            download_file(archive_url, archive_path)
+            download_and_extract(archive_url, tmpdir_path)
         except Exception as e:
             print(f"Error downloading JUCE: {e}", file=sys.stderr)
             return 1
 
-        try:
-            extract_archive(archive_path, tmpdir_path)
-        except Exception as e:
-            print(f"Error extracting JUCE: {e}", file=sys.stderr)
-            return 1
-
         # Move to destination
         extracted_dir = tmpdir_path / extracted_name
         if not extracted_dir.exists():
             print(f"Error: Expected directory {extracted_dir} not found", file=sys.stderr)
             return 1
 
-        # Ensure parent directory exists
-        JUCE_DIR.parent.mkdir(parents=True, exist_ok=True)
-
-        # Move to final location
-        shutil.move(str(extracted_dir), str(JUCE_DIR))
+        # Move to final location. os.rename is a metadata-only operation
+        # here; shutil.move (which copies) is only a fallback, e.g. if
+        # JUCE_DIR is itself a mount point.
+        try:
+            os.rename(extracted_dir, JUCE_DIR)
+        except OSError:
+            shutil.move(str(extracted_dir), str(JUCE_DIR))
 
     print(f"JUCE {JUCE_VERSION} installed to {JUCE_DIR}")
     return 0
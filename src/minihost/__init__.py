@@ -38,10 +38,8 @@ from minihost._core import (
     AudioDevice,
     MidiFile,
     MidiIn,
-    probe,
+    AudioWriter,
     scan_directory,
-    midi_get_input_ports,
-    midi_get_output_ports,
     audio_get_playback_devices,
     audio_get_capture_devices,
     api_version,
@@ -60,21 +58,6 @@ from minihost._core import (
     MIDI_OUT_CAPACITY,
 )
 
-from minihost.render import (
-    render_midi,
-    render_midi_stream,
-    render_midi_to_file,
-    midi_file_to_events,
-    MidiRenderer,
-)
-
-from minihost.audio_io import (
-    read_audio,
-    write_audio,
-    get_audio_info,
-    resample,
-)
-
 
 # Wrap as_ndarray() to convert nanobind's "ModuleNotFoundError: No module
 # named 'numpy'" TypeError into a clear ImportError pointing at the
@@ -101,64 +84,284 @@ _make_as_ndarray_with_friendly_error(AudioBuffer)
 _make_as_ndarray_with_friendly_error(AudioBufferD)
 
 
-from minihost.control import MidiMapper
+import functools as _functools
+import os as _os
+import stat as _stat
 
-from minihost.process import (
-    process_audio,
-    process_audio_stream,
-    process_audio_to_file,
-)
+from minihost._core import probe as _probe_native
 
-from minihost.chain import load_chain
-
-from minihost.compose import (
-    Compose,
-    Gain,
-    Normalize,
-    Trim,
-    Fade,
-    Maybe,
-    OneOf,
-    SomeOf,
-    RandomParam,
-    AddGaussianNoise,
-)
 
-from minihost.project import (
-    LoadedProject,
-    ProjectError,
-    load_project,
-    save_project,
-    render_project,
-)
+# probe() opens the plugin bundle and reads its metadata on every call. Memoize
+# it per (absolute path, mtime, size) so UIs, scanners and test suites that
+# probe the same plugins repeatedly pay for the bundle read once; a
+# reinstalled plugin changes its stat key and is probed again. Paths that
+# cannot be stat'ed go straight to the native probe so its error is raised.
+@_functools.lru_cache(maxsize=256)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> dict:
+    return _probe_native(path)
 
-from minihost import plugincache
-from minihost.plugincache import scan as scan_plugins
-from minihost.plugincache import query as query_plugins
 
-from minihost.automation import (
-    find_param_by_name,
-    parse_param_arg,
-    parse_automation_file,
-)
+def _probe_stat_key(path: str) -> tuple[int, int]:
+    """(mtime_ns, size) identifying the plugin's current contents.
 
-from minihost import morph
-from minihost.morph import (
-    capture as capture_params,
-    apply as apply_params,
-    lerp as lerp_params,
-    morph as morph_params,
-)
+    A bundle directory's own stat does not change when the binary inside
+    it is replaced, so for a directory this is the newest mtime and total
+    size of the files at the top of the bundle, directly in ``Contents``
+    and in its per-architecture folders (``MacOS``, ``x86_64-linux``, ...).
+    ``Resources`` is skipped; only a handful of entries are stat'ed.
+    """
+    st = _os.stat(path)
+    if not _stat.S_ISDIR(st.st_mode):
+        return st.st_mtime_ns, st.st_size
+    mtime_ns, size = st.st_mtime_ns, 0
+    contents = _os.path.join(path, "Contents")
+    dirs = [path, contents]
+    try:
+        with _os.scandir(contents) as it:
+            dirs += [e.path for e in it if e.is_dir() and e.name != "Resources"]
+    except OSError:
+        pass
+    for d in dirs:
+        try:
+            with _os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_file():
+                        est = entry.stat()
+                        mtime_ns = max(mtime_ns, est.st_mtime_ns)
+                        size += est.st_size
+        except OSError:
+            continue
+    return mtime_ns, size
 
-from minihost._async import open_async
 
-from minihost.vstpreset import (
-    VstPreset,
-    read_vstpreset,
-    load_vstpreset,
-    write_vstpreset,
-    save_vstpreset,
-)
+def probe(path: str) -> dict:
+    """Get plugin metadata without full instantiation.
+
+    Results are cached by (absolute path, mtime, size); a modified plugin
+    is re-probed. For a bundle the stat key comes from the binaries inside
+    it, not the bundle directory. Call ``minihost.probe.cache_clear()`` to
+    drop the cache. Raises RuntimeError if the plugin cannot be probed.
+    """
+    path = _os.fspath(path)
+    try:
+        mtime_ns, size = _probe_stat_key(path)
+    except (OSError, ValueError):
+        return _probe_native(path)
+    key = _os.path.abspath(path)
+    # Copy so callers can't mutate the cached entry.
+    return dict(_probe_cached(key, mtime_ns, size))
+
+
+probe.cache_clear = _probe_cached.cache_clear  # type: ignore[attr-defined]
+
+
+from minihost._core import midi_get_input_ports as _midi_get_input_ports_native
+from minihost._core import midi_get_output_ports as _midi_get_output_ports_native
+from minihost._core import midi_port_generation as _midi_port_generation
+
+# Enumerating MIDI ports walks the OS device list (CoreMIDI / ALSA / WinMM)
+# on every call. Callers that poll can opt in to reusing the last
+# enumeration per direction, tagged with the native port generation, which
+# the backend's hot-plug notifications bump when a port appears or
+# disappears. Not every backend delivers those notifications, so by default
+# the ports are enumerated afresh.
+_midi_port_cache: dict = {}
+
+
+def _cached_midi_ports(direction: str, enumerate_native, cached: bool) -> list:
+    generation = _midi_port_generation()
+    entry = _midi_port_cache.get(direction)
+    if not cached or entry is None or entry[0] != generation:
+        entry = (generation, enumerate_native())
+        _midi_port_cache[direction] = entry
+    # Copy so callers can't mutate the cached entries.
+    return [dict(port) for port in entry[1]]
+
+
+def midi_get_input_ports(cached: bool = False) -> list:
+    """Get list of available MIDI input ports (dicts with 'name', 'index').
+
+    With ``cached=True`` the previous enumeration is reused until the MIDI
+    backend reports a port being added or removed. Only use it where the
+    backend delivers hot-plug notifications; otherwise the list can go
+    stale.
+    """
+    return _cached_midi_ports("input", _midi_get_input_ports_native, cached)
+
+
+def midi_get_output_ports(cached: bool = False) -> list:
+    """Get list of available MIDI output ports (dicts with 'name', 'index').
+
+    ``cached`` works as for ``midi_get_input_ports``.
+    """
+    return _cached_midi_ports("output", _midi_get_output_ports_native, cached)
+
+
+# The pure-Python layers are imported on first use (PEP 562), not here: the
+# CLI, or a script that only hosts a plugin, would otherwise pay for every
+# one of them -- asyncio for open_async alone costs more than the rest
+# together. Public name -> (submodule, attribute); attribute None means the
+# submodule itself.
+_LAZY_ATTRS = {
+    # MIDI rendering
+    "render_midi": ("minihost.render", "render_midi"),
+    "render_midi_stream": ("minihost.render", "render_midi_stream"),
+    "render_midi_to_file": ("minihost.render", "render_midi_to_file"),
+    "midi_file_to_events": ("minihost.render", "midi_file_to_events"),
+    "midi_duration": ("minihost.render", "midi_duration"),
+    "MidiRenderer": ("minihost.render", "MidiRenderer"),
+    # Audio I/O
+    "read_audio": ("minihost.audio_io", "read_audio"),
+    "write_audio": ("minihost.audio_io", "write_audio"),
+    "open_audio_writer": ("minihost.audio_io", "open_audio_writer"),
+    "get_audio_info": ("minihost.audio_io", "get_audio_info"),
+    "resample": ("minihost.audio_io", "resample"),
+    # Control surface mapping
+    "MidiMapper": ("minihost.control", "MidiMapper"),
+    # Pre-built MIDI event / parameter change arrays
+    "make_midi_events": ("minihost.midi_events", "make_midi_events"),
+    "make_param_changes": ("minihost.midi_events", "make_param_changes"),
+    "midi_event_dtype": ("minihost.midi_events", "midi_event_dtype"),
+    "param_change_dtype": ("minihost.midi_events", "param_change_dtype"),
+    # Array layout helper
+    "as_audio": ("minihost._util", "as_audio"),
+    # Audio processing
+    "process_audio": ("minihost.process", "process_audio"),
+    "process_audio_stream": ("minihost.process", "process_audio_stream"),
+    "process_audio_to_file": ("minihost.process", "process_audio_to_file"),
+    # Declarative chains
+    "load_chain": ("minihost.chain", "load_chain"),
+    # Callable composition pipelines
+    "Compose": ("minihost.compose", "Compose"),
+    "Gain": ("minihost.compose", "Gain"),
+    "Normalize": ("minihost.compose", "Normalize"),
+    "Trim": ("minihost.compose", "Trim"),
+    "Fade": ("minihost.compose", "Fade"),
+    "Maybe": ("minihost.compose", "Maybe"),
+    "OneOf": ("minihost.compose", "OneOf"),
+    "SomeOf": ("minihost.compose", "SomeOf"),
+    "RandomParam": ("minihost.compose", "RandomParam"),
+    "AddGaussianNoise": ("minihost.compose", "AddGaussianNoise"),
+    # Project files (graph executor v2)
+    "LoadedProject": ("minihost.project", "LoadedProject"),
+    "ProjectError": ("minihost.project", "ProjectError"),
+    "load_project": ("minihost.project", "load_project"),
+    "save_project": ("minihost.project", "save_project"),
+    "render_project": ("minihost.project", "render_project"),
+    # Persistent plugin-scan cache
+    "plugincache": ("minihost.plugincache", None),
+    "scan_plugins": ("minihost.plugincache", "scan"),
+    "query_plugins": ("minihost.plugincache", "query"),
+    # Automation
+    "find_param_by_name": ("minihost.automation", "find_param_by_name"),
+    "parse_param_arg": ("minihost.automation", "parse_param_arg"),
+    "parse_automation_file": ("minihost.automation", "parse_automation_file"),
+    # Preset morphing
+    "morph": ("minihost.morph", None),
+    "capture_params": ("minihost.morph", "capture"),
+    "apply_params": ("minihost.morph", "apply"),
+    "lerp_params": ("minihost.morph", "lerp"),
+    "morph_params": ("minihost.morph", "morph"),
+    # Async loading
+    "open_async": ("minihost._async", "open_async"),
+    # VST3 presets
+    "VstPreset": ("minihost.vstpreset", "VstPreset"),
+    "read_vstpreset": ("minihost.vstpreset", "read_vstpreset"),
+    "load_vstpreset": ("minihost.vstpreset", "load_vstpreset"),
+    "write_vstpreset": ("minihost.vstpreset", "write_vstpreset"),
+    "save_vstpreset": ("minihost.vstpreset", "save_vstpreset"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module 'minihost' has no attribute {name!r}") from None
+    import importlib
+
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from minihost import morph, plugincache
+    from minihost._async import open_async
+    from minihost._util import as_audio
+    from minihost.audio_io import (
+        get_audio_info,
+        open_audio_writer,
+        read_audio,
+        resample,
+        write_audio,
+    )
+    from minihost.automation import (
+        find_param_by_name,
+        parse_automation_file,
+        parse_param_arg,
+    )
+    from minihost.chain import load_chain
+    from minihost.compose import (
+        AddGaussianNoise,
+        Compose,
+        Fade,
+        Gain,
+        Maybe,
+        Normalize,
+        OneOf,
+        RandomParam,
+        SomeOf,
+        Trim,
+    )
+    from minihost.control import MidiMapper
+    from minihost.midi_events import (
+        make_midi_events,
+        make_param_changes,
+        midi_event_dtype,
+        param_change_dtype,
+    )
+    from minihost.morph import apply as apply_params
+    from minihost.morph import capture as capture_params
+    from minihost.morph import lerp as lerp_params
+    from minihost.morph import morph as morph_params
+    from minihost.plugincache import query as query_plugins
+    from minihost.plugincache import scan as scan_plugins
+    from minihost.process import (
+        process_audio,
+        process_audio_stream,
+        process_audio_to_file,
+    )
+    from minihost.project import (
+        LoadedProject,
+        ProjectError,
+        load_project,
+        render_project,
+        save_project,
+    )
+    from minihost.render import (
+        MidiRenderer,
+        midi_duration,
+        midi_file_to_events,
+        render_midi,
+        render_midi_stream,
+        render_midi_to_file,
+    )
+    from minihost.vstpreset import (
+        VstPreset,
+        load_vstpreset,
+        read_vstpreset,
+        save_vstpreset,
+        write_vstpreset,
+    )
+
 
 __all__ = [
     # Core classes
@@ -172,6 +375,7 @@ __all__ = [
     "AudioDevice",
     "MidiFile",
     "MidiIn",
+    "AudioWriter",
     # Plugin discovery
     "probe",
     "scan_directory",
@@ -186,10 +390,19 @@ __all__ = [
     "render_midi_stream",
     "render_midi_to_file",
     "midi_file_to_events",
+    "midi_duration",
     "MidiRenderer",
+    # Pre-built MIDI event / parameter change arrays
+    "make_midi_events",
+    "midi_event_dtype",
+    "make_param_changes",
+    "param_change_dtype",
+    # Array layout helper
+    "as_audio",
     # Audio I/O
     "read_audio",
     "write_audio",
+    "open_audio_writer",
     "get_audio_info",
     "resample",
     # Audio processing
@@ -8,8 +8,11 @@
 #include <vector>
 #include <stdexcept>
 #include <cstring>
+#include <cmath>
 #include <mutex>
 #include <memory>
+#include <algorithm>
+#include <climits>
 
 #include <juce_core/juce_core.h>
 #include <juce_audio_basics/juce_audio_basics.h>
@@ -147,6 +150,9 @@ static std::pair<nb::object, nb::object> require_2tuple(nb::object key) {
 // Helper to convert numpy arrays to raw pointers
 using AudioArray = nb::ndarray<float, nb::shape<-1, -1>, nb::c_contig, nb::device::cpu>;
 using DoubleAudioArray = nb::ndarray<double, nb::shape<-1, -1>, nb::c_contig, nb::device::cpu>;
+using Int16AudioArray = nb::ndarray<int16_t, nb::shape<-1, -1>, nb::c_contig, nb::device::cpu>;
+// One channel of planar audio, for process_planar (list of these per side)
+using ChannelArray = nb::ndarray<float, nb::ndim<1>, nb::c_contig, nb::device::cpu>;
 
 // Default capacity for the MIDI-output buffer of a process call. Callers
 // can raise this per call via the `midi_out_capacity` argument; events
@@ -179,6 +185,179 @@ static MH_MidiEvent parse_midi_event(nb::handle item) {
     return e;
 }
 
+// One scalar field of a PEP 3118 record format: kind 'i' (signed int),
+// 'u' (unsigned int) or 'f' (float), its size and byte offset.
+struct RecordField {
+    char kind;
+    size_t size;
+    size_t offset;
+    bool operator==(const RecordField& o) const {
+        return kind == o.kind && size == o.size && offset == o.offset;
+    }
+};
+
+// Parse a struct format such as numpy's
+// "T{i:sample_offset:B:status:B:data1:B:data2:}" into its fields. Names are
+// skipped and padding ('x') advances the offset. Returns false for anything
+// this does not handle -- nested records, sub-arrays, repeated fields,
+// non-native byte order -- all of which the callers reject anyway.
+static bool parse_record_format(const char* fmt, std::vector<RecordField>& fields) {
+    if (fmt == nullptr || fmt[0] != 'T' || fmt[1] != '{') {
+        return false;
+    }
+    const char* c = fmt + 2;
+    bool native = true;  // '@': native sizes; '=', '<': standard sizes
+    size_t offset = 0;
+    while (*c != '}') {
+        if (*c == '\0') {
+            return false;
+        }
+        if (*c == '@') { native = true; ++c; continue; }
+        if (*c == '=' || *c == '<') { native = false; ++c; continue; }
+        if (*c == ':') {  // field name
+            const char* end = std::strchr(c + 1, ':');
+            if (end == nullptr) {
+                return false;
+            }
+            c = end + 1;
+            continue;
+        }
+        size_t count = 0;
+        bool has_count = false;
+        while (*c >= '0' && *c <= '9') {
+            count = count * 10 + static_cast<size_t>(*c - '0');
+            has_count = true;
+            ++c;
+        }
+        if (!has_count) {
+            count = 1;
+        }
+        char kind;
+        size_t size;
+        switch (*c) {
+            case 'x': offset += count; ++c; continue;
+            case 'b': kind = 'i'; size = 1; break;
+            case 'B': kind = 'u'; size = 1; break;
+            case 'h': kind = 'i'; size = 2; break;
+            case 'H': kind = 'u'; size = 2; break;
+            case 'i': kind = 'i'; size = 4; break;
+            case 'I': kind = 'u'; size = 4; break;
+            case 'l': kind = 'i'; size = native ? sizeof(long) : 4; break;
+            case 'L': kind = 'u'; size = native ? sizeof(long) : 4; break;
+            case 'q': kind = 'i'; size = 8; break;
+            case 'Q': kind = 'u'; size = 8; break;
+            case 'f': kind = 'f'; size = 4; break;
+            case 'd': kind = 'f'; size = 8; break;
+            default: return false;  // '>', '!', '(', 'T{', ...
+        }
+        if (count != 1) {
+            return false;
+        }
+        fields.push_back({kind, size, offset});
+        offset += size;
+        ++c;
+    }
+    return true;
+}
+
+// True when a buffer's record format matches `expected` field for field.
+static bool record_format_matches(const char* fmt,
+                                  std::initializer_list<RecordField> expected) {
+    std::vector<RecordField> fields;
+    return parse_record_format(fmt, fields)
+        && std::equal(fields.begin(), fields.end(), expected.begin(), expected.end());
+}
+
+// Convert a block of MIDI input into MH_MidiEvents. Accepts either a sequence
+// of (sample_offset, status, data1, data2) tuples, or a 1-D c-contiguous
+// buffer whose records have the MH_MidiEvent layout (int32 sample_offset
+// followed by three uint8 bytes, padded to 8 bytes -- the dtype built by
+// minihost.make_midi_events). The buffer path copies the records with one
+// memcpy instead of unpacking a Python tuple per event.
+static std::vector<MH_MidiEvent> parse_midi_events(nb::handle midi_in) {
+    std::vector<MH_MidiEvent> events;
+    PyObject* p = midi_in.ptr();
+    if (PyObject_CheckBuffer(p)) {
+        Py_buffer view;
+        if (PyObject_GetBuffer(p, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0) {
+            throw nb::python_error();
+        }
+        // The full layout is checked, not just the record size: any other
+        // 8-byte record would be memcpy'd into garbage MIDI.
+        bool is_midi_record = record_format_matches(
+            view.format, {{'i', 4, 0}, {'u', 1, 4}, {'u', 1, 5}, {'u', 1, 6}});
+        if (view.ndim != 1 || !is_midi_record
+            || view.itemsize != static_cast<Py_ssize_t>(sizeof(MH_MidiEvent))) {
+            PyBuffer_Release(&view);
+            throw nb::type_error(
+                "MIDI event buffer must be a 1-D structured array with the "
+                "MH_MidiEvent layout (see minihost.make_midi_events)");
+        }
+        size_t n = static_cast<size_t>(view.shape[0]);
+        events.resize(n);
+        if (n > 0) {
+            std::memcpy(events.data(), view.buf, n * sizeof(MH_MidiEvent));
+        }
+        PyBuffer_Release(&view);
+        return events;
+    }
+    size_t n = nb::len(midi_in);
+    events.reserve(n);
+    for (size_t i = 0; i < n; ++i) {
+        events.push_back(parse_midi_event(midi_in[i]));
+    }
+    return events;
+}
+
+// Convert parameter automation into MH_ParamChanges. Accepts either a
+// sequence of (sample_offset, param_index, value) tuples, or a 1-D
+// c-contiguous buffer whose records have the MH_ParamChange layout (int32
+// sample_offset, int32 param_index, float32 value -- the dtype built by
+// minihost.make_param_changes), copied with one memcpy.
+static std::vector<MH_ParamChange> parse_param_changes(nb::handle param_changes) {
+    std::vector<MH_ParamChange> changes;
+    PyObject* p = param_changes.ptr();
+    if (PyObject_CheckBuffer(p)) {
+        Py_buffer view;
+        if (PyObject_GetBuffer(p, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0) {
+            throw nb::python_error();
+        }
+        bool is_param_record = record_format_matches(
+            view.format, {{'i', 4, 0}, {'i', 4, 4}, {'f', 4, 8}});
+        if (view.ndim != 1 || !is_param_record
+            || view.itemsize != static_cast<Py_ssize_t>(sizeof(MH_ParamChange))) {
+            PyBuffer_Release(&view);
+            throw nb::type_error(
+                "Parameter change buffer must be a 1-D structured array with "
+                "the MH_ParamChange layout (see minihost.make_param_changes)");
+        }
+        size_t n = static_cast<size_t>(view.shape[0]);
+        changes.resize(n);
+        if (n > 0) {
+            std::memcpy(changes.data(), view.buf, n * sizeof(MH_ParamChange));
+        }
+        PyBuffer_Release(&view);
+        return changes;
+    }
+    size_t n = nb::len(param_changes);
+    changes.reserve(n);
+    for (size_t i = 0; i < n; ++i) {
+        nb::tuple pc = nb::cast<nb::tuple>(param_changes[i]);
+        MH_ParamChange c;
+        c.sample_offset = nb::cast<int>(pc[0]);
+        c.param_index = nb::cast<int>(pc[1]);
+        c.value = nb::cast<float>(pc[2]);
+        changes.push_back(c);
+    }
+    return changes;
+}
+
+// ASCII lower-casing used for case-insensitive parameter name lookups.
+static std::string ascii_lower(std::string s) {
+    for (auto& c : s) c = static_cast<char>(std::tolower(static_cast<unsigned char>(c)));
+    return s;
+}
+
 // Convert planar float audio [ch0_s0,ch0_s1,...,ch1_s0,ch1_s1,...] to interleaved
 // [s0_ch0,s0_ch1,...,s1_ch0,s1_ch1,...].
 static void planar_to_interleaved(const float* planar, float* interleaved,
@@ -196,6 +375,31 @@ static void interleaved_to_planar(const float* interleaved, float* planar,
             planar[ch * frames + f] = interleaved[f * channels + ch];
 }
 
+// De-interleave `frames` frames into planar storage whose channels are
+// `stride` samples apart (the destination may be longer than this block).
+static void interleaved_to_planar_strided(const float* interleaved, float* planar,
+                                          size_t channels, size_t frames,
+                                          size_t stride) {
+    for (size_t ch = 0; ch < channels; ch++)
+        for (size_t f = 0; f < frames; f++)
+            planar[ch * stride + f] = interleaved[f * channels + ch];
+}
+
+// Frames decoded per block by audio_read.
+static constexpr unsigned int AUDIO_READ_BLOCK = 16384;
+
+// Copy the first `frames` frames of every channel of `src` into a new
+// buffer of exactly that length (used to grow or trim audio_read's output).
+static MhAudioBuffer* resized_copy(const MhAudioBuffer& src, int frames, int valid) {
+    auto* out = new MhAudioBuffer(src.channels(), frames);
+    for (int ch = 0; ch < src.channels(); ++ch) {
+        std::memcpy(out->data() + (size_t)ch * frames,
+                    src.data() + (size_t)ch * src.frames(),
+                    (size_t)valid * sizeof(float));
+    }
+    return out;
+}
+
 // Validate audio buffer shape for a process call. Throws on mismatch.
 // User arrays must have >= the plugin's required channel count; extra
 // channels are harmless (the C layer only references the first N).
@@ -378,6 +582,14 @@ public:
         return p ? std::string(p) : std::string();
     }
 
+    nb::dict get_desc() const {
+        MH_PluginDesc desc;
+        if (!mh_get_desc(plugin_, &desc)) {
+            throw std::runtime_error("Failed to get plugin description");
+        }
+        return plugin_desc_to_dict(desc);
+    }
+
     int num_params() const {
         return mh_get_num_params(plugin_);
     }
@@ -400,6 +612,10 @@ public:
         return mh_get_latency_samples(plugin_);
     }
 
+    int max_block_size() const {
+        return max_block_size_;
+    }
+
     double tail_seconds() const {
         return mh_get_tail_seconds(plugin_);
     }
@@ -462,7 +678,24 @@ public:
         if (!mh_get_bus_info(plugin_, is_input ? 1 : 0, bus_index, &info)) {
             throw std::runtime_error("Failed to get bus info");
         }
+        return bus_info_to_dict(info);
+    }
 
+    // Batch form of get_bus_info: every bus on one side in one call.
+    nb::list get_bus_infos(bool is_input) const {
+        int n = mh_get_num_buses(plugin_, is_input ? 1 : 0);
+        nb::list out;
+        for (int i = 0; i < n; ++i) {
+            MH_BusInfo info;
+            if (!mh_get_bus_info(plugin_, is_input ? 1 : 0, i, &info)) {
+                throw std::runtime_error("Failed to get bus info");
+            }
+            out.append(bus_info_to_dict(info));
+        }
+        return out;
+    }
+
+    static nb::dict bus_info_to_dict(const MH_BusInfo& info) {
         nb::dict d;
         d["name"] = std::string(info.name);
         d["num_channels"] = info.num_channels;
@@ -487,7 +720,57 @@ public:
         if (!mh_get_param_info(plugin_, index, &info)) {
             throw std::runtime_error("Failed to get parameter info");
         }
+        return param_info_to_dict(info);
+    }
 
+    // Resolve a (start, count) range over `n` items, slice-style: count < 0
+    // means "to the last item" and the end is clamped to n.
+    static std::pair<int, int> clamp_range(int start, int count, int n,
+                                           const char* what) {
+        if (start < 0 || start > n) {
+            throw nb::index_error(
+                ("start " + std::to_string(start) + " out of range for " +
+                 std::to_string(n) + " " + what).c_str());
+        }
+        int end = (count < 0 || count > n - start) ? n : start + count;
+        return {start, end};
+    }
+
+    std::pair<int, int> param_range(int start, int count) const {
+        return clamp_range(start, count, mh_get_num_params(plugin_), "parameters");
+    }
+
+    // Batch forms of get_param_info / get_param: one call for a whole range.
+    // with_values adds each parameter's normalized "value", read in the same
+    // sweep as its current_value_str.
+    nb::list get_param_infos(int start, int count, bool with_values) const {
+        auto [begin, end] = param_range(start, count);
+        nb::list out;
+        for (int i = begin; i < end; ++i) {
+            MH_ParamInfo info;
+            if (!mh_get_param_info(plugin_, i, &info)) {
+                throw std::runtime_error("Failed to get parameter info");
+            }
+            nb::dict d = param_info_to_dict(info);
+            if (with_values) {
+                d["value"] = mh_get_param(plugin_, i);
+            }
+            out.append(d);
+        }
+        return out;
+    }
+
+    std::vector<float> get_params(int start, int count) const {
+        auto [begin, end] = param_range(start, count);
+        std::vector<float> out;
+        out.reserve(static_cast<size_t>(end - begin));
+        for (int i = begin; i < end; ++i) {
+            out.push_back(mh_get_param(plugin_, i));
+        }
+        return out;
+    }
+
+    static nb::dict param_info_to_dict(const MH_ParamInfo& info) {
         nb::dict d;
         d["name"] = std::string(info.name);
         d["id"] = std::string(info.id);
@@ -504,21 +787,39 @@ public:
     }
 
     // Find parameter index by name (case-insensitive)
+    //
+    // Lookups go through a lower-cased name -> index map built on first use.
+    // Plugins may rename parameters at any time (MH_CHANGE_PARAM_INFO), so a
+    // hit is confirmed by re-reading that one parameter's name, and a miss
+    // or mismatch rebuilds the map before giving up. A hit costs one
+    // mh_get_param_info call instead of a scan over every parameter.
     int find_param(const std::string& name) const {
+        const std::string key = ascii_lower(name);
         int n = mh_get_num_params(plugin_);
-        // Convert search name to lowercase
-        std::string name_lower = name;
-        for (auto& c : name_lower) c = static_cast<char>(std::tolower(static_cast<unsigned char>(c)));
+        if (n == param_name_index_count_) {
+            auto it = param_name_index_.find(key);
+            if (it != param_name_index_.end()) {
+                MH_ParamInfo info;
+                if (mh_get_param_info(plugin_, it->second, &info)
+                    && ascii_lower(info.name) == key)
+                    return it->second;
+            }
+        }
 
+        param_name_index_.clear();
+        param_name_index_.reserve(static_cast<size_t>(n < 0 ? 0 : n));
         for (int i = 0; i < n; ++i) {
             MH_ParamInfo info;
             if (mh_get_param_info(plugin_, i, &info)) {
-                std::string pname(info.name);
-                for (auto& c : pname) c = static_cast<char>(std::tolower(static_cast<unsigned char>(c)));
-                if (pname == name_lower)
-                    return i;
+                // emplace keeps the first index for duplicate names
+                param_name_index_.emplace(ascii_lower(info.name), i);
             }
         }
+        param_name_index_count_ = n;
+
+        auto it = param_name_index_.find(key);
+        if (it != param_name_index_.end())
+            return it->second;
         throw std::runtime_error("Parameter not found: '" + name + "'");
     }
 
@@ -609,6 +910,23 @@ public:
         return std::string(buf);
     }
 
+    // Batch form of get_program_name over a (start, count) range, clamped
+    // to num_programs like get_param_infos.
+    std::vector<std::string> get_program_names(int start, int count) const {
+        auto [begin, end] = clamp_range(start, count,
+                                        mh_get_num_programs(plugin_), "programs");
+        std::vector<std::string> out;
+        out.reserve(static_cast<size_t>(end - begin));
+        for (int i = begin; i < end; ++i) {
+            char buf[256] = {0};
+            if (!mh_get_program_name(plugin_, i, buf, sizeof(buf))) {
+                throw std::runtime_error("Failed to get program name");
+            }
+            out.emplace_back(buf);
+        }
+        return out;
+    }
+
     int get_program() const {
         return mh_get_program(plugin_);
     }
@@ -634,8 +952,37 @@ public:
         return nb::bytes(buffer.data(), size);
     }
 
-    void set_state(nb::bytes data) {
-        if (!mh_set_state(plugin_, data.c_str(), static_cast<int>(data.size()))) {
+    // Write the state into a caller-owned bytearray, growing it only when it
+    // is too small, so repeated snapshots reuse one allocation. Returns the
+    // number of bytes written; the bytearray is never shrunk.
+    int get_state_into(nb::handle out) const {
+        PyObject* p = out.ptr();
+        if (!PyByteArray_Check(p)) {
+            throw nb::type_error("get_state_into() requires a bytearray");
+        }
+        int size = mh_get_state_size(plugin_);
+        if (size <= 0) {
+            return 0;
+        }
+        if (PyByteArray_GET_SIZE(p) < size && PyByteArray_Resize(p, size) != 0) {
+            throw nb::python_error();
+        }
+        if (!mh_get_state(plugin_, PyByteArray_AS_STRING(p), size)) {
+            throw std::runtime_error("Failed to get plugin state");
+        }
+        return size;
+    }
+
+    // Accepts any contiguous bytes-like object (bytes, bytearray, memoryview
+    // slice) so a get_state_into() buffer can be passed back without a copy.
+    void set_state(nb::handle data) {
+        Py_buffer view;
+        if (PyObject_GetBuffer(data.ptr(), &view, PyBUF_SIMPLE) != 0) {
+            throw nb::python_error();
+        }
+        int ok = mh_set_state(plugin_, view.buf, static_cast<int>(view.len));
+        PyBuffer_Release(&view);
+        if (!ok) {
             throw std::runtime_error("Failed to set plugin state");
         }
     }
@@ -722,9 +1069,104 @@ public:
         }
     }
 
+    // Process 16-bit PCM. Samples are scaled to float32 in [-1, 1) (x / 32768)
+    // into a reused workspace, processed, and written back rounded and
+    // clamped to the int16 range. The conversion loops are plain unit-stride
+    // loops that the compiler vectorizes for the target.
+    void process_int16(Int16AudioArray input, Int16AudioArray output) {
+        int in_channels = static_cast<int>(input.shape(0));
+        int out_channels = static_cast<int>(output.shape(0));
+        int in_frames = static_cast<int>(input.shape(1));
+        int out_frames = static_cast<int>(output.shape(1));
+
+        MH_Info info;
+        mh_get_info(plugin_, &info);
+        validate_process_shape(in_channels, out_channels, in_frames, out_frames,
+                               info.num_input_ch, info.num_output_ch, max_block_size_);
+
+        size_t in_samples = static_cast<size_t>(in_channels) * in_frames;
+        size_t out_samples = static_cast<size_t>(out_channels) * out_frames;
+        if (int16_scratch_.size() < in_samples + out_samples) {
+            int16_scratch_.resize(in_samples + out_samples);
+        }
+        float* in_f = int16_scratch_.data();
+        float* out_f = in_f + in_samples;
+
+        const int16_t* in_data = input.data();
+        constexpr float kToFloat = 1.0f / 32768.0f;
+        for (size_t i = 0; i < in_samples; ++i) {
+            in_f[i] = static_cast<float>(in_data[i]) * kToFloat;
+        }
+
+        std::vector<const float*> in_ptrs(in_channels);
+        std::vector<float*> out_ptrs(out_channels);
+        for (int ch = 0; ch < in_channels; ++ch) {
+            in_ptrs[ch] = in_f + static_cast<size_t>(ch) * in_frames;
+        }
+        for (int ch = 0; ch < out_channels; ++ch) {
+            out_ptrs[ch] = out_f + static_cast<size_t>(ch) * out_frames;
+        }
+
+        if (!mh_process(plugin_, in_ptrs.data(), out_ptrs.data(), in_frames)) {
+            throw std::runtime_error("Process failed");
+        }
+
+        int16_t* out_data = output.data();
+        for (size_t i = 0; i < out_samples; ++i) {
+            float s = out_f[i] * 32768.0f;
+            s = s < -32768.0f ? -32768.0f : (s > 32767.0f ? 32767.0f : s);
+            out_data[i] = static_cast<int16_t>(std::lrint(s));
+        }
+    }
+
+    // Process audio held as one 1-D array per channel. The channel pointers
+    // are taken straight from each array, so channels can live in separate
+    // (e.g. individually pooled) buffers without being packed into a 2-D
+    // array first.
+    void process_planar(const std::vector<ChannelArray>& inputs,
+                        const std::vector<ChannelArray>& outputs) {
+        if (outputs.empty()) {
+            throw std::runtime_error("process_planar requires at least one output channel");
+        }
+        int in_channels = static_cast<int>(inputs.size());
+        int out_channels = static_cast<int>(outputs.size());
+        int out_frames = static_cast<int>(outputs[0].shape(0));
+        int in_frames = in_channels > 0 ? static_cast<int>(inputs[0].shape(0)) : out_frames;
+
+        for (const auto& ch : inputs) {
+            if (static_cast<int>(ch.shape(0)) != in_frames) {
+                throw std::runtime_error("All input channels must have the same length");
+            }
+        }
+        for (const auto& ch : outputs) {
+            if (static_cast<int>(ch.shape(0)) != out_frames) {
+                throw std::runtime_error("All output channels must have the same length");
+            }
+        }
+
+        MH_Info info;
+        mh_get_info(plugin_, &info);
+        validate_process_shape(in_channels, out_channels, in_frames, out_frames,
+                               info.num_input_ch, info.num_output_ch, max_block_size_);
+
+        std::vector<const float*> in_ptrs(in_channels);
+        std::vector<float*> out_ptrs(out_channels);
+
+        for (int ch = 0; ch < in_channels; ++ch) {
+            in_ptrs[ch] = inputs[ch].data();
+        }
+        for (int ch = 0; ch < out_channels; ++ch) {
+            out_ptrs[ch] = outputs[ch].data();
+        }
+
+        if (!mh_process(plugin_, in_ptrs.data(), out_ptrs.data(), in_frames)) {
+            throw std::runtime_error("Process failed");
+        }
+    }
+
     // Process with MIDI
     nb::list process_midi(AudioArray input, AudioArray output,
-                          nb::list midi_in, int midi_out_capacity)
+                          nb::handle midi_in, int midi_out_capacity)
     {
         check_midi_capacity(midi_out_capacity);
         int in_channels = static_cast<int>(input.shape(0));
@@ -738,10 +1180,7 @@ public:
                                info.num_input_ch, info.num_output_ch, max_block_size_);
 
         // Convert MIDI input
-        std::vector<MH_MidiEvent> midi_events;
-        for (size_t i = 0; i < nb::len(midi_in); ++i) {
-            midi_events.push_back(parse_midi_event(midi_in[i]));
-        }
+        std::vector<MH_MidiEvent> midi_events = parse_midi_events(midi_in);
 
         // Set up channel pointers
         std::vector<const float*> in_ptrs(in_channels);
@@ -779,7 +1218,7 @@ public:
 
     // Process with sample-accurate automation
     nb::list process_auto(AudioArray input, AudioArray output,
-                          nb::list midi_in, nb::list param_changes,
+                          nb::handle midi_in, nb::handle param_changes,
                           int midi_out_capacity)
     {
         check_midi_capacity(midi_out_capacity);
@@ -794,21 +1233,10 @@ public:
                                info.num_input_ch, info.num_output_ch, max_block_size_);
 
         // Convert MIDI input
-        std::vector<MH_MidiEvent> midi_events;
-        for (size_t i = 0; i < nb::len(midi_in); ++i) {
-            midi_events.push_back(parse_midi_event(midi_in[i]));
-        }
+        std::vector<MH_MidiEvent> midi_events = parse_midi_events(midi_in);
 
         // Convert param changes
-        std::vector<MH_ParamChange> changes;
-        for (size_t i = 0; i < nb::len(param_changes); ++i) {
-            nb::tuple pc = nb::cast<nb::tuple>(param_changes[i]);
-            MH_ParamChange c;
-            c.sample_offset = nb::cast<int>(pc[0]);
-            c.param_index = nb::cast<int>(pc[1]);
-            c.value = nb::cast<float>(pc[2]);
-            changes.push_back(c);
-        }
+        std::vector<MH_ParamChange> changes = parse_param_changes(param_changes);
 
         // Set up channel pointers
         std::vector<const float*> in_ptrs(in_channels);
@@ -947,6 +1375,54 @@ public:
         }
     }
 
+    // float32 overload of process_double: samples are widened into a reused
+    // float64 workspace, processed in double precision, and narrowed back
+    // into the float32 output. Without it a float32 input was converted by
+    // the binding into a fresh float64 array on every call, and callers had
+    // to hold a separate float64 output buffer.
+    void process_double_f32(AudioArray input, AudioArray output) {
+        int in_channels = static_cast<int>(input.shape(0));
+        int out_channels = static_cast<int>(output.shape(0));
+        int in_frames = static_cast<int>(input.shape(1));
+        int out_frames = static_cast<int>(output.shape(1));
+
+        MH_Info info;
+        mh_get_info(plugin_, &info);
+        validate_process_shape(in_channels, out_channels, in_frames, out_frames,
+                               info.num_input_ch, info.num_output_ch, max_block_size_);
+
+        size_t in_samples = static_cast<size_t>(in_channels) * in_frames;
+        size_t out_samples = static_cast<size_t>(out_channels) * out_frames;
+        if (double_scratch_.size() < in_samples + out_samples) {
+            double_scratch_.resize(in_samples + out_samples);
+        }
+        double* in_d = double_scratch_.data();
+        double* out_d = in_d + in_samples;
+
+        const float* in_data = input.data();
+        for (size_t i = 0; i < in_samples; ++i) {
+            in_d[i] = static_cast<double>(in_data[i]);
+        }
+
+        std::vector<const double*> in_ptrs(in_channels);
+        std::vector<double*> out_ptrs(out_channels);
+        for (int ch = 0; ch < in_channels; ++ch) {
+            in_ptrs[ch] = in_d + static_cast<size_t>(ch) * in_frames;
+        }
+        for (int ch = 0; ch < out_channels; ++ch) {
+            out_ptrs[ch] = out_d + static_cast<size_t>(ch) * out_frames;
+        }
+
+        if (!mh_process_double(plugin_, in_ptrs.data(), out_ptrs.data(), in_frames)) {
+            throw std::runtime_error("Process (double) failed");
+        }
+
+        float* out_data = output.data();
+        for (size_t i = 0; i < out_samples; ++i) {
+            out_data[i] = static_cast<float>(out_d[i]);
+        }
+    }
+
     // Processing precision
     int get_processing_precision() const {
         return mh_get_processing_precision(plugin_);
@@ -1097,6 +1573,19 @@ private:
     int max_block_size_;
     bool non_realtime_ = false;
 
+    // float32 workspace for process_int16 (input channels then output
+    // channels); grows to the largest block seen and is then reused.
+    std::vector<float> int16_scratch_;
+
+    // float64 workspace for the float32 process_double overload, laid out
+    // and grown the same way.
+    std::vector<double> double_scratch_;
+
+    // find_param's lower-cased name -> index cache, and the parameter
+    // count it was built for (-1: not built yet).
+    mutable std::unordered_map<std::string, int> param_name_index_;
+    mutable int param_name_index_count_ = -1;
+
     // Python callback holders (prevent GC)
     nb::object change_callback_;
     nb::object param_value_callback_;
@@ -1323,7 +1812,7 @@ public:
     }
 
     // Process with MIDI
-    nb::list process_midi(AudioArray input, AudioArray output, nb::list midi_in,
+    nb::list process_midi(AudioArray input, AudioArray output, nb::handle midi_in,
                           int midi_out_capacity)
     {
         check_midi_capacity(midi_out_capacity);
@@ -1338,10 +1827,7 @@ public:
                                mh_chain_get_max_block_size(chain_));
 
         // Convert MIDI input
-        std::vector<MH_MidiEvent> midi_events;
-        for (size_t i = 0; i < nb::len(midi_in); ++i) {
-            midi_events.push_back(parse_midi_event(midi_in[i]));
-        }
+        std::vector<MH_MidiEvent> midi_events = parse_midi_events(midi_in);
 
         std::vector<const float*> in_ptrs(in_channels);
         std::vector<float*> out_ptrs(out_channels);
@@ -1378,7 +1864,7 @@ public:
 
     // Process with sample-accurate automation
     nb::list process_auto(AudioArray input, AudioArray output,
-                          nb::list midi_in, nb::list param_changes,
+                          nb::handle midi_in, nb::list param_changes,
                           int midi_out_capacity)
     {
         check_midi_capacity(midi_out_capacity);
@@ -1393,10 +1879,7 @@ public:
                                mh_chain_get_max_block_size(chain_));
 
         // Convert MIDI input
-        std::vector<MH_MidiEvent> midi_events;
-        for (size_t i = 0; i < nb::len(midi_in); ++i) {
-            midi_events.push_back(parse_midi_event(midi_in[i]));
-        }
+        std::vector<MH_MidiEvent> midi_events = parse_midi_events(midi_in);
 
         // Convert param changes (4-tuples: sample_offset, plugin_index, param_index, value)
         std::vector<MH_ChainParamChange> changes;
@@ -1571,7 +2054,7 @@ public:
     // and a bool that is True if the merge filled midi_out_capacity and
     // events may have been dropped.
     nb::tuple process_midi(AudioArray input, AudioArray output,
-                           nb::list midi_in, int midi_out_capacity) {
+                           nb::handle midi_in, int midi_out_capacity) {
         check_midi_capacity(midi_out_capacity);
         int in_ch = static_cast<int>(input.shape(0));
         int out_ch = static_cast<int>(output.shape(0));
@@ -1583,9 +2066,7 @@ public:
                                mh_bus_get_num_output_channels(graph_),
                                mh_bus_get_max_block_size(graph_));
 
-        std::vector<MH_MidiEvent> midi_events;
-        for (size_t i = 0; i < nb::len(midi_in); ++i)
-            midi_events.push_back(parse_midi_event(midi_in[i]));
+        std::vector<MH_MidiEvent> midi_events = parse_midi_events(midi_in);
 
         std::vector<const float*> in_ptrs(in_ch);
         std::vector<float*> out_ptrs(out_ch);
@@ -2170,6 +2651,21 @@ public:
         }
     }
 
+    // Send several MIDI events as one queue submission, shape (N, 3)
+    void send_midi_batch(nb::ndarray<uint8_t, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu> events) {
+        int count = static_cast<int>(events.shape(0));
+        if (count == 0) return;
+        if (!mh_audio_send_midi_batch(device_, events.data(), count)) {
+            throw std::runtime_error("Failed to send MIDI batch (queue may be full)");
+        }
+    }
+
+    void all_notes_off() {
+        if (!mh_audio_all_notes_off(device_)) {
+            throw std::runtime_error("Failed to send All Notes Off (queue may be full)");
+        }
+    }
+
     // Audio input via lock-free ring buffer (no GIL on audio thread)
     void enable_input(int capacity_frames = 0) {
         if (capacity_frames <= 0) {
@@ -2343,6 +2839,7 @@ public:
 
     // Load from file
     bool load(const std::string& path) {
+        ++revision_;
         if (!file_.read(path)) {
             return false;
         }
@@ -2356,6 +2853,12 @@ public:
         return file_.write(path);
     }
 
+    // Mutation counter, bumped by every method that can change the events
+    // or their timing; lets Python-side caches detect a stale file.
+    uint64_t revision() const {
+        return revision_;
+    }
+
     // Get number of tracks
     int num_tracks() const {
         return file_.getTrackCount();
@@ -2368,6 +2871,7 @@ public:
 
     // Set ticks per quarter note
     void set_ticks_per_quarter(int tpq) {
+        ++revision_;
         file_.setTicksPerQuarterNote(tpq);
     }
 
@@ -2379,36 +2883,43 @@ public:
 
     // Add a track
     int add_track() {
+        ++revision_;
         return file_.addTrack();
     }
 
     // Add a tempo event (BPM)
     void add_tempo(int track, int tick, double bpm) {
+        ++revision_;
         file_.addTempo(track, tick, bpm);
     }
 
     // Add a note on event
     void add_note_on(int track, int tick, int channel, int pitch, int velocity) {
+        ++revision_;
         file_.addNoteOn(track, tick, channel, pitch, velocity);
     }
 
     // Add a note off event
     void add_note_off(int track, int tick, int channel, int pitch, int velocity = 0) {
+        ++revision_;
         file_.addNoteOff(track, tick, channel, pitch, velocity);
     }
 
     // Add a control change event
     void add_control_change(int track, int tick, int channel, int controller, int value) {
+        ++revision_;
         file_.addController(track, tick, channel, controller, value);
     }
 
     // Add a program change event
     void add_program_change(int track, int tick, int channel, int program) {
+        ++revision_;
         file_.addPatchChange(track, tick, channel, program);
     }
 
     // Add a pitch bend event
     void add_pitch_bend(int track, int tick, int channel, int value) {
+        ++revision_;
         file_.addPitchBend(track, tick, channel, value);
     }
 
@@ -2468,28 +2979,95 @@ public:
         return events;
     }
 
+    // Playable channel-voice events from all tracks as (tick, status,
+    // data1, data2) tuples, stable-sorted by tick. Classified exactly as
+    // get_events does (a zero-velocity note-on reads as a note-off), but
+    // without building a dict per event, which dominates on large files.
+    nb::list get_channel_events() const {
+        struct Event {
+            int tick;
+            int status;
+            int data1;
+            int data2;
+        };
+        std::vector<Event> collected;
+
+        for (int t = 0; t < file_.getTrackCount(); t++) {
+            const auto& track_events = file_[t];
+            for (int i = 0; i < track_events.getEventCount(); i++) {
+                const auto& event = track_events[i];
+                const int ch = event.getChannel();
+                if (event.isNoteOn()) {
+                    collected.push_back({event.tick, 0x90 | ch,
+                                         event.getKeyNumber(), event.getVelocity()});
+                } else if (event.isNoteOff()) {
+                    collected.push_back({event.tick, 0x80 | ch,
+                                         event.getKeyNumber(), event.getVelocity()});
+                } else if (event.isController()) {
+                    collected.push_back({event.tick, 0xB0 | ch,
+                                         event.getP1(), event.getP2()});
+                } else if (event.isTimbre()) {
+                    collected.push_back({event.tick, 0xC0 | ch, event.getP1(), 0});
+                } else if (event.isPitchbend()) {
+                    const int value = event.getP1() | (event.getP2() << 7);
+                    collected.push_back({event.tick, 0xE0 | ch,
+                                         value & 0x7F, (value >> 7) & 0x7F});
+                }
+            }
+        }
+
+        std::stable_sort(collected.begin(), collected.end(),
+                         [](const Event& a, const Event& b) { return a.tick < b.tick; });
+
+        nb::list events;
+        for (const auto& ev : collected) {
+            events.append(nb::make_tuple(ev.tick, ev.status, ev.data1, ev.data2));
+        }
+        return events;
+    }
+
+    // Tempo changes from all tracks as (tick, bpm) tuples, in track order
+    nb::list get_tempo_changes() const {
+        nb::list tempos;
+        for (int t = 0; t < file_.getTrackCount(); t++) {
+            const auto& track_events = file_[t];
+            for (int i = 0; i < track_events.getEventCount(); i++) {
+                const auto& event = track_events[i];
+                if (event.isTempo()) {
+                    tempos.append(nb::make_tuple(event.tick, event.getTempoBPM()));
+                }
+            }
+        }
+        return tempos;
+    }
+
     // Convert to absolute ticks
     void make_absolute_ticks() {
+        ++revision_;
         file_.makeAbsoluteTicks();
     }
 
     // Convert to delta ticks
     void make_delta_ticks() {
+        ++revision_;
         file_.makeDeltaTicks();
     }
 
     // Join all tracks into track 0 (Type 0 format)
     void join_tracks() {
+        ++revision_;
         file_.joinTracks();
     }
 
     // Split tracks (Type 1 format)
     void split_tracks() {
+        ++revision_;
         file_.splitTracks();
     }
 
 private:
     smf::MidiFile file_;
+    uint64_t revision_ = 0;
 };
 
 
@@ -2580,6 +3158,66 @@ private:
     }
 };
 
+// Incremental WAV writer: each write() interleaves one planar block into a
+// reused scratch vector and appends it, so rendering to disk never holds
+// the whole file in memory.
+class AudioWriter {
+public:
+    AudioWriter(const std::string& path, unsigned int channels,
+                unsigned int sample_rate, int bit_depth)
+        : channels_(channels)
+    {
+        char err[1024] = {0};
+        handle_ = mh_audio_writer_open(path.c_str(), channels, sample_rate,
+                                       bit_depth, err, sizeof(err));
+        if (!handle_) {
+            throw std::runtime_error(std::string(err));
+        }
+    }
+
+    ~AudioWriter() {
+        close();
+    }
+
+    AudioWriter(const AudioWriter&) = delete;
+    AudioWriter& operator=(const AudioWriter&) = delete;
+
+    void write(nb::ndarray<const float, nb::shape<-1, -1>, nb::c_contig, nb::device::cpu> data) {
+        if (!handle_) {
+            throw std::runtime_error("AudioWriter is closed");
+        }
+        size_t channels = data.shape(0);
+        size_t frames = data.shape(1);
+        if (channels != channels_) {
+            throw nb::value_error("block channel count does not match the writer");
+        }
+        scratch_.resize(channels * frames);
+        planar_to_interleaved(data.data(), scratch_.data(), channels, frames);
+
+        char err[1024] = {0};
+        if (!mh_audio_writer_write(handle_, scratch_.data(), (unsigned int)frames,
+                                   err, sizeof(err))) {
+            throw std::runtime_error(std::string(err));
+        }
+    }
+
+    void close() {
+        if (handle_) {
+            mh_audio_writer_close(handle_);
+            handle_ = nullptr;
+        }
+    }
+
+    AudioWriter& enter() {
+        return *this;
+    }
+
+private:
+    MH_AudioWriter* handle_ = nullptr;
+    size_t channels_;
+    std::vector<float> scratch_;
+};
+
 
 // Note: Async plugin loading in Python is best done using Python's threading module:
 //
@@ -2632,6 +3270,15 @@ NB_MODULE(_core, m) {
           nb::arg("directory_path"),
           "Scan a directory for plugins (VST3, AudioUnit). Returns list of plugin metadata dicts.");
 
+    // Bundle extensions scan_directory collects, from the native scanner's
+    // own table (so pure-Python discovery can match it exactly).
+    {
+        nb::list exts;
+        for (int i = 0; const char* ext = mh_scan_directory_extension(i); ++i)
+            exts.append(nb::str(ext));
+        m.attr("SCAN_DIRECTORY_EXTENSIONS") = nb::tuple(exts);
+    }
+
     // Session: shared format-manager state across loads/probes/scans.
     nb::class_<Session>(m, "Session")
         .def(nb::init<>(),
@@ -2708,6 +3355,9 @@ NB_MODULE(_core, m) {
           "Get list of available MIDI input ports. Returns list of dicts with 'name' and 'index'.");
     m.def("midi_get_output_ports", &midi_get_output_ports,
           "Get list of available MIDI output ports. Returns list of dicts with 'name' and 'index'.");
+    m.def("midi_port_generation", []() { return mh_midi_port_generation(); },
+          "Counter incremented whenever a MIDI port is added or removed. An unchanged "
+          "value means a previous port enumeration is still current.");
 
     // Audio device enumeration
     m.def("audio_get_playback_devices", &audio_get_playback_devices,
@@ -3038,6 +3688,38 @@ NB_MODULE(_core, m) {
              "Apply a per-channel gain in a single call. `gains` must be "
              "a sequence of floats with length equal to the buffer's "
              "channel count.")
+        .def("copy_from",
+             [](MhAudioBuffer& self,
+                int dest_channel, int dest_start,
+                const MhAudioBuffer& source,
+                int source_channel, int source_start,
+                int count) {
+                 if (dest_channel < 0 || dest_channel >= self.channels()) {
+                     throw nb::value_error("dest_channel out of range");
+                 }
+                 if (source_channel < 0 || source_channel >= source.channels()) {
+                     throw nb::value_error("source_channel out of range");
+                 }
+                 if (count < 0 || dest_start < 0
+                     || dest_start + count > self.frames()) {
+                     throw nb::value_error("dest range out of bounds");
+                 }
+                 if (source_start < 0
+                     || source_start + count > source.frames()) {
+                     throw nb::value_error("source range out of bounds");
+                 }
+                 self.juce().copyFrom(dest_channel, dest_start,
+                                      source.juce(),
+                                      source_channel, source_start,
+                                      count);
+             },
+             "dest_channel"_a, "dest_start"_a, "source"_a,
+             "source_channel"_a, "source_start"_a, "count"_a,
+             "Copy `count` samples from "
+             "source[source_channel, source_start : source_start+count] into "
+             "self[dest_channel, dest_start : dest_start+count], overwriting "
+             "the destination range. Unlike slice assignment, no temporary "
+             "buffer is allocated for the source slice.")
         .def("add_from",
              [](MhAudioBuffer& self,
                 int dest_channel, int dest_start,
@@ -3299,6 +3981,9 @@ NB_MODULE(_core, m) {
                      "Number of output channels")
         .def_prop_ro("latency_samples", &Plugin::latency_samples,
                      "Plugin latency in samples")
+        .def_prop_ro("max_block_size", &Plugin::max_block_size,
+                     "Largest block (frames per process call) the plugin was "
+                     "prepared for; size reusable process buffers from it")
         .def_prop_ro("tail_seconds", &Plugin::tail_seconds,
                      "Plugin tail length in seconds")
         .def_prop_ro("sidechain_channels", &Plugin::sidechain_channels,
@@ -3322,6 +4007,12 @@ NB_MODULE(_core, m) {
         .def("get_bus_info", &Plugin::get_bus_info,
              nb::arg("is_input"), nb::arg("bus_index"),
              "Get bus info as dict (name, num_channels, is_main, is_enabled)")
+        .def("get_bus_infos", &Plugin::get_bus_infos,
+             nb::arg("is_input"),
+             "Get bus info dicts for every input (or output) bus in one call")
+        .def("get_desc", &Plugin::get_desc,
+             "Get the plugin's description (same keys as probe()) without "
+             "re-probing the file")
 
         // Parameter access
         .def("get_param", &Plugin::get_param,
@@ -3333,6 +4024,16 @@ NB_MODULE(_core, m) {
         .def("get_param_info", &Plugin::get_param_info,
              nb::arg("index"),
              "Get parameter metadata as dict")
+        .def("get_param_infos", &Plugin::get_param_infos,
+             nb::arg("start") = 0, nb::arg("count") = -1,
+             nb::kw_only(), nb::arg("with_values") = false,
+             "Get metadata dicts for count parameters from start (count=-1: to "
+             "the end; the range is clamped to num_params) in one call. "
+             "with_values=True adds each normalized 'value'")
+        .def("get_params", &Plugin::get_params,
+             nb::arg("start") = 0, nb::arg("count") = -1,
+             "Get normalized values for count parameters from start (count=-1: to "
+             "the end; the range is clamped to num_params) as a list of floats")
         .def("find_param", &Plugin::find_param,
              nb::arg("name"),
              "Find parameter index by name (case-insensitive). Raises RuntimeError if not found.")
@@ -3371,15 +4072,25 @@ NB_MODULE(_core, m) {
         .def("get_program_name", &Plugin::get_program_name,
              nb::arg("index"),
              "Get name of factory preset at index")
+        .def("get_program_names", &Plugin::get_program_names,
+             nb::arg("start") = 0, nb::arg("count") = -1,
+             "Get names of count factory presets from start (count=-1: to the "
+             "end; the range is clamped to num_programs) in one call")
         .def_prop_rw("program", &Plugin::get_program, &Plugin::set_program,
                      "Current factory preset index")
 
         // State
         .def("get_state", &Plugin::get_state,
              "Get plugin state as bytes")
+        .def("get_state_into", &Plugin::get_state_into,
+             nb::arg("out"),
+             "Write plugin state into a bytearray, growing it if too small, and "
+             "return the number of bytes written. Reusing one bytearray avoids "
+             "allocating a new bytes object per snapshot; pass "
+             "memoryview(out)[:n] to set_state().")
         .def("set_state", &Plugin::set_state,
              nb::arg("data"),
-             "Restore plugin state from bytes")
+             "Restore plugin state from a bytes-like object")
 
         // Bypass
         .def_prop_rw("bypass", &Plugin::get_bypass, &Plugin::set_bypass,
@@ -3411,32 +4122,61 @@ NB_MODULE(_core, m) {
 
         // Process
         .def("process", &Plugin::process,
-             nb::arg("input"), nb::arg("output"),
-             "Process audio (shape: [channels, frames])")
+             nb::arg("input"), nb::arg("output").noconvert(),
+             "Process audio (shape: [channels, frames]). input is converted to "
+             "C-contiguous float32 if needed (a copy); output is written in place "
+             "and must already be C-contiguous float32 (or an AudioBuffer), "
+             "otherwise TypeError is raised. See minihost.as_audio().")
+        // input is noconvert too: a float array would otherwise be cast to
+        // int16 by truncation, silently turning [-1, 1] audio into zeros.
+        .def("process_int16", &Plugin::process_int16,
+             nb::arg("input").noconvert(), nb::arg("output").noconvert(),
+             "Process 16-bit PCM audio (int16 arrays, shape: [channels, frames]). "
+             "Samples are scaled to float32 (x / 32768) for the plugin and the "
+             "result is rounded and clamped back to int16. Halves the memory of "
+             "float32 buffers for callers that hold PCM data. Both buffers must "
+             "already be int16; other dtypes raise TypeError.")
+        .def("process_planar", &Plugin::process_planar,
+             nb::arg("inputs"), nb::arg("outputs").noconvert(),
+             "Process audio held as lists of 1-D float32 arrays, one per channel. "
+             "All channels must have the same length. Each channel is used in place, "
+             "so channels can live in separate buffers. Outputs must be C-contiguous "
+             "float32 (they are written in place, never converted).")
         .def("process_midi", &Plugin::process_midi,
-             nb::arg("input"), nb::arg("output"), nb::arg("midi_in"),
+             nb::arg("input"), nb::arg("output").noconvert(), nb::arg("midi_in"),
              nb::arg("midi_out_capacity") = MIDI_OUT_CAPACITY,
-             "Process audio with MIDI. midi_in: list of (sample_offset, status, data1, data2). "
+             "Process audio with MIDI. midi_in: list of (sample_offset, status, data1, data2), "
+             "or a structured array from minihost.make_midi_events(). "
              "Returns the list of output MIDI events. At most midi_out_capacity "
              "(default 256) events are returned; a returned count equal to "
              "midi_out_capacity means output may have been truncated -- raise it if so.")
         .def("process_auto", &Plugin::process_auto,
-             nb::arg("input"), nb::arg("output"), nb::arg("midi_in"), nb::arg("param_changes"),
+             nb::arg("input"), nb::arg("output").noconvert(), nb::arg("midi_in"), nb::arg("param_changes"),
              nb::arg("midi_out_capacity") = MIDI_OUT_CAPACITY,
-             "Process with sample-accurate automation. param_changes: list of (sample_offset, param_index, value). "
+             "Process with sample-accurate automation. param_changes: list of (sample_offset, param_index, value), "
+             "or a structured array from minihost.make_param_changes(). "
              "Returns the list of output MIDI events (capped at midi_out_capacity, default 256).")
         .def("process_sidechain", &Plugin::process_sidechain,
-             nb::arg("main_in"), nb::arg("main_out"), nb::arg("sidechain_in"),
+             nb::arg("main_in"), nb::arg("main_out").noconvert(), nb::arg("sidechain_in"),
              "Process audio with sidechain input (all arrays shape: [channels, frames])")
 
         // Double precision processing
         .def_prop_ro("supports_double", &Plugin::supports_double,
                      "True if plugin supports native double precision processing")
         .def("process_double", &Plugin::process_double,
-             nb::arg("input"), nb::arg("output"),
+             nb::arg("input"), nb::arg("output").noconvert(),
              "Process audio with double precision (float64). Shape: "
              "[channels, frames]. Accepts float64 numpy arrays or AudioBufferD "
              "(via DLPack) -- the latter needs no numpy.")
+        // input is noconvert too: a float64 input paired with a float32
+        // output would otherwise be narrowed to float32 before processing.
+        .def("process_double", &Plugin::process_double_f32,
+             nb::arg("input").noconvert(), nb::arg("output").noconvert(),
+             "float32 overload: the plugin still processes in double precision; "
+             "samples go through a reused per-plugin float64 workspace, so "
+             "float32 arrays (or AudioBuffer) need no float64 copies. Both "
+             "buffers must be float32; a float64 input with a float32 output "
+             "raises TypeError rather than being narrowed.")
 
         // Processing precision
         .def_prop_rw("processing_precision",
@@ -3560,15 +4300,15 @@ NB_MODULE(_core, m) {
 
         // Process
         .def("process", &PluginChain::process,
-             nb::arg("input"), nb::arg("output"),
+             nb::arg("input"), nb::arg("output").noconvert(),
              "Process audio through the chain (shape: [channels, frames])")
         .def("process_midi", &PluginChain::process_midi,
-             nb::arg("input"), nb::arg("output"), nb::arg("midi_in"),
+             nb::arg("input"), nb::arg("output").noconvert(), nb::arg("midi_in"),
              nb::arg("midi_out_capacity") = MIDI_OUT_CAPACITY,
              "Process audio with MIDI (to first plugin). midi_in: list of (sample_offset, status, data1, data2). "
              "Returns the list of output MIDI events (capped at midi_out_capacity, default 256).")
         .def("process_auto", &PluginChain::process_auto,
-             nb::arg("input"), nb::arg("output"), nb::arg("midi_in"), nb::arg("param_changes"),
+             nb::arg("input"), nb::arg("output").noconvert(), nb::arg("midi_in"), nb::arg("param_changes"),
              nb::arg("midi_out_capacity") = MIDI_OUT_CAPACITY,
              "Process with sample-accurate automation. param_changes: list of (sample_offset, plugin_index, param_index, value). "
              "Returns the list of output MIDI events (capped at midi_out_capacity, default 256).")
@@ -3621,11 +4361,11 @@ NB_MODULE(_core, m) {
         .def_prop_ro("tail_seconds", &PluginBus::tail_seconds,
                      "Maximum tail across all branches.")
         .def("process", &PluginBus::process,
-             nb::arg("input"), nb::arg("output"),
+             nb::arg("input"), nb::arg("output").noconvert(),
              "Fan input to every branch, sum branch outputs (each "
              "scaled by its gain) into output.")
         .def("process_midi", &PluginBus::process_midi,
-             nb::arg("input"), nb::arg("output"), nb::arg("midi_in"),
+             nb::arg("input"), nb::arg("output").noconvert(), nb::arg("midi_in"),
              nb::arg("midi_out_capacity") = MIDI_OUT_CAPACITY,
              "Fan input audio and MIDI to every branch (MIDI goes to "
              "each branch's first plugin), then sum branch outputs "
@@ -3862,6 +4602,15 @@ NB_MODULE(_core, m) {
         .def("send_midi", &AudioDevice::send_midi,
              nb::arg("status"), nb::arg("data1"), nb::arg("data2"),
              "Send a MIDI event to the plugin (e.g., send_midi(0x90, 60, 100) for note on)")
+        .def("send_midi_batch", &AudioDevice::send_midi_batch,
+             nb::arg("events"),
+             "Send several MIDI events in one call. events is a uint8 array of shape (N, 3) "
+             "holding (status, data1, data2) rows. The batch is queued as a unit, so a chord "
+             "lands in the same audio buffer; raises RuntimeError (queuing nothing) if the "
+             "queue lacks room for all N events.")
+        .def("all_notes_off", &AudioDevice::all_notes_off,
+             "Send All Notes Off (CC 123) on all 16 MIDI channels as one batch, "
+             "silencing every held note in the same audio buffer.")
 
         // Audio input for effect processing (lock-free ring buffer)
         .def("enable_input", &AudioDevice::enable_input,
@@ -3900,8 +4649,24 @@ NB_MODULE(_core, m) {
             self.close();
         });
 
+    nb::class_<AudioWriter>(m, "AudioWriter",
+        "Incremental WAV writer. Append (channels, frames) float32 blocks "
+        "with write(); close() finalizes the header.")
+        .def(nb::init<const std::string&, unsigned int, unsigned int, int>(),
+             nb::arg("path"), nb::arg("channels"), nb::arg("sample_rate"),
+             nb::arg("bit_depth") = 24,
+             "Open a WAV file for writing (bit_depth 16, 24, or 32 = float).")
+        .def("write", &AudioWriter::write, nb::arg("data"),
+             "Append a block of shape (channels, frames).")
+        .def("close", &AudioWriter::close,
+             "Finalize the WAV header and close the file")
+        .def("__enter__", &AudioWriter::enter, nb::rv_policy::reference)
+        .def("__exit__", [](AudioWriter& self, const nb::args&) {
+            self.close();
+        });
+
     // MidiFile class for MIDI file read/write
-    nb::class_<MidiFile>(m, "MidiFile")
+    nb::class_<MidiFile>(m, "MidiFile", nb::is_weak_referenceable())
         .def(nb::init<>(),
              "Create a new empty MIDI file")
 
@@ -3920,6 +4685,8 @@ NB_MODULE(_core, m) {
                      "Ticks per quarter note (resolution)")
         .def_prop_ro("duration_seconds", &MidiFile::duration_seconds,
                      "Total duration in seconds")
+        .def_prop_ro("revision", &MidiFile::revision,
+                     "Counter bumped by every load or edit (for cache invalidation)")
 
         // Track management
         .def("add_track", &MidiFile::add_track,
@@ -3949,6 +4716,11 @@ NB_MODULE(_core, m) {
         .def("get_events", &MidiFile::get_events,
              nb::arg("track"),
              "Get all events from a track as a list of dicts")
+        .def("get_channel_events", &MidiFile::get_channel_events,
+             "Get note, CC, program change and pitch bend events from all tracks "
+             "as (tick, status, data1, data2) tuples sorted by tick")
+        .def("get_tempo_changes", &MidiFile::get_tempo_changes,
+             "Get tempo changes from all tracks as (tick, bpm) tuples")
 
         // Track format conversion
         .def("make_absolute_ticks", &MidiFile::make_absolute_ticks,
@@ -3963,23 +4735,56 @@ NB_MODULE(_core, m) {
     // Audio file I/O functions
     m.def("audio_read", [](const std::string& path) {
         char err[1024] = {0};
-        MH_AudioData* data = mh_audio_read(path.c_str(), err, sizeof(err));
-        if (!data) {
+        std::unique_ptr<MH_AudioReader, decltype(&mh_audio_reader_close)> reader(
+            mh_audio_reader_open(path.c_str(), err, sizeof(err)),
+            &mh_audio_reader_close);
+        if (!reader) {
             throw std::runtime_error(std::string(err));
         }
 
-        unsigned int channels = data->channels;
-        unsigned int frames = data->frames;
-        unsigned int sample_rate = data->sample_rate;
-
-        // De-interleave directly into a fresh AudioBuffer. Avoids the
-        // numpy detour: this binding does not require numpy at all.
-        auto* buf = new MhAudioBuffer((int)channels, (int)frames);
-        interleaved_to_planar(data->data, buf->data(), channels, frames);
-        mh_audio_data_free(data);
+        const unsigned int channels = mh_audio_reader_channels(reader.get());
+        const unsigned int sample_rate = mh_audio_reader_sample_rate(reader.get());
+
+        // Decode block by block, de-interleaving straight into the
+        // AudioBuffer, so the file is never held interleaved in full next
+        // to the planar copy. The buffer is sized from the decoder's
+        // reported length; a stream that reports none, or runs past it,
+        // grows by doubling, and one that ends early is trimmed. Avoids
+        // the numpy detour: this binding does not require numpy at all.
+        const unsigned long long length = mh_audio_reader_length(reader.get());
+        if (length > (unsigned long long)INT_MAX) {
+            throw std::runtime_error("Audio file too long: " + path);
+        }
+        int capacity = length > 0 ? (int)length : (int)AUDIO_READ_BLOCK;
+        std::unique_ptr<MhAudioBuffer> buf(
+            new MhAudioBuffer((int)channels, capacity));
+        std::vector<float> block((size_t)AUDIO_READ_BLOCK * channels);
+
+        int frames = 0;
+        for (;;) {
+            unsigned int n = mh_audio_reader_read(reader.get(), block.data(),
+                                                  AUDIO_READ_BLOCK);
+            if (n == 0) break;
+            if ((long long)frames + n > (long long)INT_MAX) {
+                throw std::runtime_error("Audio file too long: " + path);
+            }
+            if (frames + (int)n > capacity) {
+                long long grown = std::max<long long>((long long)capacity * 2,
+                                                      (long long)frames + n);
+                capacity = (int)std::min<long long>(grown, INT_MAX);
+                buf.reset(resized_copy(*buf, capacity, frames));
+            }
+            interleaved_to_planar_strided(block.data(),
+                                          buf->data() + frames,
+                                          channels, n, (size_t)capacity);
+            frames += (int)n;
+        }
+        if (frames != capacity) {
+            buf.reset(resized_copy(*buf, frames, frames));
+        }
 
         return nb::make_tuple(
-            nb::cast(buf, nb::rv_policy::take_ownership),
+            nb::cast(buf.release(), nb::rv_policy::take_ownership),
             sample_rate);
     }, nb::arg("path"),
        "Read an audio file. Returns (AudioBuffer, sample_rate) where "
@@ -11,6 +11,14 @@ from numpy.typing import NDArray
 # the binding consumes whatever the buffer-protocol layer produces.
 AudioInput = Union["AudioBuffer", NDArray[np.float32]]
 
+# MIDI input to the process_* methods: a list of (sample_offset, status,
+# data1, data2) tuples, or a structured array from minihost.make_midi_events.
+MidiInput = Union[list[tuple[int, int, int, int]], NDArray[Any]]
+
+# Automation for Plugin.process_auto: a list of (sample_offset, param_index,
+# value) tuples, or a structured array from minihost.make_param_changes.
+ParamChangeInput = Union[list[tuple[int, int, float]], NDArray[Any]]
+
 class AudioBuffer:
     """Planar float32 audio buffer (stdlib-only; backed by juce::AudioBuffer)."""
 
@@ -38,6 +46,15 @@ class AudioBuffer:
         self, start: int, count: int, gain_start: float, gain_end: float
     ) -> None: ...
     def apply_gain_per_channel(self, gains: list[float]) -> None: ...
+    def copy_from(
+        self,
+        dest_channel: int,
+        dest_start: int,
+        source: "AudioBuffer",
+        source_channel: int,
+        source_start: int,
+        count: int,
+    ) -> None: ...
     def add_from(
         self,
         dest_channel: int,
@@ -102,6 +119,15 @@ class AudioBufferD:
         self, start: int, count: int, gain_start: float, gain_end: float
     ) -> None: ...
     def apply_gain_per_channel(self, gains: list[float]) -> None: ...
+    def copy_from(
+        self,
+        dest_channel: int,
+        dest_start: int,
+        source: "AudioBufferD",
+        source_channel: int,
+        source_start: int,
+        count: int,
+    ) -> None: ...
     def add_from(
         self,
         dest_channel: int,
@@ -175,6 +201,8 @@ class Plugin:
     @property
     def latency_samples(self) -> int: ...
     @property
+    def max_block_size(self) -> int: ...
+    @property
     def tail_seconds(self) -> float: ...
     @property
     def sidechain_channels(self) -> int: ...
@@ -215,6 +243,8 @@ class Plugin:
     @processing_precision.setter
     def processing_precision(self, value: int) -> None: ...
     def get_bus_info(self, is_input: bool, bus_index: int) -> dict[str, Any]: ...
+    def get_bus_infos(self, is_input: bool) -> list[dict[str, Any]]: ...
+    def get_desc(self) -> dict[str, Any]: ...
     def check_buses_layout(
         self, input_channels: list[int], output_channels: list[int]
     ) -> bool: ...
@@ -239,11 +269,17 @@ class Plugin:
     def get_param_by_name(self, name: str) -> float: ...
     def set_param_by_name(self, name: str, value: float) -> None: ...
     def get_param_info(self, index: int) -> dict[str, Any]: ...
+    def get_param_infos(
+        self, start: int = 0, count: int = -1, *, with_values: bool = False
+    ) -> list[dict[str, Any]]: ...
+    def get_params(self, start: int = 0, count: int = -1) -> list[float]: ...
     def param_to_text(self, index: int, value: float) -> str: ...
     def param_from_text(self, index: int, text: str) -> float: ...
     def get_program_name(self, index: int) -> str: ...
+    def get_program_names(self, start: int = 0, count: int = -1) -> list[str]: ...
     def get_state(self) -> bytes: ...
-    def set_state(self, data: bytes) -> None: ...
+    def get_state_into(self, out: bytearray) -> int: ...
+    def set_state(self, data: bytes | bytearray | memoryview) -> None: ...
     def reset(self) -> None: ...
     def set_transport(
         self,
@@ -264,18 +300,28 @@ class Plugin:
         input: AudioInput,
         output: AudioInput,
     ) -> None: ...
+    def process_int16(
+        self,
+        input: NDArray[np.int16],
+        output: NDArray[np.int16],
+    ) -> None: ...
+    def process_planar(
+        self,
+        inputs: list[NDArray[np.float32]],
+        outputs: list[NDArray[np.float32]],
+    ) -> None: ...
     def process_midi(
         self,
         input: AudioInput,
         output: AudioInput,
-        midi_in: list[tuple[int, int, int, int]],
+        midi_in: MidiInput,
     ) -> list[tuple[int, int, int, int]]: ...
     def process_auto(
         self,
         input: AudioInput,
         output: AudioInput,
-        midi_in: list[tuple[int, int, int, int]],
-        param_changes: list[tuple[int, int, float]],
+        midi_in: MidiInput,
+        param_changes: ParamChangeInput,
     ) -> list[tuple[int, int, int, int]]: ...
     def process_sidechain(
         self,
@@ -283,11 +329,18 @@ class Plugin:
         main_out: AudioInput,
         sidechain_in: AudioInput,
     ) -> None: ...
+    @overload
     def process_double(
         self,
         input: NDArray[np.float64],
         output: NDArray[np.float64],
     ) -> None: ...
+    @overload
+    def process_double(
+        self,
+        input: AudioInput,
+        output: AudioInput,
+    ) -> None: ...
     def morph_capture(self) -> list[float]:
         """Snapshot every parameter's current normalized value."""
         ...
@@ -328,13 +381,13 @@ class PluginChain:
         self,
         input: AudioInput,
         output: AudioInput,
-        midi_in: list[tuple[int, int, int, int]],
+        midi_in: MidiInput,
     ) -> list[tuple[int, int, int, int]]: ...
     def process_auto(
         self,
         input: AudioInput,
         output: AudioInput,
-        midi_in: list[tuple[int, int, int, int]],
+        midi_in: MidiInput,
         param_changes: list[tuple[int, int, int, float]],
     ) -> list[tuple[int, int, int, int]]: ...
     def close(self) -> None: ...
@@ -373,7 +426,7 @@ class PluginBus:
         self,
         input: AudioInput,
         output: AudioInput,
-        midi_in: list[tuple[int, int, int, int]],
+        midi_in: MidiInput,
     ) -> None: ...
     def close(self) -> None: ...
     def __enter__(self) -> "PluginBus": ...
@@ -487,6 +540,8 @@ class AudioDevice:
     def create_virtual_midi_input(self, port_name: str) -> None: ...
     def create_virtual_midi_output(self, port_name: str) -> None: ...
     def send_midi(self, status: int, data1: int, data2: int) -> None: ...
+    def send_midi_batch(self, events: NDArray[np.uint8]) -> None: ...
+    def all_notes_off(self) -> None: ...
     def enable_input(self, capacity_frames: int = 0) -> None: ...
     def disable_input(self) -> None: ...
     def write_input(self, data: AudioInput) -> int: ...
@@ -507,6 +562,8 @@ class MidiFile:
     def ticks_per_quarter(self, value: int) -> None: ...
     @property
     def duration_seconds(self) -> float: ...
+    @property
+    def revision(self) -> int: ...
     def load(self, path: str) -> bool: ...
     def save(self, path: str) -> bool: ...
     def add_track(self) -> int: ...
@@ -527,6 +584,8 @@ class MidiFile:
         self, track: int, tick: int, channel: int, value: int
     ) -> None: ...
     def get_events(self, track: int) -> list[dict[str, Any]]: ...
+    def get_channel_events(self) -> list[tuple[int, int, int, int]]: ...
+    def get_tempo_changes(self) -> list[tuple[int, float]]: ...
     def make_absolute_ticks(self) -> None: ...
     def make_delta_ticks(self) -> None: ...
     def join_tracks(self) -> None: ...
@@ -543,6 +602,18 @@ class MidiIn:
     def __enter__(self) -> "MidiIn": ...
     def __exit__(self, *args: object) -> None: ...
 
+class AudioWriter:
+    """Incremental WAV writer. Append (channels, frames) float32 blocks
+    with write(); close() finalizes the header."""
+
+    def __init__(
+        self, path: str, channels: int, sample_rate: int, bit_depth: int = 24
+    ) -> None: ...
+    def write(self, data: AudioInput) -> None: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> "AudioWriter": ...
+    def __exit__(self, *args: object) -> None: ...
+
 def probe(path: str) -> dict[str, Any]:
     """Get plugin metadata without full instantiation."""
     ...
@@ -551,6 +622,9 @@ def scan_directory(directory_path: str) -> list[dict[str, Any]]:
     """Scan a directory for plugins (VST3, AudioUnit)."""
     ...
 
+# Bundle extensions scan_directory collects (e.g. ".vst3").
+SCAN_DIRECTORY_EXTENSIONS: tuple[str, ...]
+
 def midi_get_input_ports() -> list[dict[str, Any]]:
     """Get list of available MIDI input ports."""
     ...
@@ -559,6 +633,10 @@ def midi_get_output_ports() -> list[dict[str, Any]]:
     """Get list of available MIDI output ports."""
     ...
 
+def midi_port_generation() -> int:
+    """Counter incremented whenever a MIDI port is added or removed."""
+    ...
+
 def audio_get_playback_devices() -> list[dict[str, Any]]:
     """Get list of available audio playback (output) devices.
 
@@ -0,0 +1,44 @@
+"""Level metrics over audio buffers, without full-size temporaries.
+
+``np.max(np.abs(x))`` materializes ``|x|`` as a second buffer the size of
+the input before reducing it. The peak absolute value is equally
+``max(x.max(), -x.min())``: two in-place reductions that allocate
+nothing, which matters once renders run to millions of samples. Integer
+extremes are negated as Python ints, so ``-32768`` in an int16 buffer
+cannot wrap around the way ``np.abs`` does.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "minihost metrics require numpy. Install minihost with the numpy "
+            "extra: 'pip install minihost[numpy]'."
+        ) from e
+    return np
+
+
+def peak(buf: Any) -> float:
+    """Return the peak absolute sample value of ``buf`` (0.0 if empty).
+
+    Accepts a numpy array of any shape or anything ``numpy.asarray``
+    understands (e.g. an ``AudioBuffer``, which it views without copying).
+    Float and integer samples are supported; anything else raises
+    ``TypeError``. A NaN anywhere in a float buffer makes the result NaN,
+    as with ``np.max(np.abs(buf))``.
+    """
+    np = _require_numpy()
+    a = np.asarray(buf)
+    if a.dtype.kind not in "fiub":
+        raise TypeError(f"peak() needs float or integer samples, got {a.dtype}")
+    if a.size == 0:
+        return 0.0
+    if a.dtype.kind == "f":
+        return float(np.maximum(a.max(), -a.min()))
+    return float(max(int(a.max()), -int(a.min())))
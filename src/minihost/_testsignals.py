@@ -0,0 +1,74 @@
+"""Test-signal generators that write into pre-allocated float32 buffers.
+
+Used by the examples and the test suite to drive plugins with something
+more realistic than silence. Each ``fill_*`` function overwrites ``buf``
+in place (every channel receives the same signal) and works on a 2-D
+``(channels, frames)`` or 1-D ``(frames,)`` numpy array, so a caller can
+allocate one buffer up front and refill it per block without further
+allocation of the output.
+
+The sine generator is phase-continuous across blocks: pass the returned
+sample position back in as ``phase`` for the next block.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "minihost test signals require numpy. Install minihost with the "
+            "numpy extra: 'pip install minihost[numpy]'."
+        ) from e
+    return np
+
+
+def fill_sine(
+    buf: Any,
+    freq: float,
+    sample_rate: float,
+    phase: int = 0,
+    amplitude: float = 1.0,
+) -> int:
+    """Fill ``buf`` with a sine wave starting at sample position ``phase``.
+
+    Returns:
+        The sample position following the block (``phase + frames``), to
+        pass as ``phase`` on the next call for a continuous tone.
+    """
+    np = _require_numpy()
+    frames = buf.shape[-1]
+    # One float64 ramp per call, transformed in place; the final assignment
+    # broadcasts it into every channel and casts to the buffer's dtype.
+    t = np.arange(phase, phase + frames, dtype=np.float64)
+    t *= 2.0 * math.pi * freq / sample_rate
+    np.sin(t, out=t)
+    if amplitude != 1.0:
+        t *= amplitude
+    buf[...] = t
+    return phase + frames
+
+
+def fill_noise(buf: Any, amplitude: float = 1.0, seed: int | None = None) -> None:
+    """Fill ``buf`` with uniform white noise in ``[-amplitude, amplitude)``."""
+    np = _require_numpy()
+    rng = np.random.default_rng(seed)
+    frames = buf.shape[-1]
+    noise = rng.random(frames, dtype=np.float32)
+    noise *= 2.0 * amplitude
+    noise -= amplitude
+    buf[...] = noise
+
+
+def fill_impulse(buf: Any, position: int = 0, amplitude: float = 1.0) -> None:
+    """Fill ``buf`` with silence and a single impulse at ``position``."""
+    frames = buf.shape[-1]
+    if not 0 <= position < frames:
+        raise ValueError(f"position must be in [0, {frames}), got {position}")
+    buf[...] = 0.0
+    buf[..., position] = amplitude
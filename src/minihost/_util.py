@@ -0,0 +1,44 @@
+"""Small array helpers shared by the examples and the pure-Python modules.
+
+The process entry points take ``(channels, frames)`` float32 arrays in C
+(row-major) order. An input that is not already in that form -- a column
+slice ``arr[:, a:b]``, a transpose, a float64 array -- is converted by the
+binding, which costs a hidden copy on every block. Output arrays are
+written in place and are never converted: a non-contiguous or non-float32
+output is rejected with ``TypeError``, since writing into a temporary copy
+would silently discard the result.
+
+``as_audio`` makes the conversion explicit, once, at the call site.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "as_audio requires numpy. Install minihost with the numpy extra: "
+            "'pip install minihost[numpy]'."
+        ) from e
+    return np
+
+
+def as_audio(arr: Any) -> Any:
+    """Return ``arr`` as a C-contiguous float32 array, copying only if needed.
+
+    An array that is already C-contiguous float32 is returned unchanged
+    (same object), so calling this on every block is free for buffers
+    that are already in the right form.
+    """
+    np = _require_numpy()
+    if (
+        isinstance(arr, np.ndarray)
+        and arr.dtype == np.float32
+        and arr.flags.c_contiguous
+    ):
+        return arr
+    return np.ascontiguousarray(arr, dtype=np.float32)
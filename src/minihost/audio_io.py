@@ -2,7 +2,8 @@
 
 Uses miniaudio (via C bindings) for reading and writing audio files.
 Supports reading WAV, FLAC, MP3, and Vorbis. Writing supports WAV
-(16/24/32-bit) and FLAC (16/24-bit).
+(16/24/32-bit) and FLAC (16/24-bit); WAV can also be written block by
+block with ``open_audio_writer``.
 
 The default container type is :class:`minihost.AudioBuffer` (stdlib-only,
 backed by ``juce::AudioBuffer<float>``). numpy is supported but optional;
@@ -14,22 +15,25 @@ implementing the buffer protocol.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any
 
-from minihost._core import AudioBuffer
+from minihost._core import AudioBuffer, AudioWriter
 from minihost._core import audio_get_file_info as _get_info
 from minihost._core import audio_read as _read
 from minihost._core import audio_resample as _resample
 from minihost._core import audio_write as _write
+from minihost._util import as_audio
 
 # Extensions supported for reading
-_READ_EXTENSIONS = {".wav", ".flac", ".mp3", ".ogg"}
+_READ_EXTENSIONS = frozenset({".wav", ".flac", ".mp3", ".ogg"})
 
-# Extensions supported for writing
-_WRITE_EXTENSIONS = {".wav", ".flac"}
-
-_VALID_BIT_DEPTHS = {16, 24, 32}
+# Extensions supported for writing, mapped to the bit depths each accepts
+_WRITE_BIT_DEPTHS = {
+    ".wav": frozenset({16, 24, 32}),
+    ".flac": frozenset({16, 24}),
+}
 
 
 def _require_numpy(feature: str):
@@ -44,6 +48,18 @@ def _require_numpy(feature: str):
     return _np
 
 
+def _existing_file(path: str | Path) -> str:
+    """Return ``path`` as a str after one stat confirming it is a file.
+
+    The str goes straight to the C binding, so no ``Path`` object is built
+    just to call ``exists()`` and convert it back.
+    """
+    path_str = os.fspath(path)
+    if not os.path.isfile(path_str):
+        raise FileNotFoundError(f"Audio file not found: {path_str}")
+    return path_str
+
+
 def read_audio(
     path: str | Path,
     as_: type | None = None,
@@ -62,20 +78,27 @@ def read_audio(
         ``(channels, samples)`` and is the type requested via ``as_``.
 
     Raises:
-        FileNotFoundError: If the file does not exist.
+        ValueError: If the extension is not one of the readable formats.
+        FileNotFoundError: If the path does not exist or is not a file.
         RuntimeError: If the file cannot be read.
         ImportError: If ``as_=numpy.ndarray`` is requested but numpy is
             not installed.
         TypeError: If ``as_`` is not a recognized container type.
     """
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Audio file not found: {path}")
+    # Checked before touching the filesystem, so scanning a directory of
+    # mixed files doesn't stat the ones that could never be read.
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in _READ_EXTENSIONS:
+        raise ValueError(
+            f"Unsupported audio format for reading: '{ext}'. "
+            f"Supported: WAV (.wav), FLAC (.flac), MP3 (.mp3), Vorbis (.ogg)."
+        )
+    path = _existing_file(path)
 
     try:
         # The C binding now returns an AudioBuffer directly; no numpy
         # involved on the read path even if as_=numpy.ndarray.
-        data, sample_rate = _read(str(path))
+        data, sample_rate = _read(path)
     except RuntimeError as e:
         raise RuntimeError(f"Failed to read audio file: {path}: {e}") from e
 
@@ -116,22 +139,23 @@ def write_audio(
     Raises:
         ValueError: If bit_depth is invalid or extension is unsupported.
     """
-    path = Path(path)
-    ext = path.suffix.lower()
+    path_str = os.fspath(path)
+    ext = os.path.splitext(path_str)[1].lower()
 
-    if ext not in _WRITE_EXTENSIONS:
+    bit_depths = _WRITE_BIT_DEPTHS.get(ext)
+    if bit_depths is None:
         raise ValueError(
             f"Unsupported audio format for writing: '{ext}'. "
             f"Supported: WAV (.wav), FLAC (.flac)."
         )
 
-    if ext == ".flac" and bit_depth == 32:
-        raise ValueError(
-            "FLAC does not support 32-bit float. Use 16 or 24-bit, "
-            "or use WAV for 32-bit float."
-        )
-
-    if bit_depth not in _VALID_BIT_DEPTHS:
+    if bit_depth not in bit_depths:
+        # 32 is only missing from the FLAC set.
+        if bit_depth == 32:
+            raise ValueError(
+                "FLAC does not support 32-bit float. Use 16 or 24-bit, "
+                "or use WAV for 32-bit float."
+            )
         raise ValueError(f"bit_depth must be 16, 24, or 32, got {bit_depth}")
 
     if bwf is not None and ext != ".wav":
@@ -144,12 +168,52 @@ def write_audio(
         write_data = data
     else:
         # Lazy: only require numpy if the input isn't already an AudioBuffer.
-        np = _require_numpy("write_audio with non-AudioBuffer input")
-        write_data = np.ascontiguousarray(data, dtype=np.float32)
+        # as_audio hands back an array that is already C-contiguous float32
+        # unchanged, so the usual render_midi output is written without a
+        # copy.
+        _require_numpy("write_audio with non-AudioBuffer input")
+        write_data = as_audio(data)
         if write_data.ndim == 1:
             write_data = write_data.reshape(1, -1)
 
-    _write(str(path), write_data, int(sample_rate), bit_depth, bwf)
+    _write(path_str, write_data, int(sample_rate), bit_depth, bwf)
+
+
+def open_audio_writer(
+    path: str | Path,
+    channels: int,
+    sample_rate: int,
+    bit_depth: int = 24,
+) -> AudioWriter:
+    """Open a WAV file for incremental (block-by-block) writing.
+
+    Each ``write(block)`` appends a ``(channels, frames)`` float32 block
+    (an ``AudioBuffer`` or a C-contiguous numpy array); ``close()``, or
+    leaving a ``with`` block, finalizes the header. Only one block is held
+    in memory at a time, unlike ``write_audio``, which takes the whole
+    signal at once.
+
+    Args:
+        path: Output file path (.wav).
+        channels: Channel count of every block written.
+        sample_rate: Sample rate in Hz.
+        bit_depth: Bit depth (16, 24, or 32). Default 24. 16 and 24 write
+            integer PCM; 32 writes IEEE float.
+
+    Raises:
+        ValueError: If the extension is not .wav or bit_depth is invalid.
+        RuntimeError: If the file cannot be opened for writing.
+    """
+    path_str = os.fspath(path)
+    ext = os.path.splitext(path_str)[1].lower()
+    if ext != ".wav":
+        raise ValueError(
+            f"Unsupported audio format for incremental writing: '{ext}'. "
+            f"Supported: WAV (.wav)."
+        )
+    if bit_depth not in _WRITE_BIT_DEPTHS[".wav"]:
+        raise ValueError(f"bit_depth must be 16, 24, or 32, got {bit_depth}")
+    return AudioWriter(path_str, int(channels), int(sample_rate), bit_depth)
 
 
 def resample(
@@ -185,7 +249,7 @@ def resample(
     np = _require_numpy("resample with non-AudioBuffer input")
     is_numpy = isinstance(data, np.ndarray)
 
-    arr = np.ascontiguousarray(data, dtype=np.float32)
+    arr = as_audio(data)
     if arr.ndim == 1:
         arr = arr.reshape(1, -1)
     out = _resample(arr, int(sample_rate_in), int(sample_rate_out))  # AudioBuffer
@@ -205,10 +269,7 @@ def get_audio_info(path: str | Path) -> dict:
         Dict with keys: channels, sample_rate, frames, duration.
 
     Raises:
-        FileNotFoundError: If the file does not exist.
+        FileNotFoundError: If the path does not exist or is not a file.
     """
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Audio file not found: {path}")
-
-    return dict(_get_info(str(path)))
+    # The binding builds a new dict per call; no defensive copy needed.
+    return _get_info(_existing_file(path))
@@ -18,8 +18,9 @@ Keyframe time formats:
 from __future__ import annotations
 
 import json
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from minihost._core import Plugin
@@ -30,7 +31,9 @@ def find_param_by_name(plugin: Plugin, name: str) -> int:
 
     Thin wrapper around ``Plugin.find_param`` that translates the C++
     binding's ``RuntimeError`` into ``ValueError`` for the public Python
-    contract and adds a CLI-discovery hint to the message.
+    contract and adds a CLI-discovery hint to the message. The native
+    lookup keeps its own name -> index cache per plugin, so resolving many
+    names against one plugin needs no index of its own.
 
     Args:
         plugin: Plugin instance.
@@ -113,19 +116,73 @@ def _parse_time_key(key: str, sample_rate: int, total_length_samples: int) -> in
 
     Returns:
         Sample offset (int).
+
+    Raises:
+        ValueError: If the key is not in one of the formats above.
     """
     key = key.strip()
+    # One look at the last character picks the unit. This is measurably
+    # cheaper per keyframe than a regex match, which has to scan the digits.
+    unit = key[-1:]
+    try:
+        if unit == "%":
+            return int(total_length_samples * float(key[:-1]) / 100.0)
+        if unit == "s":
+            return int(float(key[:-1]) * sample_rate)
+        # Plain number = sample offset
+        return int(float(key))
+    except ValueError:
+        raise ValueError(
+            f"Invalid keyframe time '{key}': expected a sample offset "
+            f"('1000'), seconds ('1.5s') or a percentage ('50%')."
+        ) from None
+
+
+# Segments with at least this many block boundaries are interpolated with
+# numpy (when installed); shorter ones are cheaper as a plain Python loop
+# than the array setup.
+_VECTORIZE_MIN_POINTS = 64
 
-    if key.endswith("%"):
-        pct = float(key[:-1])
-        return int(total_length_samples * pct / 100.0)
 
-    if key.endswith("s"):
-        seconds = float(key[:-1])
-        return int(seconds * sample_rate)
+def _numpy_or_none():
+    # numpy is optional; automation must keep working without it.
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
 
-    # Plain number = sample offset
-    return int(float(key))
+def _json_loads(data: bytes) -> Any:
+    # orjson is optional; when installed it parses large keyframe files
+    # several times faster than the stdlib scanner. It is imported on first
+    # use, so importing this module never pays for it. Both accept bytes and
+    # raise a ValueError subclass on malformed input.
+    try:
+        import orjson  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _interpolate_segment(
+    s0: int, v0: float, s1: int, v1: float, first_block: int, block_size: int
+) -> list[tuple[int, float]]:
+    """Linearly interpolated (sample, value) pairs at ``first_block``,
+    ``first_block + block_size``, ... up to (excluding) ``s1``."""
+    samples = range(first_block, s1, block_size)
+    # Hoisted out of the per-sample expression; the operations (and so the
+    # rounding) are the same as writing them inline.
+    span = s1 - s0
+    dv = v1 - v0
+    np = _numpy_or_none() if len(samples) >= _VECTORIZE_MIN_POINTS else None
+    if np is None:
+        return [(s, v0 + (s - s0) / span * dv) for s in samples]
+    # Same arithmetic as the scalar path, in float64, so both agree exactly.
+    offsets = np.arange(first_block, s1, block_size, dtype=np.int64)
+    t = (offsets - s0) / span
+    values = v0 + t * dv
+    return list(zip(offsets.tolist(), values.tolist()))
 
 
 def _interpolate_keyframes(
@@ -156,21 +213,16 @@ def _interpolate_keyframes(
 
     result = []
 
-    for i in range(len(keyframes) - 1):
-        s0, v0 = keyframes[i]
-        s1, v1 = keyframes[i + 1]
-
+    for (s0, v0), (s1, v1) in zip(keyframes, keyframes[1:]):
         # Add the start keyframe
         result.append((s0, v0))
 
-        # Interpolate at block boundaries between keyframes
-        if s1 > s0:
-            # Find block boundaries in this segment
-            first_block = ((s0 // block_size) + 1) * block_size
-            for sample in range(first_block, s1, block_size):
-                t = (sample - s0) / (s1 - s0)
-                v = v0 + t * (v1 - v0)
-                result.append((sample, v))
+        # Interpolate at block boundaries between keyframes. Keyframes
+        # closer together than a block have no boundary in between, so
+        # skip the segment setup entirely.
+        first_block = ((s0 // block_size) + 1) * block_size
+        if first_block < s1:
+            result += _interpolate_segment(s0, v0, s1, v1, first_block, block_size)
 
     # Add the last keyframe
     result.append(keyframes[-1])
@@ -206,8 +258,7 @@ def parse_automation_file(
     if not path.exists():
         raise FileNotFoundError(f"Automation file not found: {path}")
 
-    with open(path) as f:
-        data = json.load(f)
+    data = _json_loads(path.read_bytes())
 
     if not isinstance(data, dict):
         raise ValueError("Automation file must contain a JSON object at the top level.")
@@ -249,15 +300,18 @@ def parse_automation_file(
                         ) from e
                 keyframes.append((sample_offset, float(value)))
 
-            # Sort by sample offset
-            keyframes.sort(key=lambda x: x[0])
+            # Sort by sample offset. Keyframes in a file are usually already
+            # in order, which Timsort handles in one linear pass; a numpy
+            # argsort measured slower at every size once the offsets are
+            # copied out and the list rebuilt, so the builtin sort stays.
+            # Stability keeps duplicate offsets in file order.
+            keyframes.sort(key=itemgetter(0))
 
             # Interpolate
             expanded = _interpolate_keyframes(
                 keyframes, total_length_samples, block_size
             )
-            for sample_offset, value in expanded:
-                changes.append((sample_offset, param_idx, value))
+            changes.extend([(s, param_idx, v) for s, v in expanded])
 
         else:
             raise ValueError(
@@ -265,6 +319,7 @@ def parse_automation_file(
                 f"expected number, string, or object, got {type(spec).__name__}"
             )
 
-    # Sort by sample offset for process_auto()
-    changes.sort(key=lambda x: x[0])
+    # Sort by sample offset for process_auto(). The sort is stable, so
+    # events at the same offset keep file order.
+    changes.sort(key=itemgetter(0))
     return changes
@@ -17,17 +17,78 @@ Usage:
 from __future__ import annotations
 
 import argparse
+from bisect import bisect_right
+from operator import itemgetter
 import os
 from pathlib import Path
 import threading
-from typing import Optional
+from typing import Callable, Optional
 import signal
 import sys
 import time
 
+# Kept at module level on purpose: this module is minihost.cli, so the
+# package (and with it the native _core extension) is already imported by
+# the time any line here runs -- including for `minihost --help`. Deferring
+# this import would not skip the extension load, only obscure the call
+# sites. The package's pure-Python layers (render, audio_io, compose, ...)
+# load on first attribute access, and optional or heavy dependencies (numpy,
+# orjson, the vstpreset / automation helpers, ...) are imported inside the
+# functions that use them.
 import minihost
 
 
+def _dumps(obj) -> str:
+    """Serialize ``obj`` as indented JSON for the ``--json`` outputs."""
+    # orjson is optional; when installed it serializes the large `scan` and
+    # `params` payloads several times faster than the stdlib encoder. Either
+    # is imported here, on first use: loading orjson costs more than
+    # building the parser, and most invocations print no JSON. The stdlib
+    # path writes non-ASCII as-is, like orjson, so the output does not
+    # depend on which one is installed.
+    try:
+        import orjson  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        import json
+
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    return orjson.dumps(obj, option=options).decode()
+
+
+def _emit_json(obj) -> None:
+    """Print ``obj`` as indented JSON, the way every ``--json`` mode ends."""
+    sys.stdout.write(_dumps(obj) + "\n")
+
+
+def _emit_jsonl(items) -> None:
+    """Print each of ``items`` as compact JSON on its own line (JSON Lines).
+
+    Every object is encoded and written as it is reached, so no
+    document-sized string is built and a reader on the other end of a pipe
+    can start on the first line straight away.
+    """
+    try:
+        import orjson  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        import json
+
+        encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+        def encode(obj) -> str:
+            return encoder.encode(obj) + "\n"
+
+    else:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
+        def encode(obj) -> str:
+            return orjson.dumps(obj, option=options).decode()
+
+    write = sys.stdout.write
+    for item in items:
+        write(encode(item))
+
+
 class _ProgressBar:
     """Simple stderr progress bar driven by an (current, total) callback.
 
@@ -68,10 +129,11 @@ def cmd_scan(args: argparse.Namespace) -> int:
     default (only new/changed plugins are probed); --no-cache forces a
     full uncached scan and --refresh re-probes every plugin."""
     try:
+        from minihost import plugincache
+
         if args.no_cache:
-            results = minihost.scan_directory(args.directory)
+            results = plugincache.scan_uncached(args.directory)
         else:
-            from minihost import plugincache
 
             def _progress(done: int, total: int, _path: str) -> None:
                 sys.stderr.write(f"\rProbing {done}/{total}...")
@@ -84,19 +146,21 @@ def cmd_scan(args: argparse.Namespace) -> int:
                 args.directory,
                 refresh=args.refresh,
                 on_progress=None if args.json else _progress,
+                jobs=args.jobs,
             )
     except RuntimeError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
     if args.json:
-        import json
-
-        print(json.dumps(results, indent=2))
+        _emit_json(results)
     else:
-        for i, info in enumerate(results, 1):
-            print(f"[{i}] {info['name']} ({info['format']}) - {info['path']}")
-        print(f"\nFound {len(results)} plugin(s)")
+        lines = [
+            f"[{i}] {info['name']} ({info['format']}) - {info['path']}"
+            for i, info in enumerate(results, 1)
+        ]
+        lines.append(f"\nFound {len(results)} plugin(s)\n")
+        sys.stdout.write("\n".join(lines))
 
     return 0
 
@@ -113,9 +177,7 @@ def cmd_cache(args: argparse.Namespace) -> int:
     if action == "stats":
         s = plugincache.stats()
         if args.json:
-            import json
-
-            print(json.dumps(s, indent=2))
+            _emit_json(s)
         else:
             print(f"Cache:  {s['path']}")
             print(f"Exists: {'yes' if s['exists'] else 'no'}")
@@ -141,13 +203,14 @@ def cmd_cache(args: argparse.Namespace) -> int:
             produces_midi=True if args.midi_out else None,
         )
         if args.json:
-            import json
-
-            print(json.dumps(results, indent=2))
+            _emit_json(results)
         else:
-            for i, d in enumerate(results, 1):
-                print(f"[{i}] {d['name']} ({d['format']}) - {d['path']}")
-            print(f"\n{len(results)} plugin(s) in cache")
+            lines = [
+                f"[{i}] {d['name']} ({d['format']}) - {d['path']}"
+                for i, d in enumerate(results, 1)
+            ]
+            lines.append(f"\n{len(results)} plugin(s) in cache\n")
+            sys.stdout.write("\n".join(lines))
         return 0
 
     print(f"Error: unknown cache action {action!r}", file=sys.stderr)
@@ -157,9 +220,7 @@ def cmd_cache(args: argparse.Namespace) -> int:
 def _print_probe_info(info: dict, json_output: bool = False) -> None:
     """Print probe-level plugin metadata."""
     if json_output:
-        import json
-
-        print(json.dumps(info, indent=2))
+        _emit_json(info)
     else:
         print(f"Name:      {info['name']}")
         print(f"Vendor:    {info['vendor']}")
@@ -172,18 +233,27 @@ def _print_probe_info(info: dict, json_output: bool = False) -> None:
         print(f"MIDI Out:  {'yes' if info['produces_midi'] else 'no'}")
 
 
+def _probe_metadata(args: argparse.Namespace) -> dict:
+    """Return probe metadata for ``args.plugin``.
+
+    Served from the scan cache (probing + caching on a miss / stale
+    fingerprint) unless --no-cache is given. Raises RuntimeError if the
+    plugin cannot be probed.
+    """
+    if args.no_cache:
+        return minihost.probe(args.plugin)
+    from minihost import plugincache
+
+    # Copy: callers extend the dict with runtime fields.
+    return dict(plugincache.info(args.plugin, refresh=args.refresh))
+
+
 def cmd_info(args: argparse.Namespace) -> int:
     """Show plugin info. With --probe, uses lightweight metadata only."""
-    # Probe-only mode: no full load. Served from the scan cache (probing +
-    # caching on a miss / stale fingerprint) unless --no-cache is given.
+    # Probe-only mode: no full load.
     if args.probe:
         try:
-            if args.no_cache:
-                info = minihost.probe(args.plugin)
-            else:
-                from minihost import plugincache
-
-                info = plugincache.info(args.plugin, refresh=args.refresh)
+            info = _probe_metadata(args)
         except RuntimeError as e:
             print(f"Error: {e}", file=sys.stderr)
             return 1
@@ -199,13 +269,12 @@ def cmd_info(args: argparse.Namespace) -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    # Basic info from probe
+    # Basic info straight from the loaded instance: same keys as a probe,
+    # with no second load of the binary and no scan-cache round trip.
     try:
-        info = minihost.probe(args.plugin)
+        info = plugin.get_desc()
         if args.json:
             # In JSON mode, merge probe + runtime into one object
-            import json
-
             info["sample_rate"] = plugin.sample_rate
             info["num_params"] = plugin.num_params
             info["num_input_channels"] = plugin.num_input_channels
@@ -214,7 +283,7 @@ def cmd_info(args: argparse.Namespace) -> int:
             info["tail_seconds"] = plugin.tail_seconds
             info["supports_double"] = plugin.supports_double
             info["num_programs"] = plugin.num_programs
-            print(json.dumps(info, indent=2))
+            _emit_json(info)
             return 0
         _print_probe_info(info)
     except Exception:
@@ -230,34 +299,26 @@ def cmd_info(args: argparse.Namespace) -> int:
     print(f"  Double Prec:  {'yes' if plugin.supports_double else 'no'}")
 
     # Bus info
-    if plugin.num_input_buses > 0:
-        print("\nInput Buses:")
-        for i in range(plugin.num_input_buses):
-            bus = plugin.get_bus_info(True, i)
-            flags = "[main]" if bus["is_main"] else ""
-            if not bus["is_enabled"]:
-                flags += " (disabled)"
-            print(f"  [{i}] {bus['name']:<20}  {bus['num_channels']} ch  {flags}")
-
-    if plugin.num_output_buses > 0:
-        print("\nOutput Buses:")
-        for i in range(plugin.num_output_buses):
-            bus = plugin.get_bus_info(False, i)
-            flags = "[main]" if bus["is_main"] else ""
-            if not bus["is_enabled"]:
-                flags += " (disabled)"
-            print(f"  [{i}] {bus['name']:<20}  {bus['num_channels']} ch  {flags}")
+    for title, is_input in (("Input Buses", True), ("Output Buses", False)):
+        buses = plugin.get_bus_infos(is_input)
+        if buses:
+            print(f"\n{title}:")
+            for i, bus in enumerate(buses):
+                flags = "[main]" if bus["is_main"] else ""
+                if not bus["is_enabled"]:
+                    flags += " (disabled)"
+                print(f"  [{i}] {bus['name']:<20}  {bus['num_channels']} ch  {flags}")
 
     # Factory presets
-    if plugin.num_programs > 0:
-        print(f"\nFactory Presets: {plugin.num_programs}")
+    num_programs = plugin.num_programs
+    if num_programs > 0:
+        print(f"\nFactory Presets: {num_programs}")
         current = plugin.program
-        for i in range(min(plugin.num_programs, 10)):
-            name = plugin.get_program_name(i)
+        for i, name in enumerate(plugin.get_program_names(0, 10)):
             marker = " (current)" if i == current else ""
             print(f"  [{i}] {name}{marker}")
-        if plugin.num_programs > 10:
-            print(f"  ... and {plugin.num_programs - 10} more")
+        if num_programs > 10:
+            print(f"  ... and {num_programs - 10} more")
 
     return 0
 
@@ -272,22 +333,27 @@ def cmd_params(args: argparse.Namespace) -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    if args.json:
-        import json
+    # One batch call for metadata and values (each value read alongside its
+    # display string) instead of two native crossings per parameter; output
+    # is collected and written in one go, which matters for synths with
+    # thousands of parameters piped to a pager.
+    infos = plugin.get_param_infos(with_values=True)
+    values = [info.pop("value") for info in infos]
 
-        params = []
-        for i in range(plugin.num_params):
-            info = plugin.get_param_info(i)
+    jsonl = getattr(args, "jsonl", False)
+    if args.json or jsonl:
+        for i, (info, value) in enumerate(zip(infos, values)):
             info["index"] = i
-            info["value"] = plugin.get_param(i)
-            params.append(info)
-        print(json.dumps(params, indent=2))
-    elif args.verbose:
-        print(f"Parameters ({plugin.num_params}):")
-        for i in range(plugin.num_params):
-            info = plugin.get_param_info(i)
-            value = plugin.get_param(i)
+            info["value"] = value
+        if jsonl:
+            _emit_jsonl(infos)
+        else:
+            _emit_json(infos)
+        return 0
 
+    lines = [f"Parameters ({len(infos)}):"]
+    if args.verbose:
+        for i, (info, value) in enumerate(zip(infos, values)):
             # Build range string
             min_text = plugin.param_to_text(i, 0.0)
             max_text = plugin.param_to_text(i, 1.0)
@@ -295,10 +361,12 @@ def cmd_params(args: argparse.Namespace) -> int:
             default_text = plugin.param_to_text(i, default_val)
 
             label = f" {info['label']}" if info["label"] else ""
-            print(f"  [{i:3d}] {info['name']}")
-            print(f"         Value:   {value:.4f}{label} ({info['current_value_str']})")
-            print(f"         Range:   {min_text} .. {max_text}")
-            print(f"         Default: {default_val:.4f} ({default_text})")
+            lines.append(f"  [{i:3d}] {info['name']}")
+            lines.append(
+                f"         Value:   {value:.4f}{label} ({info['current_value_str']})"
+            )
+            lines.append(f"         Range:   {min_text} .. {max_text}")
+            lines.append(f"         Default: {default_val:.4f} ({default_text})")
             flags = []
             if info.get("is_automatable"):
                 flags.append("automatable")
@@ -308,16 +376,17 @@ def cmd_params(args: argparse.Namespace) -> int:
                 if num_steps is not None:
                     flags.append(f"{num_steps} steps")
             if flags:
-                print(f"         Flags:   {', '.join(flags)}")
+                lines.append(f"         Flags:   {', '.join(flags)}")
     else:
-        print(f"Parameters ({plugin.num_params}):")
-        for i in range(plugin.num_params):
-            info = plugin.get_param_info(i)
-            value = plugin.get_param(i)
+        # f-strings compile to direct FORMAT_VALUE / BUILD_STRING ops; a
+        # prebuilt "...".format template measured ~10% slower per line.
+        for i, (info, value) in enumerate(zip(infos, values)):
             label = f" {info['label']}" if info["label"] else ""
-            print(
+            lines.append(
                 f"  [{i:3d}] {info['name']:<30} = {value:.4f}{label} ({info['current_value_str']})"
             )
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
     return 0
 
@@ -325,11 +394,84 @@ def cmd_params(args: argparse.Namespace) -> int:
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 
 
+# Names and "C4 (60)"-style monitor labels for all 128 MIDI notes, built
+# once so formatting a note message is an index, not arithmetic.
+_NOTE_NAMES_CACHE = tuple(f"{NOTE_NAMES[n % 12]}{(n // 12) - 1}" for n in range(128))
+_NOTE_LABELS = tuple(f"{name} ({n})" for n, name in enumerate(_NOTE_NAMES_CACHE))
+
+
 def _note_name(note_num: int) -> str:
     """Convert MIDI note number to name like C4, D#5."""
-    octave = (note_num // 12) - 1
-    name = NOTE_NAMES[note_num % 12]
-    return f"{name}{octave}"
+    if 0 <= note_num < 128:
+        return _NOTE_NAMES_CACHE[note_num]
+    return f"{NOTE_NAMES[note_num % 12]}{(note_num // 12) - 1}"
+
+
+def _note_label(note_num: int) -> str:
+    """``C4 (60)``-style label; a malformed data byte above 127 (status
+    bytes are not validated on the wire) is formatted rather than indexed."""
+    if note_num < 128:
+        return _NOTE_LABELS[note_num]
+    return f"{_note_name(note_num)} ({note_num})"
+
+
+def _fmt_note_off(timestamp: float, ch: str, data: bytes) -> str:
+    return (
+        f"{timestamp:7.3f}  Note Off      {ch} "
+        f"note={_note_label(data[1])}  vel={data[2]}"
+    )
+
+
+def _fmt_note_on(timestamp: float, ch: str, data: bytes) -> str:
+    if data[2] == 0:
+        return _fmt_note_off(timestamp, ch, data)
+    return (
+        f"{timestamp:7.3f}  Note On       {ch} "
+        f"note={_note_label(data[1])}  vel={data[2]}"
+    )
+
+
+def _fmt_poly_aftertouch(timestamp: float, ch: str, data: bytes) -> str:
+    return (
+        f"{timestamp:7.3f}  Poly AT       {ch} "
+        f"note={_note_label(data[1])}  val={data[2]}"
+    )
+
+
+def _fmt_cc(timestamp: float, ch: str, data: bytes) -> str:
+    return f"{timestamp:7.3f}  CC            {ch} cc={data[1]:<3} val={data[2]}"
+
+
+def _fmt_program(timestamp: float, ch: str, data: bytes) -> str:
+    return f"{timestamp:7.3f}  Program       {ch} prog={data[1]}"
+
+
+def _fmt_channel_pressure(timestamp: float, ch: str, data: bytes) -> str:
+    return f"{timestamp:7.3f}  Ch Pressure   {ch} val={data[1]}"
+
+
+def _fmt_pitch_bend(timestamp: float, ch: str, data: bytes) -> str:
+    val = data[1] | (data[2] << 7)
+    return f"{timestamp:7.3f}  Pitch Bend    {ch} val={val}"
+
+
+# Padded "ch=N" labels indexed by the status byte's low nibble (channel
+# N - 1), so the channel is not formatted again on every line. A bound
+# "...".format template per message type measured slower than f-strings.
+_CHANNEL_LABELS = tuple(f"ch={n:<2}" for n in range(1, 17))
+
+# Channel-voice formatters indexed by the status byte's high nibble, each
+# with the message length it needs; None for data bytes (0x0-0x7) and for
+# 0xF, which _format_midi_msg handles before the lookup.
+_MidiFormatter = Callable[[float, str, bytes], str]
+_MIDI_HANDLERS: list[Optional[tuple[int, _MidiFormatter]]] = [None] * 16
+_MIDI_HANDLERS[0x8] = (3, _fmt_note_off)
+_MIDI_HANDLERS[0x9] = (3, _fmt_note_on)
+_MIDI_HANDLERS[0xA] = (3, _fmt_poly_aftertouch)
+_MIDI_HANDLERS[0xB] = (3, _fmt_cc)
+_MIDI_HANDLERS[0xC] = (2, _fmt_program)
+_MIDI_HANDLERS[0xD] = (2, _fmt_channel_pressure)
+_MIDI_HANDLERS[0xE] = (3, _fmt_pitch_bend)
 
 
 def _format_midi_msg(timestamp: float, data: bytes) -> str:
@@ -349,65 +491,20 @@ def _format_midi_msg(timestamp: float, data: bytes) -> str:
 
     # SysEx
     if status == 0xF0:
-        hex_str = " ".join(f"{b:02X}" for b in data)
+        hex_str = data.hex(" ").upper()
         return f"{timestamp:7.3f}  SysEx          {hex_str}"
 
     # System real-time / common (single-byte or non-channel)
     if status >= 0xF0:
-        hex_str = " ".join(f"{b:02X}" for b in data)
+        hex_str = data.hex(" ").upper()
         return f"{timestamp:7.3f}  System         {hex_str}"
 
-    msg_type = status & 0xF0
-    channel = (status & 0x0F) + 1
+    entry = _MIDI_HANDLERS[status >> 4]
+    if entry is not None and len(data) >= entry[0]:
+        return entry[1](timestamp, _CHANNEL_LABELS[status & 0x0F], data)
 
-    if msg_type == 0x90 and len(data) >= 3:
-        note = data[1]
-        vel = data[2]
-        if vel == 0:
-            return (
-                f"{timestamp:7.3f}  Note Off      ch={channel:<2} "
-                f"note={_note_name(note)} ({note})  vel=0"
-            )
-        return (
-            f"{timestamp:7.3f}  Note On       ch={channel:<2} "
-            f"note={_note_name(note)} ({note})  vel={vel}"
-        )
-
-    if msg_type == 0x80 and len(data) >= 3:
-        note = data[1]
-        vel = data[2]
-        return (
-            f"{timestamp:7.3f}  Note Off      ch={channel:<2} "
-            f"note={_note_name(note)} ({note})  vel={vel}"
-        )
-
-    if msg_type == 0xB0 and len(data) >= 3:
-        cc = data[1]
-        val = data[2]
-        return f"{timestamp:7.3f}  CC            ch={channel:<2} cc={cc:<3} val={val}"
-
-    if msg_type == 0xE0 and len(data) >= 3:
-        val = data[1] | (data[2] << 7)
-        return f"{timestamp:7.3f}  Pitch Bend    ch={channel:<2} val={val}"
-
-    if msg_type == 0xC0 and len(data) >= 2:
-        prog = data[1]
-        return f"{timestamp:7.3f}  Program       ch={channel:<2} prog={prog}"
-
-    if msg_type == 0xD0 and len(data) >= 2:
-        pressure = data[1]
-        return f"{timestamp:7.3f}  Ch Pressure   ch={channel:<2} val={pressure}"
-
-    if msg_type == 0xA0 and len(data) >= 3:
-        note = data[1]
-        pressure = data[2]
-        return (
-            f"{timestamp:7.3f}  Poly AT       ch={channel:<2} "
-            f"note={_note_name(note)} ({note})  val={pressure}"
-        )
-
-    # Unknown
-    hex_str = " ".join(f"{b:02X}" for b in data)
+    # Unknown (data byte first, or a truncated channel message)
+    hex_str = data.hex(" ").upper()
     return f"{timestamp:7.3f}  Unknown        {hex_str}"
 
 
@@ -423,9 +520,7 @@ def cmd_midi(args: argparse.Namespace) -> int:
     outputs = minihost.midi_get_output_ports()
 
     if args.json:
-        import json
-
-        print(json.dumps({"inputs": inputs, "outputs": outputs}, indent=2))
+        _emit_json({"inputs": inputs, "outputs": outputs})
     else:
         print("MIDI Input Ports:")
         if inputs:
@@ -444,16 +539,70 @@ def cmd_midi(args: argparse.Namespace) -> int:
     return 0
 
 
+def _stop_on_signal(
+    stop: threading.Event,
+    *,
+    wake: Optional[threading.Event] = None,
+    message: Optional[str] = None,
+) -> None:
+    """Route SIGINT and SIGTERM to ``stop`` (and ``wake``, if given)."""
+
+    def on_signal(sig, frame):
+        stop.set()
+        if wake is not None:
+            wake.set()
+        if message is not None:
+            print(message)
+
+    signal.signal(signal.SIGINT, on_signal)
+    signal.signal(signal.SIGTERM, on_signal)
+
+
+def _run_until_stopped(
+    stop: threading.Event,
+    *,
+    wake: Optional[threading.Event] = None,
+    on_wake: Optional[Callable[[], None]] = None,
+) -> None:
+    """Block until ``stop`` is set, calling ``on_wake`` whenever ``wake`` is.
+
+    The main thread sleeps in ``Event.wait`` instead of polling a flag;
+    handlers installed by ``_stop_on_signal`` set the events to wake it.
+    Windows cannot interrupt an untimed wait with Ctrl+C, so it wakes
+    once a second there instead.
+    """
+    timeout = 1.0 if os.name == "nt" else None
+    try:
+        if wake is None:
+            while not stop.wait(timeout):
+                pass
+            return
+        while not stop.is_set():
+            if wake.wait(timeout):
+                # Clear before the callback: an event landing while it runs
+                # re-sets ``wake``, so nothing waits for the next one.
+                wake.clear()
+                if on_wake is not None:
+                    on_wake()
+    except KeyboardInterrupt:
+        pass
+
+
 def _cmd_midi_monitor(args: argparse.Namespace) -> int:
     """Monitor incoming MIDI messages on a port."""
-    import queue
+    from collections import deque
 
-    msg_queue: queue.Queue[tuple[float, bytes]] = queue.Queue()
+    # deque.append is atomic, so the MIDI thread hands messages over without
+    # the mutex + condition round trip of queue.Queue.put. The event only
+    # wakes the printer; it is set once per drained batch, not per message.
+    pending: deque[tuple[float, bytes]] = deque()
+    wake = threading.Event()
     start_time = time.monotonic()
 
     def on_midi(data: bytes) -> None:
-        elapsed = time.monotonic() - start_time
-        msg_queue.put((elapsed, data))
+        pending.append((time.monotonic() - start_time, data))
+        if not wake.is_set():
+            wake.set()
 
     # Open MIDI input
     try:
@@ -477,25 +626,20 @@ def _cmd_midi_monitor(args: argparse.Namespace) -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    # Monitor loop
-    running = True
-
-    def on_signal(sig, frame):
-        nonlocal running
-        running = False
-
-    signal.signal(signal.SIGINT, on_signal)
-    signal.signal(signal.SIGTERM, on_signal)
-
+    def drain() -> None:
+        lines = []
+        while pending:
+            timestamp, data = pending.popleft()
+            lines.append(f"  {_format_midi_msg(timestamp, data)}\n")
+        if lines:
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+
+    # Sleeps until a message or a signal arrives rather than polling.
+    stop = threading.Event()
+    _stop_on_signal(stop, wake=wake)
     try:
-        while running:
-            try:
-                timestamp, data = msg_queue.get(timeout=0.1)
-                print(f"  {_format_midi_msg(timestamp, data)}")
-            except queue.Empty:
-                pass
-    except KeyboardInterrupt:
-        pass
+        _run_until_stopped(stop, wake=wake, on_wake=drain)
     finally:
         midi_in.close()
 
@@ -607,32 +751,27 @@ def cmd_presets(args: argparse.Namespace) -> int:
         return 0
 
     # Listing mode
+    # One call for every program name rather than one per preset.
+    names = plugin.get_program_names() if plugin.num_programs > 0 else []
+    current = plugin.program if names else -1
     if args.json:
-        import json
-
-        presets = []
-        current = plugin.program
-        for i in range(plugin.num_programs):
-            presets.append(
-                {
-                    "index": i,
-                    "name": plugin.get_program_name(i),
-                    "is_current": i == current,
-                }
-            )
-        print(json.dumps({"count": plugin.num_programs, "presets": presets}, indent=2))
+        presets = [
+            {"index": i, "name": name, "is_current": i == current}
+            for i, name in enumerate(names)
+        ]
+        _emit_json({"count": len(names), "presets": presets})
         return 0
 
-    if plugin.num_programs == 0:
+    if not names:
         print(f"{args.plugin}: no factory presets")
         return 0
 
-    print(f"Factory Presets: {plugin.num_programs}")
-    current = plugin.program
-    for i in range(plugin.num_programs):
-        name = plugin.get_program_name(i)
+    lines = [f"Factory Presets: {len(names)}"]
+    for i, name in enumerate(names):
         marker = " (current)" if i == current else ""
-        print(f"  [{i}] {name}{marker}")
+        lines.append(f"  [{i}] {name}{marker}")
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
     return 0
 
 
@@ -713,8 +852,6 @@ def cmd_morph(args: argparse.Namespace) -> int:
         blend = minihost.lerp_params(a, b, args.blend)
 
         if args.json:
-            import json
-
             out = {
                 "blend": args.blend,
                 "num_params": n,
@@ -723,16 +860,21 @@ def cmd_morph(args: argparse.Namespace) -> int:
                     for i in range(n)
                 ],
             }
-            print(json.dumps(out, indent=2))
+            _emit_json(out)
         else:
             print(
                 f"Morph between A and B at t={args.blend:.3f} ({n} params)",
                 file=sys.stderr,
             )
-            print(f"{'idx':<4} {'name':<28} {'A':>9} {'B':>9} {'blend':>9}")
-            for i in range(n):
-                name = plugin.get_param_info(i)["name"]
-                print(f"{i:<4} {name:<28} {a[i]:>9.4f} {b[i]:>9.4f} {blend[i]:>9.4f}")
+            # One batch metadata call and one write for the whole table.
+            lines = [f"{'idx':<4} {'name':<28} {'A':>9} {'B':>9} {'blend':>9}"]
+            for i, info in enumerate(plugin.get_param_infos()):
+                name = info["name"]
+                lines.append(
+                    f"{i:<4} {name:<28} {a[i]:>9.4f} {b[i]:>9.4f} {blend[i]:>9.4f}"
+                )
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
 
         # Apply and optionally persist the morphed snapshot.
         if args.apply or args.save:
@@ -763,9 +905,7 @@ def cmd_devices(args: argparse.Namespace) -> int:
         return 1
 
     if args.json:
-        import json
-
-        print(json.dumps({"playback": playback, "capture": capture}, indent=2))
+        _emit_json({"playback": playback, "capture": capture})
         return 0
 
     print("Audio Playback (Output) Devices:")
@@ -941,40 +1081,15 @@ def _collect_play_midi_events(midi_file_path: str, sample_rate: float):
     Reuses the helpers in ``minihost.render`` so tempo handling matches
     the offline renderer.
     """
-    from minihost.render import (
-        _build_tempo_map,
-        _collect_midi_events,
-        _event_to_midi_tuple,
-        _seconds_to_samples,
-        _tick_to_seconds,
-    )
+    from minihost.render import midi_file_to_events
 
     mf = minihost.MidiFile()
     if not mf.load(midi_file_path):
         raise RuntimeError(f"Failed to load MIDI file: {midi_file_path}")
 
-    tempo_map = _build_tempo_map(mf)
-    raw = _collect_midi_events(mf)
-    tpq = mf.ticks_per_quarter
-
-    events = []
-    last_sample = 0
-    for ev in raw:
-        seconds = _tick_to_seconds(ev["tick"], tempo_map, tpq)
-        sample_pos = _seconds_to_samples(seconds, sample_rate)
-        tup = _event_to_midi_tuple(ev, sample_pos)
-        if tup is not None:
-            events.append(tup)
-            if sample_pos > last_sample:
-                last_sample = sample_pos
-
-    events.sort(key=lambda t: t[0])
-    return events, last_sample
-
-
-# CC 123 = All Notes Off, sent on every channel at loop wrap to silence
-# any sustained notes from the previous iteration before re-triggering.
-_ALL_NOTES_OFF_CC = 123
+    # Already sorted by sample offset, so the last event is the latest.
+    events = midi_file_to_events(mf, sample_rate)
+    return events, (events[-1][0] if events else 0)
 
 
 def _midi_loop_thread(audio, midi_file_path, sample_rate, stop_event):
@@ -1020,10 +1135,9 @@ def _midi_loop_thread(audio, midi_file_path, sample_rate, stop_event):
             if stop_event.wait(loop_end - now):
                 return
 
-        # Send All Notes Off on every channel before the next iteration.
-        # 0xB0..0xBF = CC on channels 0..15.
-        for ch in range(16):
-            audio.send_midi(0xB0 | ch, _ALL_NOTES_OFF_CC, 0)
+        # Send All Notes Off (CC 123) on every channel before the next
+        # iteration to silence notes sustained from this one.
+        audio.all_notes_off()
 
 
 def _audio_loop_thread(audio, audio_file_path, sample_rate, stop_event):
@@ -1262,15 +1376,8 @@ def cmd_play(args: argparse.Namespace) -> int:
                 return 1
 
     # Setup signal handler
-    running = True
-
-    def on_signal(sig, frame):
-        nonlocal running
-        running = False
-        print("\nStopping...")
-
-    signal.signal(signal.SIGINT, on_signal)
-    signal.signal(signal.SIGTERM, on_signal)
+    stop_requested = threading.Event()
+    _stop_on_signal(stop_requested, message="\nStopping...")
 
     # If --loop-audio is set, prepare the input ring buffer before
     # starting the audio device so the first block doesn't underrun.
@@ -1326,11 +1433,8 @@ def cmd_play(args: argparse.Namespace) -> int:
             hints.append("MIDI output (--midi-out N / --virtual-midi-out NAME)")
         print(f"(No {', '.join(hints)})")
 
-    try:
-        while running:
-            time.sleep(0.1)
-    except KeyboardInterrupt:
-        pass
+    # Audio runs on the native device thread, so there is nothing to poll.
+    _run_until_stopped(stop_requested)
 
     # Stop the loop threads first so they don't try to send_midi /
     # write_input into a stopped device.
@@ -1357,36 +1461,14 @@ def _load_midi_events(midi_path, sample_rate):
     Returns (events_by_sample, total_midi_samples) where events_by_sample
     is a sorted list of (sample_pos, status, data1, data2) tuples.
     """
-    from minihost.render import (
-        _build_tempo_map,
-        _collect_midi_events,
-        _event_to_midi_tuple,
-        _seconds_to_samples,
-        _tick_to_seconds,
-    )
+    from minihost.render import midi_file_to_events
 
     mf = minihost.MidiFile()
     if not mf.load(midi_path):
         raise RuntimeError(f"Failed to load MIDI file: {midi_path}")
 
-    tpq = mf.ticks_per_quarter
-    tempo_map = _build_tempo_map(mf)
-    all_events = _collect_midi_events(mf)
-
-    # Convert to sample positions
-    result = []
-    max_sample = 0
-    for event in all_events:
-        tick = event["tick"]
-        seconds = _tick_to_seconds(tick, tempo_map, tpq)
-        sample_pos = _seconds_to_samples(seconds, sample_rate)
-        midi_tuple = _event_to_midi_tuple(event, sample_pos)
-        if midi_tuple:
-            result.append(midi_tuple)
-            max_sample = max(max_sample, sample_pos)
-
-    result.sort(key=lambda x: x[0])
-    return result, max_sample
+    result = midi_file_to_events(mf, sample_rate)
+    return result, (result[-1][0] if result else 0)
 
 
 def _process_single_file(
@@ -1399,6 +1481,7 @@ def _process_single_file(
     expected_sample_rate=None,
     expected_channels=None,
     allow_resample=True,
+    info=None,
 ):
     """Process a single audio file through a plugin. Returns 0 on success, 1 on error.
 
@@ -1411,6 +1494,7 @@ def _process_single_file(
     If reset=True, plugin.reset() is called before processing.
     expected_sample_rate/expected_channels: validate input matches (for batch mode).
     allow_resample: if True, resample mismatched files instead of erroring.
+    info: the file's ``get_audio_info`` result, if the caller already has it.
     """
     from minihost.audio_io import get_audio_info
 
@@ -1421,11 +1505,12 @@ def _process_single_file(
     # decoding the entire file just to discover the SR or channel count
     # disagrees with the batch baseline.
     if expected_sample_rate is not None or expected_channels is not None:
-        try:
-            info = get_audio_info(input_path)
-        except Exception as e:
-            print(f"Error reading '{input_path}': {e}", file=sys.stderr)
-            return 1
+        if info is None:
+            try:
+                info = get_audio_info(input_path)
+            except Exception as e:
+                print(f"Error reading '{input_path}': {e}", file=sys.stderr)
+                return 1
 
         if (
             expected_sample_rate is not None
@@ -1595,6 +1680,8 @@ def _cmd_process_batch(args, input_files):
             expected_sample_rate=sample_rate,
             expected_channels=in_channels,
             allow_resample=not getattr(args, "no_resample", False),
+            # The first file's header was already read to size the plugin.
+            info=first_info if i == 1 else None,
         )
         if ret != 0:
             print(f"  [{i}/{len(input_files)}] FAILED: {basename}", file=sys.stderr)
@@ -1889,9 +1976,11 @@ def cmd_process(args: argparse.Namespace) -> int:
             param_changes = [
                 (s, i, v) for (s, i, v) in param_changes if i not in overridden
             ]
-        for param_idx, value in param_overrides.items():
-            param_changes.append((0, param_idx, value))
-        param_changes.sort(key=lambda x: x[0])
+        # parse_automation_file returns its changes sorted, so the sample-0
+        # overrides are spliced in after the file's own sample-0 entries
+        # (where a stable sort would put them) instead of re-sorting.
+        at = bisect_right(param_changes, 0, key=itemgetter(0))
+        param_changes[at:at] = [(0, i, v) for i, v in param_overrides.items()]
 
     # --- Print summary ---
     latency = plugin.latency_samples
@@ -2027,49 +2116,58 @@ def cmd_resample(args: argparse.Namespace) -> int:
     return 0
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        prog="minihost",
-        description="Audio plugin hosting CLI",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  minihost info /path/to/plugin.vst3
-  minihost info /path/to/plugin.vst3 --probe
-  minihost info /path/to/plugin.vst3 --json
-  minihost scan /Library/Audio/Plug-Ins/VST3/
-  minihost params /path/to/plugin.vst3
-  minihost params /path/to/plugin.vst3 --verbose
-  minihost midi
-  minihost midi -m 0
-  minihost play /path/to/synth.vst3 --midi 0
-  minihost play /path/to/synth.vst3 --virtual-midi "My Synth"
-  minihost process /path/to/effect.vst3 -i input.wav -o output.wav
-  minihost process /path/to/effect.vst3 -i input.wav -o output.wav --param "Mix:0.5"
-  minihost process /path/to/synth.vst3 -m song.mid -o output.wav --tail 3.0
-""",
-    )
+# Global options that take a value, as accepted before the subcommand.
+_GLOBAL_VALUE_OPTIONS = ("--sample-rate", "--block-size")
+_GLOBAL_VALUE_SHORT = ("-r", "-b")
 
-    # Global options
-    parser.add_argument(
-        "-r",
-        "--sample-rate",
-        type=float,
-        default=48000,
-        help="Sample rate in Hz (default: 48000)",
-    )
-    parser.add_argument(
-        "-b",
-        "--block-size",
-        type=int,
-        default=512,
-        help="Block size in samples (default: 512)",
-    )
 
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
+def _selected_command(argv: list[str]) -> Optional[str]:
+    """Return the subcommand named in ``argv``, skipping the global options.
 
-    # scan
-    scan_p = subparsers.add_parser("scan", help="Scan directory for plugins")
+    Returns None when a flag other than a global option comes first (e.g.
+    ``-h``) or no command is given.
+    """
+    it = iter(argv)
+    for tok in it:
+        if not tok.startswith("-"):
+            return tok
+        if tok in _GLOBAL_VALUE_SHORT:
+            next(it, None)
+        elif tok[:2] in _GLOBAL_VALUE_SHORT:
+            continue  # attached value, e.g. -r44100
+        elif tok.startswith("--") and len(tok) > 2:
+            name = tok.split("=", 1)[0]
+            # argparse accepts unambiguous prefixes of long options
+            if not any(opt.startswith(name) for opt in _GLOBAL_VALUE_OPTIONS):
+                return None
+            if "=" not in tok:
+                next(it, None)
+        else:
+            return None
+    return None
+
+
+# One-line help per subcommand, shared by its builder and by the name-only
+# stubs main() registers for the top-level help.
+_SUBPARSER_HELP = {
+    "scan": "Scan directory for plugins",
+    "info": "Show plugin info",
+    "cache": "Manage/query the persistent plugin-scan cache",
+    "params": "List plugin parameters",
+    "midi": "List or monitor MIDI ports",
+    "devices": "List available audio playback/capture devices",
+    "presets": "List plugin factory presets, or save current state as .vstpreset",
+    "morph": "Interpolate between two parameter snapshots (A/B morph)",
+    "play": "Play plugin with real-time audio/MIDI",
+    "process": "Process audio through plugin (offline)",
+    "resample": "Resample audio file to a different sample rate",
+    "render": "Render a project file (graph executor v2) to its output sinks",
+}
+
+
+def _add_scan_parser(subparsers) -> None:
+    """Add the ``scan`` subcommand."""
+    scan_p = subparsers.add_parser("scan", help=_SUBPARSER_HELP["scan"])
     scan_p.add_argument("directory", help="Directory to scan")
     scan_p.add_argument("-j", "--json", action="store_true", help="Output as JSON")
     scan_p.add_argument(
@@ -2082,10 +2180,20 @@ Examples:
         action="store_true",
         help="Bypass the scan cache entirely (full uncached scan)",
     )
+    scan_p.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Probe uncached plugins in N worker processes (0: one per CPU; "
+        "default: 1)",
+    )
     scan_p.set_defaults(func=cmd_scan)
 
-    # info
-    info_p = subparsers.add_parser("info", help="Show plugin info")
+
+def _add_info_parser(subparsers) -> None:
+    """Add the ``info`` subcommand."""
+    info_p = subparsers.add_parser("info", help=_SUBPARSER_HELP["info"])
     info_p.add_argument("plugin", help="Path to plugin")
     info_p.add_argument("-j", "--json", action="store_true", help="Output as JSON")
     info_p.add_argument(
@@ -2096,19 +2204,19 @@ Examples:
     info_p.add_argument(
         "--refresh",
         action="store_true",
-        help="Re-probe even if cached (with --probe)",
+        help="Re-probe even if cached",
     )
     info_p.add_argument(
         "--no-cache",
         action="store_true",
-        help="Bypass the scan cache (with --probe)",
+        help="Bypass the scan cache",
     )
     info_p.set_defaults(func=cmd_info)
 
-    # cache
-    cache_p = subparsers.add_parser(
-        "cache", help="Manage/query the persistent plugin-scan cache"
-    )
+
+def _add_cache_parser(subparsers) -> None:
+    """Add the ``cache`` subcommand."""
+    cache_p = subparsers.add_parser("cache", help=_SUBPARSER_HELP["cache"])
     cache_sub = cache_p.add_subparsers(dest="cache_action", required=True)
     cache_sub.add_parser("path", help="Print the cache file path")
     cache_stats_p = cache_sub.add_parser("stats", help="Show cache statistics")
@@ -2128,10 +2236,17 @@ Examples:
     )
     cache_p.set_defaults(func=cmd_cache)
 
-    # params
-    params_p = subparsers.add_parser("params", help="List plugin parameters")
+
+def _add_params_parser(subparsers) -> None:
+    """Add the ``params`` subcommand."""
+    params_p = subparsers.add_parser("params", help=_SUBPARSER_HELP["params"])
     params_p.add_argument("plugin", help="Path to plugin")
     params_p.add_argument("-j", "--json", action="store_true", help="Output as JSON")
+    params_p.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Output as JSON Lines (one parameter object per line)",
+    )
     params_p.add_argument(
         "-V",
         "--verbose",
@@ -2140,8 +2255,10 @@ Examples:
     )
     params_p.set_defaults(func=cmd_params)
 
-    # midi
-    midi_p = subparsers.add_parser("midi", help="List or monitor MIDI ports")
+
+def _add_midi_parser(subparsers) -> None:
+    """Add the ``midi`` subcommand."""
+    midi_p = subparsers.add_parser("midi", help=_SUBPARSER_HELP["midi"])
     midi_p.add_argument("-j", "--json", action="store_true", help="Output as JSON")
     midi_p.add_argument(
         "-m",
@@ -2160,17 +2277,19 @@ Examples:
     )
     midi_p.set_defaults(func=cmd_midi)
 
-    # devices
-    devices_p = subparsers.add_parser(
-        "devices", help="List available audio playback/capture devices"
-    )
+
+def _add_devices_parser(subparsers) -> None:
+    """Add the ``devices`` subcommand."""
+    devices_p = subparsers.add_parser("devices", help=_SUBPARSER_HELP["devices"])
     devices_p.add_argument("-j", "--json", action="store_true", help="Output as JSON")
     devices_p.set_defaults(func=cmd_devices)
 
-    # presets
+
+def _add_presets_parser(subparsers) -> None:
+    """Add the ``presets`` subcommand."""
     presets_p = subparsers.add_parser(
         "presets",
-        help="List plugin factory presets, or save current state as .vstpreset",
+        help=_SUBPARSER_HELP["presets"],
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -2221,10 +2340,12 @@ Examples:
     )
     presets_p.set_defaults(func=cmd_presets)
 
-    # morph
+
+def _add_morph_parser(subparsers) -> None:
+    """Add the ``morph`` subcommand."""
     morph_p = subparsers.add_parser(
         "morph",
-        help="Interpolate between two parameter snapshots (A/B morph)",
+        help=_SUBPARSER_HELP["morph"],
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -2271,8 +2392,10 @@ Examples:
     )
     morph_p.set_defaults(func=cmd_morph)
 
-    # play
-    play_p = subparsers.add_parser("play", help="Play plugin with real-time audio/MIDI")
+
+def _add_play_parser(subparsers) -> None:
+    """Add the ``play`` subcommand."""
+    play_p = subparsers.add_parser("play", help=_SUBPARSER_HELP["play"])
     play_p.add_argument("plugin", help="Path to plugin")
     play_p.add_argument(
         "-i",
@@ -2361,10 +2484,12 @@ Examples:
     )
     play_p.set_defaults(func=cmd_play)
 
-    # process
+
+def _add_process_parser(subparsers) -> None:
+    """Add the ``process`` subcommand."""
     process_p = subparsers.add_parser(
         "process",
-        help="Process audio through plugin (offline)",
+        help=_SUBPARSER_HELP["process"],
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -2497,10 +2622,12 @@ Examples:
     )
     process_p.set_defaults(func=cmd_process)
 
-    # resample
+
+def _add_resample_parser(subparsers) -> None:
+    """Add the ``resample`` subcommand."""
     resample_p = subparsers.add_parser(
         "resample",
-        help="Resample audio file to a different sample rate",
+        help=_SUBPARSER_HELP["resample"],
     )
     resample_p.add_argument("input", help="Input audio file")
     resample_p.add_argument(
@@ -2526,10 +2653,12 @@ Examples:
     )
     resample_p.set_defaults(func=cmd_resample)
 
-    # render (graph project)
+
+def _add_render_parser(subparsers) -> None:
+    """Add the ``render`` (graph project) subcommand."""
     render_p = subparsers.add_parser(
         "render",
-        help="Render a project file (graph executor v2) to its output sinks",
+        help=_SUBPARSER_HELP["render"],
     )
     render_p.add_argument("project", help="Path to project.json")
     render_p.add_argument(
@@ -2539,6 +2668,94 @@ Examples:
     )
     render_p.set_defaults(func=cmd_render)
 
+
+_SUBPARSER_BUILDERS = {
+    "scan": _add_scan_parser,
+    "info": _add_info_parser,
+    "cache": _add_cache_parser,
+    "params": _add_params_parser,
+    "midi": _add_midi_parser,
+    "devices": _add_devices_parser,
+    "presets": _add_presets_parser,
+    "morph": _add_morph_parser,
+    "play": _add_play_parser,
+    "process": _add_process_parser,
+    "resample": _add_resample_parser,
+    "render": _add_render_parser,
+}
+
+
+def _build_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """Build the CLI parser with the full subparser for ``command`` only.
+
+    Any other ``command`` (None or unknown) gets name-only stubs for every
+    subcommand: top-level help, a missing command and an "invalid choice"
+    error need just each name and its one-line help.
+    """
+    parser = argparse.ArgumentParser(
+        prog="minihost",
+        description="Audio plugin hosting CLI",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  minihost info /path/to/plugin.vst3
+  minihost info /path/to/plugin.vst3 --probe
+  minihost info /path/to/plugin.vst3 --json
+  minihost scan /Library/Audio/Plug-Ins/VST3/
+  minihost params /path/to/plugin.vst3
+  minihost params /path/to/plugin.vst3 --verbose
+  minihost midi
+  minihost midi -m 0
+  minihost play /path/to/synth.vst3 --midi 0
+  minihost play /path/to/synth.vst3 --virtual-midi "My Synth"
+  minihost process /path/to/effect.vst3 -i input.wav -o output.wav
+  minihost process /path/to/effect.vst3 -i input.wav -o output.wav --param "Mix:0.5"
+  minihost process /path/to/synth.vst3 -m song.mid -o output.wav --tail 3.0
+""",
+    )
+
+    # Global options
+    parser.add_argument(
+        "-r",
+        "--sample-rate",
+        type=float,
+        default=48000,
+        help="Sample rate in Hz (default: 48000)",
+    )
+    parser.add_argument(
+        "-b",
+        "--block-size",
+        type=int,
+        default=512,
+        help="Block size in samples (default: 512)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for name, help_text in _SUBPARSER_HELP.items():
+            subparsers.add_parser(name, help=help_text)
+    return parser
+
+
+def main():
+    # Only the invoked subcommand's arguments are needed to parse this
+    # command line, so only its subparser is built. One subparser builds in
+    # well under a millisecond, so there is nothing to gain from caching
+    # the parser on disk (and ArgumentParser objects do not pickle anyway).
+    command = _selected_command(sys.argv[1:])
+    parser = _build_parser(command)
+    if command not in _SUBPARSER_BUILDERS:
+        args, _ = parser.parse_known_args()
+        if args.command is None:
+            parser.parse_args()  # reports any unrecognized arguments
+            parser.print_help()
+            return 1
+        # A command the pre-scan could not see (e.g. after "--") matched
+        # its stub; parse again against the full subparser.
+        parser = _build_parser(args.command)
+
     args = parser.parse_args()
 
     if not args.command:
@@ -58,6 +58,7 @@ from pathlib import Path
 from typing import Any, Callable, Sequence, Union
 
 from minihost._core import AudioBuffer, Plugin, PluginBus, PluginChain
+from minihost._util import as_audio
 from minihost.audio_io import read_audio, resample, write_audio
 from minihost.process import process_audio
 
@@ -91,8 +92,8 @@ def _coerce(x: Any) -> AudioBuffer:
     """Coerce a transform's return value into an AudioBuffer."""
     if isinstance(x, AudioBuffer):
         return x
-    np = _np()
-    return AudioBuffer.from_numpy(np.ascontiguousarray(np.asarray(x, dtype=np.float32)))
+    _np()
+    return AudioBuffer.from_numpy(as_audio(x))
 
 
 def _run_processor(
@@ -278,9 +279,10 @@ class Compose:
         trailing silence (a plain copy when ``tail_frames <= 0``)."""
         if tail_frames <= 0:
             return buf.copy()
+        # New buffers are zero-filled, so only the head needs writing.
         out = AudioBuffer(buf.channels, buf.frames + tail_frames)
-        out.clear()
-        out[:, : buf.frames] = buf
+        for ch in range(buf.channels):
+            out.copy_from(ch, 0, buf, ch, 0, buf.frames)
         return out
 
     def _trim_tail(
@@ -298,7 +300,7 @@ class Compose:
         end = min(end, buf.frames)
         if end >= buf.frames:
             return buf
-        return buf[:, :end].copy()
+        return buf[:, :end]  # slicing already copies
 
     # -- execution -----------------------------------------------------
 
@@ -361,11 +363,13 @@ class Compose:
             return out
 
         np = _np()
-        arr = np.asarray(samples, dtype=np.float32)
+        # as_audio converts at most once; a contiguous float32 input goes
+        # to from_numpy (which copies it into the buffer) untouched.
+        arr = as_audio(samples)
         was_1d = arr.ndim == 1
         if was_1d:
             arr = arr[np.newaxis, :]
-        buf = AudioBuffer.from_numpy(np.ascontiguousarray(arr))
+        buf = AudioBuffer.from_numpy(arr)
         out = self._run(buf, sr, self._rng)
         result = out.as_ndarray()
         return result[0] if was_1d else result
@@ -528,7 +532,10 @@ class Fade:
 
     def __call__(self, audio: AudioBuffer, sample_rate: float) -> AudioBuffer:
         np = _np()
-        data = audio.as_ndarray().copy()
+        # Fade the buffer's own copy through a view, rather than copying
+        # into a fresh array and copying that again into an AudioBuffer.
+        out = audio.copy()
+        data = out.as_ndarray()
         n = data.shape[1]
         fi = min(int(self.fade_in * sample_rate), n)
         fo = min(int(self.fade_out * sample_rate), n)
@@ -536,7 +543,7 @@ class Fade:
             data[:, :fi] *= np.linspace(0.0, 1.0, fi, dtype=np.float32)
         if fo > 0:
             data[:, n - fo :] *= np.linspace(1.0, 0.0, fo, dtype=np.float32)
-        return AudioBuffer.from_numpy(data)
+        return out
 
     def __repr__(self) -> str:
         return f"Fade(fade_in={self.fade_in}, fade_out={self.fade_out})"
@@ -732,9 +739,12 @@ class AddGaussianNoise(_Wrapper):
         # bulk noise stays reproducible without making numpy a hard
         # dependency of the routing combinators.
         gen = np.random.default_rng(rng.getrandbits(63))
-        data = audio.as_ndarray()
-        noise = (gen.standard_normal(data.shape) * amp).astype(np.float32)
-        return AudioBuffer.from_numpy(np.ascontiguousarray(data + noise))
+        out = audio.copy()
+        data = out.as_ndarray()
+        noise = gen.standard_normal(data.shape)
+        noise *= amp
+        data += noise.astype(np.float32)
+        return out
 
     def __repr__(self) -> str:
         return f"AddGaussianNoise([{self.min_amplitude}, {self.max_amplitude}])"
@@ -0,0 +1,103 @@
+"""Pre-built MIDI event and parameter change arrays for the process calls.
+
+``Plugin.process_midi`` / ``process_auto`` (and the chain / bus equivalents)
+accept MIDI input as a list of ``(sample_offset, status, data1, data2)``
+tuples. For dense sequences that means one Python tuple unpack per event on
+every block. They also accept a 1-D numpy structured array laid out like
+the C ``MH_MidiEvent`` struct, which the binding copies in a single
+``memcpy``::
+
+    ev = minihost.make_midi_events(2)
+    ev[0] = (0, 0x90, 60, 100)    # note on at sample 0
+    ev[1] = (256, 0x80, 60, 0)    # note off at sample 256
+    plugin.process_midi(input_audio, output_audio, ev)
+
+``Plugin.process_auto`` takes its ``param_changes`` the same way: a list of
+``(sample_offset, param_index, value)`` tuples, or a structured array from
+``make_param_changes`` laid out like the C ``MH_ParamChange`` struct.
+
+numpy is optional for minihost as a whole; only this module needs it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "Event arrays require numpy. Install minihost with the "
+            "numpy extra: 'pip install minihost[numpy]'."
+        ) from e
+    return np
+
+
+def midi_event_dtype() -> Any:
+    """Return the numpy dtype matching the C ``MH_MidiEvent`` layout.
+
+    Fields: ``sample_offset`` (int32), ``status``, ``data1``, ``data2``
+    (uint8), aligned to the 8-byte C struct size.
+    """
+    np = _require_numpy()
+    return np.dtype(
+        [
+            ("sample_offset", np.int32),
+            ("status", np.uint8),
+            ("data1", np.uint8),
+            ("data2", np.uint8),
+        ],
+        align=True,
+    )
+
+
+def make_midi_events(n: int) -> Any:
+    """Return a zeroed structured array of ``n`` MIDI events.
+
+    The array can be filled by index or field (``ev["status"][:] = 0x90``)
+    and passed directly as ``midi_in`` to the process methods, skipping the
+    per-tuple conversion of the list form.
+
+    Raises:
+        ValueError: If ``n`` is negative.
+        ImportError: If numpy is not installed.
+    """
+    if n < 0:
+        raise ValueError(f"n must be >= 0, got {n}")
+    np = _require_numpy()
+    return np.zeros(int(n), dtype=midi_event_dtype())
+
+
+def param_change_dtype() -> Any:
+    """Return the numpy dtype matching the C ``MH_ParamChange`` layout.
+
+    Fields: ``sample_offset``, ``param_index`` (int32) and ``value``
+    (float32), 12 bytes per record.
+    """
+    np = _require_numpy()
+    return np.dtype(
+        [
+            ("sample_offset", np.int32),
+            ("param_index", np.int32),
+            ("value", np.float32),
+        ],
+        align=True,
+    )
+
+
+def make_param_changes(n: int) -> Any:
+    """Return a zeroed structured array of ``n`` parameter changes.
+
+    Pass it as ``param_changes`` to ``Plugin.process_auto``; the binding
+    copies it in one ``memcpy`` instead of converting a tuple per change.
+
+    Raises:
+        ValueError: If ``n`` is negative.
+        ImportError: If numpy is not installed.
+    """
+    if n < 0:
+        raise ValueError(f"n must be >= 0, got {n}")
+    np = _require_numpy()
+    return np.zeros(int(n), dtype=param_change_dtype())
@@ -20,7 +20,7 @@ Cache location (override with ``MINIHOST_CACHE_DIR``):
 Plugin discovery is by known extension (.vst3, .component, .lv2, ...), so a
 cached scan finds the same file/bundle plugins as the uncached
 ``minihost.scan_directory`` for the formats minihost supports. Pass
-``no_cache`` at the CLI (or call ``minihost.scan_directory``) to bypass.
+``--no-cache`` at the CLI (or call ``scan_uncached``) to bypass.
 """
 
 from __future__ import annotations
@@ -28,10 +28,12 @@ from __future__ import annotations
 import json
 import os
 import sys
+import tempfile
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Collection, Iterator
 
 import minihost
+from minihost._core import SCAN_DIRECTORY_EXTENSIONS
 
 SCHEMA_VERSION = 1
 
@@ -40,6 +42,11 @@ SCHEMA_VERSION = 1
 PLUGIN_EXTS = {".vst3", ".component", ".lv2", ".vst", ".clap", ".dll", ".so"}
 
 
+# The bundle types ``minihost.scan_directory`` enumerates, as reported by the
+# native scanner for this build; `scan_uncached` matches it.
+_SCAN_DIRECTORY_EXTS = frozenset(SCAN_DIRECTORY_EXTENSIONS)
+
+
 # -- cache location --------------------------------------------------- #
 
 
@@ -81,6 +88,26 @@ def _fingerprint(path: str) -> dict:
 # -- raw cache I/O ---------------------------------------------------- #
 
 
+def _json_loads(data: bytes) -> Any:
+    # orjson is optional; when installed it reads and writes the cache --
+    # one entry per plugin, so thousands for a large collection -- several
+    # times faster than the stdlib module. It is imported here, on first
+    # use, so importing this module never pays for it.
+    try:
+        import orjson  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _json_dumps(doc: dict) -> bytes:
+    try:
+        import orjson  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return (json.dumps(doc, indent=2) + "\n").encode()
+    return orjson.dumps(doc, option=orjson.OPT_INDENT_2) + b"\n"
+
+
 def _empty() -> dict:
     return {"schema": SCHEMA_VERSION, "entries": {}}
 
@@ -90,8 +117,9 @@ def _load_raw() -> dict:
     if not f.exists():
         return _empty()
     try:
-        doc = json.loads(f.read_text())
-    except (json.JSONDecodeError, OSError):
+        data = f.read_bytes()
+        doc = _json_loads(data)
+    except (ValueError, OSError):  # JSONDecodeError and bad UTF-8 included
         return _empty()
     if not isinstance(doc, dict) or doc.get("schema") != SCHEMA_VERSION:
         return _empty()
@@ -101,20 +129,40 @@ def _load_raw() -> dict:
 
 
 def _save_raw(doc: dict) -> None:
+    """Write the cache atomically. Each writer gets its own temp file in the
+    cache directory, so two concurrent scans never share (and clobber) one;
+    the last ``os.replace`` wins and readers only ever see a complete file."""
     f = cache_file()
     f.parent.mkdir(parents=True, exist_ok=True)
-    tmp = f.with_suffix(f.suffix + ".tmp")
-    tmp.write_text(json.dumps(doc, indent=2) + "\n")
-    tmp.replace(f)
+    data = _json_dumps(doc)
+    fd, tmp = tempfile.mkstemp(dir=f.parent, prefix=f.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(data)
+        os.replace(tmp, f)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
 # -- discovery -------------------------------------------------------- #
 
 
-def _discover_plugins(directory: str) -> list[str]:
+def _discover_plugins(
+    directory: str,
+    exts: Collection[str] = PLUGIN_EXTS,
+    *,
+    bundles_only: bool = False,
+) -> list[str]:
     """Return absolute paths of plugin bundles/files under `directory`,
     recursing into plain directories but treating any plugin-extension
-    entry as a leaf (so we never descend into a .vst3 bundle)."""
+    entry as a leaf (so we never descend into a .vst3 bundle).
+    `bundles_only` keeps only matching directories, as the native scan
+    does. Directory entries carry their file type, so the walk needs no
+    extra ``stat`` per entry."""
     out: list[str] = []
 
     def walk(d: str) -> None:
@@ -124,20 +172,24 @@ def _discover_plugins(directory: str) -> list[str]:
             return
         for e in entries:
             ext = os.path.splitext(e.name)[1].lower()
-            if ext in PLUGIN_EXTS:
-                out.append(os.path.abspath(e.path))  # leaf
+            if ext in exts:
+                if not bundles_only or _is_dir(e, follow_symlinks=True):
+                    out.append(os.path.abspath(e.path))  # leaf
                 continue
-            try:
-                is_dir = e.is_dir(follow_symlinks=False)
-            except OSError:
-                is_dir = False
-            if is_dir:
+            if _is_dir(e, follow_symlinks=False):
                 walk(e.path)
 
     walk(str(directory))
     return sorted(out)
 
 
+def _is_dir(entry: os.DirEntry, *, follow_symlinks: bool) -> bool:
+    try:
+        return entry.is_dir(follow_symlinks=follow_symlinks)
+    except OSError:
+        return False
+
+
 # -- entry helpers ---------------------------------------------------- #
 
 
@@ -148,21 +200,84 @@ def _entry_fresh(entry: dict, path: str) -> bool:
         return False
 
 
-def _probe_to_entry(path: str) -> dict:
+def _fingerprint_or_none(path: str) -> Any:
     try:
-        fp: Any = _fingerprint(path)
+        return _fingerprint(path)
     except OSError:
-        fp = None
+        return None
+
+
+def _error_entry(path: str, error: str, fp: Any) -> dict:
+    return {"status": "error", "error": error, "desc": {"path": path}, "fp": fp}
+
+
+def _probe_to_entry(path: str) -> dict:
+    fp = _fingerprint_or_none(path)
     try:
         desc = _probe(path)
         return {"status": "ok", "desc": desc, "fp": fp}
     except Exception as e:  # probe raises RuntimeError on failure
-        return {
-            "status": "error",
-            "error": str(e),
-            "desc": {"path": path},
-            "fp": fp,
-        }
+        return _error_entry(path, str(e), fp)
+
+
+def _executor(workers: int) -> Any:
+    """Pool for parallel probes. Each worker is a fresh (spawned, never
+    forked) process: probing loads the plugin in-process, JUCE's module
+    loading is not safe to run concurrently from threads, and a plugin that
+    crashes while loading takes down only its pool. Indirected so tests
+    can substitute a thread pool."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _probe_entries(paths: list[str], jobs: int) -> Iterator[tuple[str, dict]]:
+    """Yield ``(path, entry)`` for each path, probing in up to `jobs`
+    worker processes (in completion order) when ``jobs > 1``."""
+    if jobs <= 1 or len(paths) < 2:
+        for path in paths:
+            yield path, _probe_to_entry(path)
+        return
+
+    from concurrent.futures import as_completed
+    from concurrent.futures.process import BrokenProcessPool
+
+    crashed: list[str] = []
+    with _executor(min(jobs, len(paths))) as pool:
+        futures = {pool.submit(_probe_to_entry, path): path for path in paths}
+        for fut in as_completed(futures):
+            try:
+                entry = fut.result()
+            except BrokenProcessPool:
+                # A worker died; which plugin killed it is unknown, so
+                # the affected paths are retried one at a time below
+                # rather than cached as errors.
+                crashed.append(futures[fut])
+                continue
+            yield futures[fut], entry
+    for path in sorted(crashed):
+        yield path, _probe_isolated(path)
+
+
+def _probe_isolated(path: str) -> dict:
+    """Probe `path` alone in a fresh single-worker process.
+
+    Used for the paths in flight when a shared pool broke. Never probed
+    in this process: the plugin that killed the pool would kill the scan
+    too. A plugin that crashes its own worker is recorded as an error.
+    """
+    from concurrent.futures.process import BrokenProcessPool
+
+    with _executor(1) as pool:
+        try:
+            return pool.submit(_probe_to_entry, path).result()
+        except BrokenProcessPool:
+            return _error_entry(
+                path, "plugin crashed the probe process", _fingerprint_or_none(path)
+            )
 
 
 # -- public API ------------------------------------------------------- #
@@ -174,29 +289,46 @@ def scan(
     refresh: bool = False,
     include_errors: bool = False,
     on_progress: Callable[[int, int, str], None] | None = None,
+    jobs: int = 1,
 ) -> list[dict]:
     """Scan `directory` for plugins, using and updating the cache.
 
     Only new or changed plugins (by fingerprint) are probed; everything
     else is served from cache. Returns the list of probe-metadata dicts for
-    successfully-probed plugins (plus error stubs if `include_errors`).
-    `refresh=True` re-probes every discovered plugin. `on_progress(done,
-    total, path)` is called per plugin if provided.
+    successfully-probed plugins (plus error stubs if `include_errors`), in
+    path order. `refresh=True` re-probes every discovered plugin.
+    `on_progress(done, total, path)` is called per plugin if provided:
+    cached plugins first, then each probed plugin as it finishes.
+    `jobs > 1` probes in up to that many worker processes (``0``: one per
+    CPU), which pays off when many plugins need probing.
     """
     doc = _load_raw()
     entries = doc["entries"]
     paths = _discover_plugins(str(directory))
-    results: list[dict] = []
-    changed = False
+    total = len(paths)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
 
-    for i, path in enumerate(paths):
+    stale: list[str] = []
+    done = 0
+    for path in paths:
         entry = entries.get(path)
         if refresh or entry is None or not _entry_fresh(entry, path):
-            entry = _probe_to_entry(path)
-            entries[path] = entry
-            changed = True
+            stale.append(path)
+            continue
+        done += 1
         if on_progress is not None:
-            on_progress(i + 1, len(paths), path)
+            on_progress(done, total, path)
+
+    for path, entry in _probe_entries(stale, jobs):
+        entries[path] = entry
+        done += 1
+        if on_progress is not None:
+            on_progress(done, total, path)
+
+    results: list[dict] = []
+    for path in paths:
+        entry = entries[path]
         if entry["status"] == "ok":
             results.append(entry["desc"])
         elif include_errors:
@@ -208,11 +340,44 @@ def scan(
                 }
             )
 
-    if changed:
+    if stale:
         _save_raw(doc)
     return results
 
 
+def _open_session() -> Any:
+    """Open a probe session. Indirected so tests can monkeypatch it."""
+    return minihost.Session()
+
+
+def scan_uncached(directory: str | Path) -> list[dict]:
+    """Probe every plugin bundle under `directory`, bypassing the cache.
+
+    Returns the same plugins and dicts as ``minihost.scan_directory``
+    (failed probes are skipped), in path order. Discovery is one
+    ``os.scandir`` walk that never descends into a bundle, where the
+    native scan walks the whole tree, bundle contents included, once per
+    format. Probes share one session's format manager.
+
+    Raises:
+        RuntimeError: If `directory` is not a directory.
+    """
+    directory = str(directory)
+    if not os.path.isdir(directory):
+        raise RuntimeError(f"Failed to scan directory: {directory}")
+    paths = _discover_plugins(directory, _SCAN_DIRECTORY_EXTS, bundles_only=True)
+    results: list[dict] = []
+    with _open_session() as session:
+        for path in paths:
+            try:
+                desc = session.probe(path)
+            except RuntimeError:
+                continue
+            desc["path"] = path
+            results.append(desc)
+    return results
+
+
 def info(path: str | Path, *, refresh: bool = False) -> dict:
     """Return cached probe metadata for one plugin, probing (and caching)
     on a cache miss or stale fingerprint. Raises RuntimeError if the plugin
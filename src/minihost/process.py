@@ -26,7 +26,9 @@ when the caller passes a numpy array).
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Iterator, Sequence, Union, cast
 
@@ -105,18 +107,12 @@ def _load_midi_events(
                     "MIDI events must be 4-tuples of "
                     "(sample_offset, status, data1, data2)."
                 )
-        events.sort(key=lambda e: e[0])
+        events.sort(key=itemgetter(0))
         return events, (events[-1][0] if events else 0)
 
     # Lazy import to avoid pulling MIDI parsing helpers into the
     # AudioBuffer-only path.
-    from minihost.render import (
-        _build_tempo_map,
-        _collect_midi_events,
-        _event_to_midi_tuple,
-        _seconds_to_samples,
-        _tick_to_seconds,
-    )
+    from minihost.render import _midi_plan
 
     if isinstance(midi, (str, Path)):
         mf = MidiFile()
@@ -130,50 +126,63 @@ def _load_midi_events(
             f"got {type(midi).__name__}."
         )
 
-    tpq = mf.ticks_per_quarter
-    tempo_map = _build_tempo_map(mf)
-    raw = _collect_midi_events(mf)
-
-    out: list[MidiEvent] = []
-    max_sample = 0
-    for event in raw:
-        seconds = _tick_to_seconds(event["tick"], tempo_map, tpq)
-        sample_pos = _seconds_to_samples(seconds, sample_rate)
-        tup = _event_to_midi_tuple(event, sample_pos)
-        if tup:
-            out.append(tup)
-            if sample_pos > max_sample:
-                max_sample = sample_pos
-    out.sort(key=lambda e: e[0])
-    return out, max_sample
+    # Copied: the plan's list is shared with other renders of this file.
+    out = list(_midi_plan(mf, sample_rate).events)
+    return out, (out[-1][0] if out else 0)
 
 
 def _slice_block_events(
     events: Sequence[tuple],
+    positions: Sequence[int],
     idx: int,
     start: int,
     end: int,
-    *,
-    drop_leading: int = 0,
 ) -> tuple[list[tuple], int]:
     """Collect ``events`` whose absolute sample position lies in ``[start, end)``.
 
-    Returns ``(block_events, next_idx)`` where each ``block_events`` entry
-    has its first element rewritten to a block-relative offset clamped to
-    ``[0, end - start - 1]``. ``drop_leading`` skips that many leading
-    fields when computing offsets (unused here -- kept for symmetry).
+    ``positions`` holds each event's sample position (``events[i][0]``),
+    sorted, so the block boundary is found with one ``bisect`` instead of
+    comparing event by event. Returns ``(block_events, next_idx)`` where
+    each ``block_events`` entry has its first element rewritten to a
+    block-relative offset clamped to ``[0, end - start - 1]``.
     """
+    stop = bisect_left(positions, end, idx)
     block: list[tuple] = []
-    bsize = end - start
-    while idx < len(events):
-        sample_pos = events[idx][0]
-        if sample_pos >= end:
-            break
-        offset = max(0, min(sample_pos - start, bsize - 1))
-        rest = events[idx][1:]
-        block.append((offset,) + rest)
-        idx += 1
-    return block, idx
+    for i in range(idx, stop):
+        ev = events[i]
+        # Every event before ``stop`` is below ``end``, so only events
+        # left behind by an earlier block (offset < 0) need clamping.
+        offset = ev[0] - start
+        block.append((offset if offset > 0 else 0,) + ev[1:])
+    return block, stop
+
+
+def _fill_block(
+    dst: AudioBuffer,
+    src: AudioBuffer | None,
+    src_frames: int,
+    channels: int,
+    start: int,
+    n: int,
+) -> bool:
+    """Load ``src[:channels, start:start + n]`` into the head of ``dst``.
+
+    Frames at or past ``src_frames`` (and the rest of ``dst``) are zeroed.
+    Each channel is copied with ``copy_from`` rather than slice assignment,
+    which would allocate a temporary buffer for ``src[...]`` on every block,
+    and only the frames that are not overwritten are cleared.
+
+    Returns True if any source frames were copied, False if ``dst`` is
+    now silent.
+    """
+    ncopy = 0
+    if src is not None and start < src_frames:
+        ncopy = min(n, src_frames - start)
+        for ch in range(channels):
+            dst.copy_from(ch, 0, src, ch, start, ncopy)
+    if ncopy < dst.frames:
+        dst.clear(ncopy, dst.frames - ncopy)
+    return ncopy > 0
 
 
 @dataclass
@@ -213,7 +222,7 @@ def _prepare_render(
 ) -> _RenderContext:
     """Validate inputs, resolve sources, compute geometry, set transport.
 
-    The returned context is consumed by :func:`_iter_blocks` to drive
+    The returned context is consumed by :func:`_iter_spans` to drive
     the per-block process loop. Side effect: sets the plugin's
     transport when ``bpm`` is given.
     """
@@ -279,7 +288,7 @@ def _prepare_render(
         sc_buf=sc_buf,
         midi_events=midi_events,
         has_midi=bool(midi_events),
-        auto_list=list(param_changes) if param_changes else [],
+        auto_list=sorted(param_changes, key=itemgetter(0)) if param_changes else [],
         has_auto=bool(param_changes),
         has_sidechain=sc_buf is not None,
         out_frames=out_frames,
@@ -288,24 +297,18 @@ def _prepare_render(
     )
 
 
-def _iter_blocks(
+def _iter_spans(
     ctx: _RenderContext,
     progress_callback: ProgressCallback | None = None,
-    *,
-    copy: bool = True,
-) -> Iterator[AudioBuffer]:
-    """Per-block process loop yielding user-visible output AudioBuffer
-    slices (post-latency-compensation, post-trim).
-
-    Concatenating every yielded block reproduces what
-    ``process_audio`` would return into a pre-allocated buffer.
-
-    ``copy`` (default True): yield independent buffers. Required for
-    streaming consumers that might read past the next iteration --
-    without it they'd see the reused internal ``out_block`` get
-    overwritten. Pass ``copy=False`` from in-memory consumers that
-    copy out of the yielded block immediately (like
-    :func:`process_audio` writing into a pre-allocated output).
+) -> Iterator[tuple[AudioBuffer, int, int]]:
+    """Per-block process loop yielding ``(block, offset, count)``.
+
+    Frames ``[offset, offset + count)`` of ``block`` are the next piece of
+    user-visible output (post-latency-compensation, post-trim). ``block``
+    is a reused internal buffer, overwritten on the next iteration, so the
+    consumer must copy the span out before advancing. Yielding a span
+    instead of a sliced buffer lets in-memory consumers copy straight into
+    their destination; ``buf[:, a:b]`` would allocate a copy first.
     """
     if ctx.out_frames <= 0:
         if progress_callback is not None:
@@ -337,49 +340,52 @@ def _iter_blocks(
     out_block = AudioBuffer(out_ch, block)
     sc_block = AudioBuffer(work_in, block) if sc_buf is not None else None
 
+    # Sorted sample positions, for bisecting each block's event range.
+    midi_pos = [ev[0] for ev in midi_events]
+    auto_pos = [ev[0] for ev in auto_list]
     midi_idx = 0
     auto_idx = 0
     skip_remaining = ctx.latency
     emitted = 0
+    # Whether the input / sidechain block holds source frames. Plugins read
+    # their input through a const pointer, so a cleared block stays silent:
+    # past the end of the source (the tail, or a synth with no input at
+    # all) it is cleared once instead of on every block. New AudioBuffers
+    # start zeroed.
+    in_live = False
+    sc_live = False
 
     for start in range(0, render_frames, block):
         n = min(block, render_frames - start)
 
-        in_block.clear()
-        if src is not None and start < src_frames:
-            ncopy = min(n, src_frames - start)
-            in_block[:work_in, :ncopy] = src[:work_in, start : start + ncopy]
+        if n == block:
+            pin, pout = in_block, out_block
+            psc = sc_block
+        else:
+            # Final partial block: plugins take the frame count from the
+            # buffer shape, so it gets its own (one-off) n-frame buffers.
+            pin = AudioBuffer(work_in, n)
+            pout = AudioBuffer(out_ch, n)
+            psc = AudioBuffer(work_in, n) if sc_block is not None else None
+            in_live = sc_live = False
 
-        if sc_block is not None and sc_buf is not None:
-            sc_block.clear()
-            if start < sc_buf.frames:
-                ncopy = min(n, sc_buf.frames - start)
-                sc_block[:work_in, :ncopy] = sc_buf[:work_in, start : start + ncopy]
+        if in_live or (src is not None and start < src_frames):
+            in_live = _fill_block(pin, src, src_frames, work_in, start, n)
+        if psc is not None and sc_buf is not None:
+            if sc_live or start < sc_buf.frames:
+                sc_live = _fill_block(psc, sc_buf, sc_buf.frames, work_in, start, n)
 
         block_midi, midi_idx = (
-            _slice_block_events(midi_events, midi_idx, start, start + n)
+            _slice_block_events(midi_events, midi_pos, midi_idx, start, start + n)
             if has_midi
             else ([], midi_idx)
         )
         block_auto, auto_idx = (
-            _slice_block_events(auto_list, auto_idx, start, start + n)
+            _slice_block_events(auto_list, auto_pos, auto_idx, start, start + n)
             if has_auto
             else ([], auto_idx)
         )
 
-        if n == block:
-            pin, pout = in_block, out_block
-            psc = sc_block
-        else:
-            pin = AudioBuffer(work_in, n)
-            pin[:work_in, :n] = in_block[:work_in, :n]
-            pout = AudioBuffer(out_ch, n)
-            if sc_block is not None:
-                psc = AudioBuffer(work_in, n)
-                psc[:work_in, :n] = sc_block[:work_in, :n]
-            else:
-                psc = None
-
         if has_sidechain:
             for ev in block_auto:
                 if len(ev) == 3:
@@ -401,23 +407,17 @@ def _iter_blocks(
         else:
             plugin_or_chain.process(pin, pout)
 
-        produced: AudioBuffer = pout
-
         if skip_remaining >= n:
             skip_remaining -= n
             continue
-        if skip_remaining > 0:
-            produced = cast(AudioBuffer, produced[:, skip_remaining:])
-            skip_remaining = 0
-
-        emit = produced.frames
-        if emitted + emit > out_frames:
-            emit = out_frames - emitted
-            if emit <= 0:
-                break
-            produced = cast(AudioBuffer, produced[:, :emit])
-
-        yield produced.copy() if copy else produced
+        offset = skip_remaining
+        skip_remaining = 0
+
+        emit = min(n - offset, out_frames - emitted)
+        if emit <= 0:
+            break
+
+        yield pout, offset, emit
         emitted += emit
         if progress_callback is not None:
             progress_callback(min(emitted, out_frames), out_frames)
@@ -429,6 +429,25 @@ def _iter_blocks(
         progress_callback(out_frames, out_frames)
 
 
+def _iter_blocks(
+    ctx: _RenderContext,
+    progress_callback: ProgressCallback | None = None,
+) -> Iterator[AudioBuffer]:
+    """Per-block process loop yielding independent user-visible output
+    AudioBuffers (post-latency-compensation, post-trim).
+
+    Concatenating every yielded block reproduces what
+    ``process_audio`` would return into a pre-allocated buffer. Each
+    block is its own copy, so streaming consumers may hold on to it past
+    the next iteration.
+    """
+    for buf, offset, count in _iter_spans(ctx, progress_callback):
+        if offset == 0 and count == buf.frames:
+            yield buf.copy()
+        else:
+            yield cast(AudioBuffer, buf[:, offset : offset + count])  # a copy
+
+
 def process_audio(
     plugin_or_chain: "PluginOrChain",
     audio: Any | None = None,
@@ -535,11 +554,12 @@ def process_audio(
     else:
         output = AudioBuffer(ctx.out_ch, ctx.out_frames)
     written = 0
-    # copy=False: process_audio memcpys each block straight into the
-    # pre-allocated output, so the reused internal buffer is safe.
-    for block in _iter_blocks(ctx, progress_callback=progress_callback, copy=False):
-        n = block.frames
-        output[:, written : written + n] = block
+    # Spans are copied straight from the reused internal block into the
+    # pre-allocated output, with no intermediate slice.
+    out_ch = output.channels
+    for block, offset, n in _iter_spans(ctx, progress_callback=progress_callback):
+        for ch in range(out_ch):
+            output.copy_from(ch, written, block, ch, offset, n)
         written += n
 
     if normalize is not None:
@@ -658,11 +678,12 @@ def _maybe_duplicate_to_match(
             f"{required}. Pass duplicate_to_stereo=True to "
             f"channel-duplicate automatically."
         )
+    # One allocation, filled channel by channel. Slicing ``src`` (for the
+    # last channel) would allocate a second full-length copy first.
     expanded = AudioBuffer(required, src.frames)
-    expanded[: src.channels, :] = src
-    last = cast(AudioBuffer, src[src.channels - 1 : src.channels, :])
-    for ch in range(src.channels, required):
-        expanded[ch : ch + 1, :] = last
+    last = src.channels - 1
+    for ch in range(required):
+        expanded.copy_from(ch, 0, src, min(ch, last), 0, src.frames)
     return expanded
 
 
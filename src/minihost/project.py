@@ -70,12 +70,14 @@ from __future__ import annotations
 
 import base64
 import json
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import minihost
 from minihost import audio_io
+from minihost._util import as_audio
 from minihost.render import midi_file_to_events
 
 
@@ -391,7 +393,9 @@ def load_project(project_path: str | Path) -> LoadedProject:
                 f"input {n.id!r}: file has {data.shape[0]} channels, "
                 f"project declares {n.channels}"
             )
-        n.audio = np.ascontiguousarray(data, dtype=np.float32)  # type: ignore[union-attr]
+        # read_audio / resample already return C-contiguous float32, which
+        # as_audio passes through without a numpy call.
+        n.audio = as_audio(data)
 
     # Compute render length.
     if duration_seconds is not None:
@@ -625,32 +629,40 @@ def _render_loaded(p: LoadedProject, *, progress_callback=None) -> None:
         np.zeros((n.channels, frames_total), dtype=np.float32) for n in p.outputs
     ]
 
-    # Per-input cursors into each MIDI source's (sorted) event list, so
-    # staging a block is a forward walk rather than a rescan.
+    # Per-input cursors into each MIDI source's (sorted) event list, plus
+    # the events' sample positions, so each block's end is one bisect.
     midi_cursors = [0] * len(p.midi_inputs)
+    midi_positions = [[ev[0] for ev in mi.events] for mi in p.midi_inputs]
+
+    # Leading frames of each input buffer that may still hold source
+    # audio. The graph reads inputs through const pointers, so once a
+    # source runs out its buffer is cleared once and then left alone,
+    # rather than re-zeroed on every block of the tail.
+    in_filled = [0] * len(p.inputs)
 
     frame = 0
     while frame < frames_total:
         n_frames = min(block, frames_total - frame)
         # Stage audio inputs.
-        for buf, node in zip(in_bufs, p.inputs):
+        for i, (buf, node) in enumerate(zip(in_bufs, p.inputs)):
             avail = max(0, min(n_frames, node.audio.shape[1] - frame))
             if avail > 0:
                 buf[:, :avail] = node.audio[:, frame : frame + avail]
-            if avail < n_frames:
-                buf[:, avail:n_frames] = 0.0
+            stale = min(in_filled[i], n_frames)
+            if avail < stale:
+                buf[:, avail:stale] = 0.0
+            in_filled[i] = avail
         # Stage MIDI inputs: events in [frame, frame + n_frames), rebased
         # to a block-local sample offset.
         block_end = frame + n_frames
         for ci, mi in enumerate(p.midi_inputs):
-            events = mi.events
             cur = midi_cursors[ci]
-            block_events = []
-            while cur < len(events) and events[cur][0] < block_end:
-                off, status, d1, d2 = events[cur]
-                block_events.append((off - frame, status, d1, d2))
-                cur += 1
-            midi_cursors[ci] = cur
+            stop = bisect_left(midi_positions[ci], block_end, cur)
+            block_events = [
+                (off - frame, status, d1, d2)
+                for off, status, d1, d2 in mi.events[cur:stop]
+            ]
+            midi_cursors[ci] = stop
             p.graph.set_midi_input_events(mi.node_id, block_events)
         # Render.
         p.graph.render_block(in_bufs, out_scratch, n_frames)
@@ -8,6 +8,12 @@ provided.
 
 from __future__ import annotations
 
+import contextlib
+import os
+import weakref
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union, cast
 
 if TYPE_CHECKING:
@@ -37,15 +43,9 @@ def _build_tempo_map(midi_file: MidiFile) -> list[tuple[int, float]]:
 
     Returns list of (tick, microseconds_per_quarter) sorted by tick.
     """
-    tempo_map = []
-
-    for track_idx in range(midi_file.num_tracks):
-        events = midi_file.get_events(track_idx)
-        for event in events:
-            if event.get("type") == "tempo":
-                bpm = event["bpm"]
-                us_per_quarter = 60_000_000.0 / bpm
-                tempo_map.append((event["tick"], us_per_quarter))
+    tempo_map = [
+        (tick, 60_000_000.0 / bpm) for tick, bpm in midi_file.get_tempo_changes()
+    ]
 
     # Sort by tick, default tempo if none specified
     if not tempo_map:
@@ -91,38 +91,101 @@ def _tick_to_seconds(tick: int, tempo_map: list[tuple[int, float]], tpq: int) ->
     return seconds
 
 
+def _tick_converter(
+    tempo_map: list[tuple[int, float]], tpq: int, max_tick: Optional[int] = None
+) -> Callable[[int], float]:
+    """Return a ``tick -> seconds`` function equivalent to
+    :func:`_tick_to_seconds` for a fixed tempo map.
+
+    ``_tick_to_seconds`` re-walks the tempo map for every tick, which is
+    O(events x tempo changes) over a file. This precomputes the elapsed
+    time at each tempo change (accumulated in the same order, so results
+    are bit-identical) and bisects for the segment, so each conversion is
+    O(log tempo changes).
+
+    Most files never change tempo, so a single-entry map gets a plain
+    scale with no bisect (the same arithmetic the general path does for
+    that map, so still bit-identical). Given ``max_tick``, the largest
+    tick that will be converted, tempo changes at or after it are dropped
+    first: they cannot affect any such tick, and a file whose events all
+    precede its first tempo change then takes the single-tempo path too.
+    """
+    if max_tick is not None and len(tempo_map) > 1:
+        in_range = bisect_left(tempo_map, max_tick, key=itemgetter(0))
+        tempo_map = tempo_map[: max(1, in_range)]
+    if len(tempo_map) == 1:
+        seconds_per_quarter = tempo_map[0][1] / 1_000_000.0
+
+        def constant_tempo(tick: int) -> float:
+            return (tick / tpq) * seconds_per_quarter
+
+        return constant_tempo
+
+    map_ticks = [t for t, _ in tempo_map]
+    # start[k]: seconds elapsed at map_ticks[k]; tempos[k]: the tempo
+    # (microseconds per quarter) in force after it.
+    start: list[float] = []
+    tempos: list[float] = []
+    seconds = 0.0
+    prev_tick = 0
+    prev_tempo = tempo_map[0][1]
+    for map_tick, tempo in tempo_map:
+        seconds += ((map_tick - prev_tick) / tpq) * (prev_tempo / 1_000_000.0)
+        start.append(seconds)
+        tempos.append(tempo)
+        prev_tick = map_tick
+        prev_tempo = tempo
+    first_tempo = tempo_map[0][1]
+
+    def to_seconds(tick: int) -> float:
+        # Last tempo change strictly before `tick` (the loop in
+        # _tick_to_seconds stops at the first change at or after it).
+        k = bisect_left(map_ticks, tick) - 1
+        if k < 0:
+            return (tick / tpq) * (first_tempo / 1_000_000.0)
+        return start[k] + ((tick - map_ticks[k]) / tpq) * (tempos[k] / 1_000_000.0)
+
+    return to_seconds
+
+
 def _seconds_to_samples(seconds: float, sample_rate: float) -> int:
     """Convert seconds to sample position."""
     return int(seconds * sample_rate)
 
 
+_PLAYABLE_EVENT_TYPES = frozenset(
+    {"note_on", "note_off", "control_change", "program_change", "pitch_bend"}
+)
+
+
 def _collect_midi_events(midi_file: MidiFile) -> list[dict]:
-    """Collect all MIDI events from all tracks, sorted by tick."""
+    """Collect all MIDI events from all tracks, sorted by tick.
+
+    Not used by the render path, which reads tuples straight from
+    ``MidiFile.get_channel_events``. Kept with ``_event_to_midi_tuple`` as
+    the readable dict-based reference the tests check that method against.
+    """
     all_events = []
 
     for track_idx in range(midi_file.num_tracks):
         events = midi_file.get_events(track_idx)
         for event in events:
             # Only include playable events (not meta events like tempo)
-            event_type = event.get("type")
-            if event_type in (
-                "note_on",
-                "note_off",
-                "control_change",
-                "program_change",
-                "pitch_bend",
-            ):
+            if event.get("type") in _PLAYABLE_EVENT_TYPES:
                 all_events.append(event)
 
     # Sort by tick
-    all_events.sort(key=lambda x: x["tick"])
+    all_events.sort(key=itemgetter("tick"))
     return all_events
 
 
 def _event_to_midi_tuple(
     event: dict, sample_offset: int
 ) -> tuple[int, int, int, int] | None:
-    """Convert event dict to (sample_offset, status, data1, data2) tuple."""
+    """Convert event dict to (sample_offset, status, data1, data2) tuple.
+
+    Reference implementation only; see ``_collect_midi_events``.
+    """
     event_type = event["type"]
     channel = event.get("channel", 0)
 
@@ -153,6 +216,112 @@ def _event_to_midi_tuple(
     return (sample_offset, status, data1, data2)
 
 
+@dataclass(frozen=True)
+class _MidiPlan:
+    """A MidiFile resolved at one sample rate.
+
+    Everything a render needs from the file, independent of the plugin:
+    the playable events as ``(sample_pos, status, data1, data2)`` tuples
+    sorted by position, the positions alone (for bisecting block
+    boundaries), and the time of the last event in seconds. Shared
+    between callers, so neither list may be mutated.
+    """
+
+    events: list[tuple[int, int, int, int]]
+    positions: list[int]
+    duration: float
+
+
+@dataclass
+class _MidiFileCache:
+    """What has been resolved for one revision of a MidiFile."""
+
+    revision: int
+    duration: Optional[float] = None
+    plans: dict[float, _MidiPlan] = field(default_factory=dict)
+
+
+# One entry per MidiFile. It goes away with its MidiFile and is replaced
+# once the file's revision moves on.
+_file_cache: weakref.WeakKeyDictionary[MidiFile, _MidiFileCache] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cache_for(midi_file: MidiFile) -> _MidiFileCache:
+    revision = midi_file.revision
+    cache = _file_cache.get(midi_file)
+    if cache is None or cache.revision != revision:
+        cache = _file_cache[midi_file] = _MidiFileCache(revision)
+    return cache
+
+
+def _build_midi_plan(midi_file: MidiFile, sample_rate: float) -> _MidiPlan:
+    # get_channel_events resolves the playable events to tuples in C++,
+    # matching _collect_midi_events + _event_to_midi_tuple without a dict
+    # per event; only the tick -> sample conversion is left to Python.
+    channel_events = midi_file.get_channel_events()
+    tick_to_seconds = _tick_converter(
+        _build_tempo_map(midi_file),
+        midi_file.ticks_per_quarter,
+        channel_events[-1][0] if channel_events else 0,
+    )
+    events = [
+        (_seconds_to_samples(tick_to_seconds(tick), sample_rate), status, d1, d2)
+        for tick, status, d1, d2 in channel_events
+    ]
+    # Events are sorted by tick, so the last one is the latest.
+    duration = tick_to_seconds(channel_events[-1][0]) if channel_events else 0.0
+    return _MidiPlan(events, [ev[0] for ev in events], duration)
+
+
+def _midi_plan(midi_file: MidiFile, sample_rate: float) -> _MidiPlan:
+    """Return the plan for ``midi_file`` at ``sample_rate``, building it once.
+
+    Repeated renders of the same file (e.g. through several plugin chains)
+    skip the tempo-map walk and event conversion. Any load or edit bumps
+    ``MidiFile.revision``, which invalidates the cached plans.
+    """
+    cache = _cache_for(midi_file)
+    plan = cache.plans.get(sample_rate)
+    if plan is None:
+        plan = cache.plans[sample_rate] = _build_midi_plan(midi_file, sample_rate)
+        cache.duration = plan.duration
+    return plan
+
+
+def midi_duration(midi_file: Union[MidiFile, str]) -> float:
+    """Return the time of the last playable MIDI event, in seconds.
+
+    The same value as :attr:`MidiRenderer.midi_duration_seconds` (no
+    tail), without creating a renderer or resolving events to samples.
+    It is cached on the ``MidiFile`` alongside the render plans, so asking
+    again (or rendering afterwards) does not rescan the file.
+
+    Raises:
+        RuntimeError: If ``midi_file`` is a path that fails to load.
+    """
+    if isinstance(midi_file, str):
+        mf = MidiFile()
+        if not mf.load(midi_file):
+            raise RuntimeError(f"Failed to load MIDI file: {midi_file}")
+    else:
+        mf = midi_file
+
+    cache = _cache_for(mf)
+    if cache.duration is None:
+        channel_events = mf.get_channel_events()
+        if channel_events:
+            last_tick = channel_events[-1][0]
+            tick_to_seconds = _tick_converter(
+                _build_tempo_map(mf), mf.ticks_per_quarter, last_tick
+            )
+            cache.duration = tick_to_seconds(last_tick)
+        else:
+            cache.duration = 0.0
+    return cache.duration
+
+
 def midi_file_to_events(
     midi_file: Union[MidiFile, str],
     sample_rate: float,
@@ -172,17 +341,7 @@ def midi_file_to_events(
     else:
         mf = midi_file
 
-    tempo_map = _build_tempo_map(mf)
-    tpq = mf.ticks_per_quarter
-    events: list[tuple[int, int, int, int]] = []
-    for event in _collect_midi_events(mf):
-        seconds = _tick_to_seconds(event["tick"], tempo_map, tpq)
-        offset = _seconds_to_samples(seconds, sample_rate)
-        tup = _event_to_midi_tuple(event, offset)
-        if tup is not None:
-            events.append(tup)
-    events.sort(key=lambda e: e[0])
-    return events
+    return list(_midi_plan(mf, sample_rate).events)
 
 
 def _is_auto_tail(tail_seconds: object) -> bool:
@@ -196,6 +355,11 @@ _AUTO_TAIL_THRESHOLD = 1e-4
 _AUTO_TAIL_SILENT_BLOCKS = 4
 # Maximum auto-tail duration in seconds (safety cap)
 _AUTO_TAIL_MAX_SECONDS = 30.0
+# Blocks with at least this many MIDI events hand them to the plugin as a
+# structured array (when numpy is installed): rebased in one vectorized
+# step and copied by the binding with one memcpy. Sparser blocks are
+# cheaper as a list of tuples than the array setup.
+_VECTORIZE_MIN_EVENTS = 16
 
 
 def render_midi_stream(
@@ -206,6 +370,7 @@ def render_midi_stream(
     tail_threshold: float = _AUTO_TAIL_THRESHOLD,
     max_tail_seconds: float = _AUTO_TAIL_MAX_SECONDS,
     as_: type | None = None,
+    copy: bool = True,
 ) -> "Iterator[AudioBuffer | np.ndarray]":
     """Render MIDI file through plugin or chain as a generator of audio blocks.
 
@@ -222,6 +387,10 @@ def render_midi_stream(
                          Default is 30.0 seconds.
         as_: Container type for each yielded block. ``AudioBuffer``
             (default) or ``numpy.ndarray``.
+        copy: If ``False``, skip the per-block copy: full blocks are the
+            renderer's two alternating output buffers, so each one is only
+            valid until the generator is advanced twice more. Use this when
+            every block is consumed (written, analysed) as it arrives.
 
     Yields:
         Audio blocks of shape ``(channels, n)`` where ``n <= block_size``.
@@ -248,7 +417,7 @@ def render_midi_stream(
         max_tail_seconds=max_tail_seconds,
     )
     while not renderer.is_finished:
-        block = renderer.render_block()
+        block = renderer.render_block(copy=copy)
         if block is not None:
             yield _coerce_block(block, as_)
 
@@ -343,9 +512,8 @@ def render_midi_to_file(
         raise ValueError("bit_depth must be 16, 24, or 32")
 
     # Use MidiRenderer directly so we can pre-allocate the output AudioBuffer
-    # against its known total_samples upper bound. AudioBuffer slice
-    # assignment (which accepts AudioBuffer sources via DLPack) replaces the
-    # previous numpy-view approach and removes numpy from this code path.
+    # against its known total_samples upper bound and copy each rendered
+    # span straight into it (no numpy, no per-block intermediate copy).
     renderer = MidiRenderer(
         plugin,
         midi_file,
@@ -364,20 +532,16 @@ def render_midi_to_file(
         )
         return 0
 
+    if normalize is None and os.path.splitext(output_path)[1].lower() == ".wav":
+        return _stream_to_wav(
+            renderer, output_path, sample_rate, bit_depth, progress_callback
+        )
+
     audio = AudioBuffer(out_channels, total)
     written = 0
-    while not renderer.is_finished:
-        block = renderer.render_block()
-        if block is None:
-            continue
-        n = block.frames
-        # Defensive: never write past the pre-allocated extent.
-        if written + n > total:
-            n = total - written
-            if n <= 0:
-                break
-            block = cast(AudioBuffer, block[:, :n])
-        audio[:, written : written + n] = block
+    for block, offset, n in renderer._spans(total):
+        for ch in range(out_channels):
+            audio.copy_from(ch, written, block, ch, offset, n)
         written += n
         if progress_callback is not None:
             progress_callback(min(written, total), total)
@@ -397,6 +561,50 @@ def render_midi_to_file(
     return written
 
 
+def _stream_to_wav(
+    renderer: "MidiRenderer",
+    output_path: str,
+    sample_rate: int,
+    bit_depth: int,
+    progress_callback: Optional[Callable[[int, int], None]],
+) -> int:
+    """Write ``renderer``'s output to a WAV file block by block.
+
+    Memory stays at one block however long the render is. Peak
+    normalization needs the whole render and FLAC is encoded in one pass,
+    so ``render_midi_to_file`` only takes this path for plain WAV output.
+    The blocks go to a temporary file next to ``output_path`` that
+    replaces it only once the render succeeds, so a failed render leaves
+    any existing file untouched.
+    """
+    from minihost.audio_io import open_audio_writer
+
+    total = renderer.total_samples
+    written = 0
+    # Not tempfile.mkstemp: the writer creates the file itself, so it gets
+    # the usual permissions rather than mkstemp's owner-only ones.
+    tmp = f"{output_path}.{os.urandom(4).hex()}.tmp.wav"
+    try:
+        writer = open_audio_writer(tmp, renderer.channels, sample_rate, bit_depth)
+        with writer:
+            for block, offset, n in renderer._spans(total):
+                if offset != 0 or n != block.frames:
+                    block = cast(AudioBuffer, block[:, offset : offset + n])
+                writer.write(block)
+                written += n
+                if progress_callback is not None:
+                    progress_callback(min(written, total), total)
+        os.replace(tmp, output_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+    if progress_callback is not None:
+        progress_callback(written, written)
+    return written
+
+
 class MidiRenderer:
     """Stateful MIDI renderer for advanced use cases.
 
@@ -471,18 +679,9 @@ class MidiRenderer:
             effective_tail = float(tail_seconds)
         self._tail_seconds = effective_tail
 
-        # Build tempo map and collect events
-        self._tempo_map = _build_tempo_map(self._midi_file)
-        all_events = _collect_midi_events(self._midi_file)
-
-        # Find total duration
-        if all_events:
-            last_tick = max(e["tick"] for e in all_events)
-            self._midi_duration = _tick_to_seconds(
-                last_tick, self._tempo_map, self._tpq
-            )
-        else:
-            self._midi_duration = 0.0
+        # Tempo map and events, resolved to samples (cached per file)
+        plan = _midi_plan(self._midi_file, self.sample_rate)
+        self._midi_duration = plan.duration
 
         self._midi_end_samples = _seconds_to_samples(
             self._midi_duration, self.sample_rate
@@ -511,21 +710,32 @@ class MidiRenderer:
         self._render_samples = self._total_samples + self._latency
         self._skip_remaining = self._latency
 
-        # Convert events to sample positions
-        self._events_with_samples = []
-        for event in all_events:
-            tick = event["tick"]
-            seconds = _tick_to_seconds(tick, self._tempo_map, self._tpq)
-            sample_pos = _seconds_to_samples(seconds, self.sample_rate)
-            self._events_with_samples.append((sample_pos, event))
+        # Events as (sample_pos, status, data1, data2), resolved up front so
+        # render_block only rebases offsets instead of dispatching on each
+        # event's type every time it comes round.
+        self._events_with_samples = plan.events
+        self._event_positions = plan.positions
+        # Structured-array copy for dense blocks; built on first use
+        # (None = not yet, False = numpy unavailable).
+        self._event_arrays: Any = None
 
         # Create buffers
         # Persistent block-sized scratch buffers. AudioBuffers are
-        # zero-initialized on construction; clear() is invoked per-block
-        # inside render_block(). Plugin.process_midi accepts AudioBuffer
-        # via DLPack so no numpy is involved on the hot path.
-        self._input_buffer = AudioBuffer(self._in_channels, block_size)
-        self._output_buffer = AudioBuffer(self._out_channels, block_size)
+        # zero-initialized on construction, which is all the (silent) input
+        # ever needs. Plugin.process_midi accepts AudioBuffer via DLPack so
+        # no numpy is involved on the hot path.
+        # Full blocks alternate between two output buffers, so a block
+        # handed out uncopied (render_block(copy=False)) survives one more
+        # call before it is overwritten. A render shorter than one block
+        # gets buffers sized to fit, so it runs through them rather than
+        # leaving them unused and allocating a one-off partial block.
+        self._buffer_frames = max(1, min(block_size, self._render_samples))
+        self._input_buffer = AudioBuffer(self._in_channels, self._buffer_frames)
+        self._output_buffers = (
+            AudioBuffer(self._out_channels, self._buffer_frames),
+            AudioBuffer(self._out_channels, self._buffer_frames),
+        )
+        self._output_index = 0
 
         # State
         self._current_sample = 0
@@ -597,9 +807,15 @@ class MidiRenderer:
         self._skip_remaining = self._latency
         self.plugin.reset()
 
-    def render_block(self) -> Optional[AudioBuffer]:
+    def render_block(self, copy: bool = True) -> Optional[AudioBuffer]:
         """Render next block of audio.
 
+        Args:
+            copy: If ``False``, full blocks are returned as the renderer's
+                own output buffer instead of a copy, saving an allocation
+                per block. Such a block is overwritten by the call after
+                next, so consume it (or copy it) before then.
+
         Returns:
             :class:`AudioBuffer` of shape ``(channels, n)`` where
             ``n <= block_size``, or ``None`` if finished. May also return
@@ -607,6 +823,74 @@ class MidiRenderer:
             compensation skip. Call ``.as_ndarray()`` on the returned buffer
             if you need a numpy view.
         """
+        span = self._render_span()
+        if span is None:
+            return None
+        block, offset, count = span
+        if offset == 0 and count == block.frames:
+            # Full-block output buffers are reused, so hand out a copy
+            # unless asked not to; a final partial block is already fresh.
+            if copy and block.frames == self._buffer_frames:
+                return block.copy()
+            return block
+        # AudioBuffer slice (copy) -- always contiguous, always c_contig.
+        return cast(AudioBuffer, block[:, offset : offset + count])
+
+    def _get_event_arrays(self) -> Any:
+        """Return ``(event_array, positions)`` for dense blocks, or ``False``.
+
+        ``event_array`` is a ``make_midi_events`` structured array holding
+        every event (offsets rewritten per block), ``positions`` their
+        absolute sample positions as int64. Built on first use, since
+        files whose blocks stay sparse never need it; ``False`` when numpy
+        is not installed.
+        """
+        if self._event_arrays is None:
+            try:
+                import numpy as np
+            except ImportError:
+                self._event_arrays = False
+            else:
+                from minihost.midi_events import make_midi_events
+
+                events = self._events_with_samples
+                columns = np.array(events, dtype=np.int64).reshape(len(events), 4)
+                event_array = make_midi_events(len(events))
+                event_array["status"] = columns[:, 1]
+                event_array["data1"] = columns[:, 2]
+                event_array["data2"] = columns[:, 3]
+                self._event_arrays = (event_array, columns[:, 0].copy())
+        return self._event_arrays
+
+    def _spans(self, limit: int) -> Iterator[tuple[AudioBuffer, int, int]]:
+        """Render to the end, yielding each ``_render_span`` result.
+
+        Spans are clipped so that at most ``limit`` frames come out in
+        total. This is the block loop shared by ``render_all`` and the
+        file writers; each span must be copied out before the next one.
+        """
+        written = 0
+        while not self.is_finished:
+            span = self._render_span()
+            if span is None:
+                continue
+            block, offset, n = span
+            # Defensive: never hand out more than the caller allocated.
+            if written + n > limit:
+                n = limit - written
+                if n <= 0:
+                    return
+            yield block, offset, n
+            written += n
+
+    def _render_span(self) -> Optional[tuple[AudioBuffer, int, int]]:
+        """Render next block, returning ``(block, offset, count)``.
+
+        Frames ``[offset, offset + count)`` of ``block`` are the next
+        user-visible output. ``block`` may be the reused output buffer, so
+        the caller must copy the span out before rendering again. Returns
+        ``None`` under the same conditions as :meth:`render_block`.
+        """
         if self.is_finished:
             return None
 
@@ -617,53 +901,59 @@ class MidiRenderer:
         remaining = self._render_samples - self._current_sample
         this_block_size = min(self.block_size, remaining)
 
-        # Collect MIDI events for this block
-        block_events = []
-        while self._event_idx < len(self._events_with_samples):
-            sample_pos, event = self._events_with_samples[self._event_idx]
-            if sample_pos >= self._current_sample + this_block_size:
-                break
-
-            offset = sample_pos - self._current_sample
-            offset = max(0, min(offset, this_block_size - 1))
-
-            midi_tuple = _event_to_midi_tuple(event, offset)
-            if midi_tuple:
-                block_events.append(midi_tuple)
-
-            self._event_idx += 1
-
-        # Clear the persistent input buffer (zero silent input for this block).
-        self._input_buffer.clear()
-
-        if this_block_size < self.block_size:
+        # Collect MIDI events for this block: everything before ``stop``
+        # lies below the block end, so offsets only need the lower clamp.
+        events = self._events_with_samples
+        idx = self._event_idx
+        block_start = self._current_sample
+        stop = bisect_left(self._event_positions, block_start + this_block_size, idx)
+        block_events: Any
+        arrays = (
+            self._get_event_arrays() if stop - idx >= _VECTORIZE_MIN_EVENTS else None
+        )
+        if arrays:
+            event_array, positions = arrays
+            offsets = positions[idx:stop] - block_start
+            offsets.clip(0, None, out=offsets)
+            # A view: each event is in exactly one block, so rewriting its
+            # offset in place never disturbs a later block.
+            block_events = event_array[idx:stop]
+            block_events["sample_offset"] = offsets
+        else:
+            block_events = []
+            for i in range(idx, stop):
+                sample_pos, status, data1, data2 = events[i]
+                offset = sample_pos - block_start
+                block_events.append((offset if offset > 0 else 0, status, data1, data2))
+        self._event_idx = stop
+
+        # The input stays silent: AudioBuffers start zeroed and plugins read
+        # their input through a const pointer, so it is never cleared here.
+        if this_block_size < self._buffer_frames:
             # Last (partial) block: allocate fresh AudioBuffers of the
             # correct size. Plugin.process_midi consumes them via DLPack.
             in_slice = AudioBuffer(self._in_channels, this_block_size)
-            out_slice = AudioBuffer(self._out_channels, this_block_size)
-            self.plugin.process_midi(in_slice, out_slice, block_events)
-            result = out_slice
+            result = AudioBuffer(self._out_channels, this_block_size)
+            self.plugin.process_midi(in_slice, result, block_events)
         else:
             # Full block: reuse the persistent buffers.
-            self.plugin.process_midi(
-                self._input_buffer, self._output_buffer, block_events
-            )
-            # Copy the output before the next iteration overwrites it.
-            result = self._output_buffer.copy()
+            result = self._output_buffers[self._output_index]
+            self._output_index ^= 1
+            self.plugin.process_midi(self._input_buffer, result, block_events)
 
         self._current_sample += this_block_size
 
         # Latency compensation: discard the first _latency samples of output.
         # If this whole block falls inside the skip region, return None and
-        # let the caller loop again. Otherwise trim the leading skip portion.
+        # let the caller loop again. Otherwise skip the leading portion.
+        offset = 0
         if self._skip_remaining > 0:
-            n = result.frames
-            if n <= self._skip_remaining:
-                self._skip_remaining -= n
+            if this_block_size <= self._skip_remaining:
+                self._skip_remaining -= this_block_size
                 return None
-            # AudioBuffer slice (copy) -- always contiguous, always c_contig.
-            result = cast(AudioBuffer, result[:, self._skip_remaining :])
+            offset = self._skip_remaining
             self._skip_remaining = 0
+        count = this_block_size - offset
 
         # Auto-tail detection runs against the post-skip (user-visible)
         # output. The MIDI-end check is in input-sample space, but we
@@ -673,7 +963,7 @@ class MidiRenderer:
             self._auto_tail
             and self._current_sample > self._midi_end_samples + self._latency
         ):
-            peak = result.magnitude()
+            peak = result.magnitude(offset, count)
             if peak < self._tail_threshold:
                 self._consecutive_silent += 1
                 if self._consecutive_silent >= _AUTO_TAIL_SILENT_BLOCKS:
@@ -681,7 +971,7 @@ class MidiRenderer:
             else:
                 self._consecutive_silent = 0
 
-        return result
+        return result, offset, count
 
     def render_all(
         self,
@@ -703,23 +993,15 @@ class MidiRenderer:
             An ``AudioBuffer`` or ``numpy.ndarray`` of shape
             ``(channels, remaining_samples)``.
         """
-        # Pre-allocate against the renderer's known upper bound, then write
-        # blocks directly into slices. AudioBuffer.__setitem__ accepts
-        # AudioBuffer sources via DLPack with no numpy involvement.
+        # Pre-allocate against the renderer's known upper bound, then copy
+        # each rendered span straight out of the plugin's output buffer,
+        # skipping the per-block copy render_block() hands out.
         remaining = max(0, self._render_samples - self._current_sample)
         out = AudioBuffer(self._out_channels, remaining)
         written = 0
-        while not self.is_finished:
-            block = self.render_block()
-            if block is None:
-                continue
-            n = block.frames
-            if written + n > remaining:
-                n = remaining - written
-                if n <= 0:
-                    break
-                block = cast(AudioBuffer, block[:, :n])
-            out[:, written : written + n] = block
+        for block, offset, n in self._spans(remaining):
+            for ch in range(self._out_channels):
+                out.copy_from(ch, written, block, ch, offset, n)
             written += n
 
         if written < remaining:
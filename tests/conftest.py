@@ -0,0 +1,55 @@
+"""Shared fixtures for the plugin-backed integration tests.
+
+Modules that need a real plugin take the ``plugin`` fixture. The plugin is
+loaded once per module (plugin loads can take up to a second: bundle
+loading, factory setup) and restored to a clean state before every test.
+Tests that need a fresh load (different block size, sidechain layout) use
+``plugin_path``. A module can override ``plugin_path`` to point elsewhere.
+"""
+
+import os
+
+import pytest
+
+import minihost
+
+
+@pytest.fixture(scope="session")
+def plugin_path():
+    """Get a test plugin path from environment or skip."""
+    path = os.environ.get("MINIHOST_TEST_PLUGIN")
+    if not path:
+        pytest.skip("Set MINIHOST_TEST_PLUGIN env var to run integration tests")
+    return path
+
+
+@pytest.fixture(scope="module")
+def shared_plugin(plugin_path):
+    """Load the test plugin once for this module, with its initial state."""
+    p = minihost.Plugin(plugin_path, sample_rate=48000, max_block_size=512)
+    yield p, p.get_state()
+    p.close()
+
+
+@pytest.fixture
+def plugin(shared_plugin):
+    """The shared plugin instance, restored to a clean state for this test.
+
+    Undoes everything a test may change on the instance: sample rate,
+    bypass, non-realtime mode, precision, transport, parameter state and
+    the DSP's internal buffers.
+    """
+    p, initial_state = shared_plugin
+    if p.sample_rate != 48000:
+        p.sample_rate = 48000
+    if p.bypass:
+        p.bypass = False
+    if p.non_realtime:
+        p.non_realtime = False
+    if p.processing_precision != minihost.MH_PRECISION_SINGLE:
+        p.processing_precision = minihost.MH_PRECISION_SINGLE
+    p.clear_transport()
+    if initial_state:
+        p.set_state(initial_state)
+    p.reset()
+    return p
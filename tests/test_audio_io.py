@@ -6,7 +6,13 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from minihost.audio_io import get_audio_info, read_audio, resample, write_audio
+from minihost.audio_io import (
+    get_audio_info,
+    open_audio_writer,
+    read_audio,
+    resample,
+    write_audio,
+)
 
 
 class TestWriteAndReadRoundTrip:
@@ -169,6 +175,18 @@ class TestErrors:
         with pytest.raises(FileNotFoundError):
             read_audio("/nonexistent/file.wav")
 
+    def test_read_unsupported_format(self, tmp_path):
+        # Rejected on the extension alone; the file need not exist.
+        with pytest.raises(ValueError, match="Unsupported"):
+            read_audio(tmp_path / "missing.txt")
+
+    def test_read_directory_raises_not_found(self, tmp_path):
+        (tmp_path / "folder.wav").mkdir()
+        with pytest.raises(FileNotFoundError):
+            read_audio(tmp_path / "folder.wav")
+        with pytest.raises(FileNotFoundError):
+            get_audio_info(tmp_path / "folder.wav")
+
     def test_write_unsupported_format(self, tmp_path):
         data = np.zeros((2, 100), dtype=np.float32)
         with pytest.raises(ValueError, match="Unsupported"):
@@ -184,6 +202,11 @@ class TestErrors:
         with pytest.raises(ValueError, match="bit_depth"):
             write_audio(tmp_path / "test.wav", data, 48000, bit_depth=8)
 
+    def test_write_invalid_flac_bit_depth(self, tmp_path):
+        data = np.zeros((2, 100), dtype=np.float32)
+        with pytest.raises(ValueError, match="bit_depth"):
+            write_audio(tmp_path / "test.flac", data, 48000, bit_depth=8)
+
     def test_default_bit_depth_is_24(self, tmp_path):
         data = np.zeros((2, 100), dtype=np.float32)
         path = tmp_path / "default.wav"
@@ -194,6 +217,62 @@ class TestErrors:
         assert info["sample_rate"] == 48000
         assert info["frames"] == 100
 
+    def test_contiguous_float32_written_without_copy(self, tmp_path, monkeypatch):
+        import minihost.audio_io as audio_io
+
+        seen = []
+        monkeypatch.setattr(audio_io, "_write", lambda path, d, *a: seen.append(d))
+        data = np.zeros((2, 100), dtype=np.float32)
+        write_audio(tmp_path / "nocopy.wav", data, 48000)
+        assert seen[0] is data
+
+        # A float64 or strided input is still converted.
+        write_audio(tmp_path / "copy.wav", data[:, ::2].astype(np.float64), 48000)
+        assert seen[1].dtype == np.float32 and seen[1].flags.c_contiguous
+
+
+class TestAudioWriter:
+    """Test incremental WAV writing with open_audio_writer."""
+
+    def test_blocks_match_write_audio(self, tmp_path):
+        rng = np.random.default_rng(0)
+        data = rng.uniform(-0.5, 0.5, (2, 10007)).astype(np.float32)
+        path = tmp_path / "stream.wav"
+
+        with open_audio_writer(path, 2, 48000, bit_depth=32) as writer:
+            for start in range(0, data.shape[1], 512):
+                writer.write(np.ascontiguousarray(data[:, start : start + 512]))
+
+        result, sr = read_audio(path, as_=np.ndarray)
+        assert sr == 48000
+        np.testing.assert_array_equal(result, data)
+
+    def test_accepts_audiobuffer_blocks(self, tmp_path):
+        from minihost import AudioBuffer
+
+        block = AudioBuffer.from_numpy(np.full((1, 256), 0.25, dtype=np.float32))
+        path = tmp_path / "buf.wav"
+        with open_audio_writer(path, 1, 44100, bit_depth=24) as writer:
+            writer.write(block)
+            writer.write(block)
+
+        info = get_audio_info(path)
+        assert info["channels"] == 1
+        assert info["frames"] == 512
+
+    def test_rejects_flac(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported"):
+            open_audio_writer(tmp_path / "out.flac", 2, 48000)
+
+    def test_rejects_invalid_bit_depth(self, tmp_path):
+        with pytest.raises(ValueError, match="bit_depth"):
+            open_audio_writer(tmp_path / "out.wav", 2, 48000, bit_depth=8)
+
+    def test_rejects_channel_mismatch(self, tmp_path):
+        with open_audio_writer(tmp_path / "out.wav", 2, 48000) as writer:
+            with pytest.raises(ValueError):
+                writer.write(np.zeros((1, 16), dtype=np.float32))
+
 
 class TestResample:
     """Test sample rate conversion."""
@@ -6,8 +6,6 @@ exercise the actual process/process_midi/process_auto calls live in
 test_minihost.py (gated behind MINIHOST_TEST_PLUGIN).
 """
 
-import os
-
 import numpy as np
 import pytest
 
@@ -470,21 +468,6 @@ class TestMidiRendererStateMachine:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def plugin_path():
-    path = os.environ.get("MINIHOST_TEST_PLUGIN")
-    if not path:
-        pytest.skip("MINIHOST_TEST_PLUGIN not set")
-    return path
-
-
-@pytest.fixture
-def plugin(plugin_path):
-    import minihost
-
-    return minihost.Plugin(plugin_path, sample_rate=48000, max_block_size=512)
-
-
 class TestProcessIntegration:
     """Tests that exercise actual audio processing calls with a real plugin."""
 
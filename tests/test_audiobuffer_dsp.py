@@ -75,6 +75,36 @@ def test_apply_gain_per_channel_wrong_length_raises():
         buf.apply_gain_per_channel([1.0, 2.0, 3.0, 4.0])  # 4 != 3
 
 
+# -- copy_from --------------------------------------------------------
+
+
+def test_copy_from_overwrites_destination_range():
+    dst = AudioBuffer(2, 100)
+    dst[:, :] = 0.1
+    src = AudioBuffer(2, 100)
+    src[:, :] = np.arange(200, dtype=np.float32).reshape(2, 100)
+
+    dst.copy_from(0, 10, src, 1, 20, 30)
+
+    ref = np.full((2, 100), 0.1, dtype=np.float32)
+    ref[0, 10:40] = np.arange(200, dtype=np.float32).reshape(2, 100)[1, 20:50]
+    assert np.array_equal(np.asarray(dst), ref)
+
+
+def test_copy_from_bounds_checking():
+    dst = AudioBuffer(2, 100)
+    src = AudioBuffer(2, 50)
+
+    with pytest.raises(ValueError, match="dest_channel out of range"):
+        dst.copy_from(5, 0, src, 0, 0, 10)
+    with pytest.raises(ValueError, match="source_channel out of range"):
+        dst.copy_from(0, 0, src, 5, 0, 10)
+    with pytest.raises(ValueError, match="dest range out of bounds"):
+        dst.copy_from(0, 95, src, 0, 0, 10)
+    with pytest.raises(ValueError, match="source range out of bounds"):
+        dst.copy_from(0, 0, src, 0, 45, 10)
+
+
 # -- add_from ---------------------------------------------------------
 
 
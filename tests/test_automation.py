@@ -57,6 +57,7 @@ def _make_mock_plugin(params=None):
     plugin.get_param_info = MagicMock(side_effect=get_param_info)
     plugin.param_from_text = MagicMock(side_effect=param_from_text)
     plugin.find_param = MagicMock(side_effect=find_param)
+    plugin.get_param_infos = MagicMock(side_effect=lambda: list(params))
     return plugin
 
 
@@ -86,6 +87,11 @@ class TestParseTimeKey:
         assert _parse_time_key(" 1000 ", 48000, 96000) == 1000
         assert _parse_time_key(" 1.0s ", 48000, 96000) == 48000
 
+    def test_invalid_key_raises(self):
+        for key in ("", "abc", "1.5ms", "%"):
+            with pytest.raises(ValueError, match="Invalid keyframe time"):
+                _parse_time_key(key, 48000, 96000)
+
 
 # -- Tests for _interpolate_keyframes --
 
@@ -119,6 +125,24 @@ class TestInterpolateKeyframes:
         assert 1024 in sample_offsets
         assert 2048 in sample_offsets
 
+    def test_keyframes_within_one_block(self):
+        # No block boundary between keyframes: only the keyframes themselves
+        result = _interpolate_keyframes([(10, 0.0), (100, 0.5), (500, 1.0)], 512, 512)
+        assert result == [(10, 0.0), (100, 0.5), (500, 1.0)]
+
+    def test_long_segment_matches_scalar_formula(self):
+        # Enough block boundaries to take the numpy path when it is installed
+        s1, block = 512 * 200 + 17, 512
+        result = _interpolate_keyframes([(3, 0.25), (s1, 0.75)], s1, block)
+        expected = [(3, 0.25)]
+        expected += [
+            (s, 0.25 + (s - 3) / (s1 - 3) * (0.75 - 0.25))
+            for s in range(block, s1, block)
+        ]
+        expected.append((s1, 0.75))
+        assert result == expected
+        assert all(type(s) is int and type(v) is float for s, v in result)
+
     def test_values_increase_monotonically_for_ramp(self):
         result = _interpolate_keyframes([(0, 0.0), (4096, 1.0)], 4096, 512)
         values = [v for _, v in result]
@@ -256,6 +280,24 @@ class TestParseAutomationFile:
         indices = {c[1] for c in changes}
         assert indices == {0, 1}
 
+    def test_names_resolved_by_native_lookup(self, tmp_path):
+        plugin = _make_mock_plugin()
+        auto_file = tmp_path / "auto.json"
+        auto_file.write_text(json.dumps({"mix": 0.5, "CUTOFF": 0.2, "Feedback": 0.1}))
+
+        changes = parse_automation_file(auto_file, plugin, 48000, 96000)
+        assert sorted(c[1] for c in changes) == [0, 1, 2]
+        assert plugin.find_param.call_count == 3
+        plugin.get_param_infos.assert_not_called()
+
+    def test_unknown_name_in_file_raises(self, tmp_path):
+        plugin = _make_mock_plugin()
+        auto_file = tmp_path / "auto.json"
+        auto_file.write_text(json.dumps({"Nope": 0.5}))
+
+        with pytest.raises(ValueError, match="Parameter not found"):
+            parse_automation_file(auto_file, plugin, 48000, 96000)
+
     def test_file_not_found(self):
         plugin = _make_mock_plugin()
         with pytest.raises(FileNotFoundError):
@@ -269,6 +311,17 @@ class TestParseAutomationFile:
         with pytest.raises(ValueError, match="JSON object"):
             parse_automation_file(auto_file, plugin, 48000, 96000)
 
+    def test_unordered_keyframes_sorted_stably(self, tmp_path):
+        plugin = _make_mock_plugin()
+        auto_file = tmp_path / "auto.json"
+        # Out of order, with "0" and "0s" both landing on sample 0.
+        auto_file.write_text(json.dumps({"Mix": {"48000": 1.0, "0": 0.2, "0s": 0.4}}))
+
+        changes = parse_automation_file(auto_file, plugin, 48000, 48000, block_size=512)
+        assert changes[0] == (0, 0, 0.2)
+        assert changes[1] == (0, 0, 0.4)
+        assert changes[-1] == (48000, 0, 1.0)
+
     def test_sorted_output(self, tmp_path):
         plugin = _make_mock_plugin()
         auto_file = tmp_path / "auto.json"
@@ -24,9 +24,13 @@ skip_if_no_plugin = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def plugin():
-    return minihost.Plugin(PLUGIN, sample_rate=48000, max_block_size=512)
+    # Every test only checks that an undersized buffer is rejected before
+    # processing, so one load serves the whole module.
+    p = minihost.Plugin(PLUGIN, sample_rate=48000, max_block_size=512)
+    yield p
+    p.close()
 
 
 @skip_if_no_plugin
@@ -12,9 +12,15 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from minihost.cli import (
+    _SUBPARSER_HELP,
+    _build_parser,
+    _dumps,
+    _emit_json,
+    _emit_jsonl,
     _expand_globs,
     _is_batch_output,
     _resolve_audio_device_arg,
+    _selected_command,
     cmd_devices,
     cmd_info,
     cmd_midi,
@@ -376,6 +382,85 @@ class TestNoCommand:
             ret = main()
             assert ret == 1
 
+    def test_top_level_help_lists_every_command(self, capsys):
+        with patch("sys.argv", ["minihost", "-h"]):
+            with pytest.raises(SystemExit) as exc:
+                main()
+        assert exc.value.code == 0
+        out = capsys.readouterr().out
+        for name in _SUBPARSER_HELP:
+            assert f"    {name} " in out
+        assert _SUBPARSER_HELP["info"] in out
+
+    def test_unknown_command_lists_choices(self, capsys):
+        with patch("sys.argv", ["minihost", "bogus"]):
+            with pytest.raises(SystemExit) as exc:
+                main()
+        assert exc.value.code == 2
+        err = capsys.readouterr().err
+        assert "invalid choice: 'bogus'" in err
+        assert "'render'" in err
+
+    def test_stub_parser_has_no_subcommand_arguments(self):
+        parser = _build_parser(None)
+        args, extra = parser.parse_known_args(["scan", "/dir", "--json"])
+        assert args.command == "scan"
+        assert extra == ["/dir", "--json"]
+        full = _build_parser("scan").parse_args(["scan", "/dir", "--json"])
+        assert full.directory == "/dir" and full.json
+
+
+class TestDumps:
+    def test_round_trips_through_json(self):
+        import json
+
+        data = [{"name": "Synth", "num_params": 3, "default": 0.5, "tags": ["a"]}]
+        assert json.loads(_dumps(data)) == data
+
+    def test_indented(self):
+        assert _dumps({"a": 1}) == '{\n  "a": 1\n}'
+
+    def test_non_ascii_written_as_is(self):
+        # Same text with or without orjson installed.
+        assert _dumps({"name": "Caf\u00e9"}) == '{\n  "name": "Caf\u00e9"\n}'
+
+
+class TestEmitJson:
+    def test_replaced_stdout(self, capsys):
+        _emit_json({"a": 1})
+        assert capsys.readouterr().out == '{\n  "a": 1\n}\n'
+
+    def test_redirected_stdout_goes_through_text_layer(self, tmp_path, monkeypatch):
+        path = tmp_path / "out.json"
+        with open(path, "w", encoding="utf-8") as f:
+            monkeypatch.setattr(sys, "stdout", f)
+            f.write("before\n")
+            _emit_json({"name": "Caf\u00e9"})
+        text = path.read_text(encoding="utf-8")
+        assert text == 'before\n{\n  "name": "Caf\u00e9"\n}\n'
+
+    def test_jsonl_writes_one_object_per_line(self, capsys):
+        import json
+
+        _emit_jsonl(iter([{"a": 1}, {"b": [1, 2]}]))
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [{"a": 1}, {"b": [1, 2]}]
+
+
+class TestSelectedCommand:
+    def test_plain_command(self):
+        assert _selected_command(["scan", "/dir"]) == "scan"
+
+    def test_skips_global_options(self):
+        assert _selected_command(["-r", "44100", "-b", "256", "process"]) == "process"
+
+    def test_skips_attached_values(self):
+        assert _selected_command(["--sample-rate=44100", "-b256", "info"]) == "info"
+
+    def test_help_or_missing_command(self):
+        assert _selected_command(["-h"]) is None
+        assert _selected_command([]) is None
+
 
 # ---------------------------------------------------------------------------
 # Error Paths (mock plugin loading)
@@ -393,7 +478,10 @@ class TestCmdScanErrors:
             no_cache=True,
             refresh=False,
         )
-        with patch("minihost.scan_directory", side_effect=RuntimeError("not found")):
+        with patch(
+            "minihost.plugincache.scan_uncached",
+            side_effect=RuntimeError("not found"),
+        ):
             ret = cmd_scan(args)
         assert ret == 1
         assert "not found" in capsys.readouterr().err
@@ -409,7 +497,7 @@ class TestCmdScanErrors:
             refresh=False,
         )
         results = [{"name": "TestSynth", "format": "VST3", "path": "/p/test.vst3"}]
-        with patch("minihost.scan_directory", return_value=results):
+        with patch("minihost.plugincache.scan_uncached", return_value=results):
             ret = cmd_scan(args)
         assert ret == 0
         out = capsys.readouterr().out
@@ -429,7 +517,7 @@ class TestCmdScanErrors:
             refresh=False,
         )
         results = [{"name": "TestSynth", "format": "VST3", "path": "/p/test.vst3"}]
-        with patch("minihost.scan_directory", return_value=results):
+        with patch("minihost.plugincache.scan_uncached", return_value=results):
             ret = cmd_scan(args)
         assert ret == 0
         out = capsys.readouterr().out
@@ -446,7 +534,7 @@ class TestCmdScanErrors:
             no_cache=True,
             refresh=False,
         )
-        with patch("minihost.scan_directory", return_value=[]):
+        with patch("minihost.plugincache.scan_uncached", return_value=[]):
             ret = cmd_scan(args)
         assert ret == 0
         assert "Found 0 plugin(s)" in capsys.readouterr().out
@@ -481,6 +569,45 @@ class TestCmdInfoErrors:
         assert ret == 1
         assert "load failed" in capsys.readouterr().err
 
+    def test_info_full_reads_metadata_from_plugin(self, capsys):
+        """Full mode reads name/vendor from the loaded plugin, not a probe."""
+        import json
+
+        args = argparse.Namespace(
+            plugin="/synth.vst3",
+            json=True,
+            probe=False,
+            sample_rate=48000,
+            block_size=512,
+            no_cache=False,
+            refresh=False,
+        )
+        plugin = MagicMock(
+            sample_rate=48000.0,
+            num_params=4,
+            num_input_channels=0,
+            num_output_channels=2,
+            latency_samples=0,
+            tail_seconds=0.0,
+            supports_double=False,
+            num_programs=0,
+        )
+        plugin.get_desc.return_value = {"name": "Synth", "vendor": "Acme"}
+        with (
+            patch("minihost.Plugin", return_value=plugin),
+            patch("minihost.probe", side_effect=AssertionError("probed")),
+            patch(
+                "minihost.plugincache.info",
+                side_effect=AssertionError("cache read"),
+            ),
+        ):
+            ret = cmd_info(args)
+        assert ret == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["name"] == "Synth"
+        assert out["vendor"] == "Acme"
+        assert out["num_params"] == 4
+
 
 class TestCmdParamsErrors:
     def test_params_load_error(self, capsys):
@@ -496,6 +623,32 @@ class TestCmdParamsErrors:
         assert ret == 1
         assert "load failed" in capsys.readouterr().err
 
+    def test_params_jsonl(self, capsys):
+        import json
+
+        mock_plugin = MagicMock()
+        mock_plugin.get_param_infos.return_value = [
+            {"name": "Gain", "value": 0.5},
+            {"name": "Mix", "value": 1.0},
+        ]
+        args = argparse.Namespace(
+            plugin="/fx.vst3",
+            json=False,
+            jsonl=True,
+            verbose=False,
+            sample_rate=48000,
+            block_size=512,
+        )
+        with patch("minihost.Plugin", return_value=mock_plugin):
+            ret = cmd_params(args)
+        assert ret == 0
+        mock_plugin.get_param_infos.assert_called_once_with(with_values=True)
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"name": "Gain", "index": 0, "value": 0.5},
+            {"name": "Mix", "index": 1, "value": 1.0},
+        ]
+
 
 class TestCmdMidiErrors:
     def test_midi_list_mode(self, capsys):
@@ -1088,6 +1241,52 @@ class TestBatchProcessErrors:
         assert ret == 1
         assert "bad plugin" in capsys.readouterr().err
 
+    def test_batch_reads_each_header_once(self, tmp_path):
+        """The first file's header, read to size the plugin, is reused."""
+        (tmp_path / "a.wav").touch()
+        (tmp_path / "b.wav").touch()
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        args = argparse.Namespace(
+            plugin="effect.vst3",
+            output=str(out_dir) + "/",
+            input=[str(tmp_path / "*.wav")],
+            midi_input=None,
+            overwrite=False,
+            sample_rate=48000,
+            block_size=512,
+            tail=2.0,
+            state=None,
+            vstpreset=None,
+            preset=None,
+            param_file=None,
+            param=None,
+            bit_depth=None,
+            out_channels=None,
+            non_realtime=False,
+            bpm=None,
+        )
+        mock_info = {
+            "sample_rate": 48000,
+            "channels": 2,
+            "frames": 1000,
+            "duration": 0.02,
+        }
+        with (
+            patch(
+                "minihost.audio_io.get_audio_info", return_value=mock_info
+            ) as mock_get_info,
+            patch("minihost.Plugin", return_value=MagicMock()),
+            patch("minihost.process_audio_to_file") as mock_process,
+        ):
+            ret = cmd_process(args)
+        assert ret == 0
+        assert mock_process.call_count == 2
+        assert [c.args[0] for c in mock_get_info.call_args_list] == [
+            str(tmp_path / "a.wav"),
+            str(tmp_path / "b.wav"),
+        ]
+
 
 class TestArgParsingNoResample:
     def test_no_resample_flag(self):
@@ -1491,7 +1690,7 @@ class TestCmdPresets:
         mock_plugin = MagicMock()
         mock_plugin.num_programs = 3
         mock_plugin.program = 1
-        mock_plugin.get_program_name.side_effect = lambda i: f"Preset{i}"
+        mock_plugin.get_program_names.return_value = ["Preset0", "Preset1", "Preset2"]
         with patch("minihost.Plugin", return_value=mock_plugin):
             ret = cmd_presets(args)
         assert ret == 0
@@ -1517,7 +1716,7 @@ class TestCmdPresets:
         mock_plugin = MagicMock()
         mock_plugin.num_programs = 2
         mock_plugin.program = 0
-        mock_plugin.get_program_name.side_effect = lambda i: f"P{i}"
+        mock_plugin.get_program_names.return_value = ["P0", "P1"]
         with patch("minihost.Plugin", return_value=mock_plugin):
             ret = cmd_presets(args)
         assert ret == 0
@@ -1730,6 +1929,9 @@ class TestMorphCommand:
         p.program = 0
         p.morph_capture.side_effect = lambda: list(snapshots[p.program])
         p.get_param_info.side_effect = lambda i: {"name": f"p{i}"}
+        p.get_param_infos.side_effect = lambda: [
+            {"name": f"p{i}"} for i in range(p.num_params)
+        ]
         p.get_state.return_value = b"STATE"
         return p
 
@@ -0,0 +1,39 @@
+"""Tests for the _metrics level helpers."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from minihost._metrics import peak
+
+
+class TestPeak:
+    def test_matches_abs_max(self):
+        rng = np.random.default_rng(0)
+        buf = rng.standard_normal((2, 512)).astype(np.float32)
+        assert peak(buf) == pytest.approx(float(np.max(np.abs(buf))))
+
+    def test_negative_peak(self):
+        buf = np.zeros((2, 64), dtype=np.float32)
+        buf[1, 10] = -0.75
+        buf[0, 3] = 0.5
+        assert peak(buf) == pytest.approx(0.75)
+
+    def test_silence_and_empty(self):
+        assert peak(np.zeros((2, 64), dtype=np.float32)) == 0.0
+        assert peak(np.zeros((2, 0), dtype=np.float32)) == 0.0
+
+    def test_int16_full_scale_negative(self):
+        buf = np.array([[0, 100, -32768]], dtype=np.int16)
+        assert peak(buf) == 32768.0
+
+    def test_nan_propagates(self):
+        buf = np.zeros((2, 64), dtype=np.float32)
+        buf[0, 5] = -0.5
+        buf[1, 7] = np.nan
+        assert np.isnan(peak(buf))
+        assert np.isnan(float(np.max(np.abs(buf))))
+
+    def test_rejects_complex(self):
+        with pytest.raises(TypeError):
+            peak(np.zeros(4, dtype=np.complex64))
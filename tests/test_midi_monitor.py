@@ -23,6 +23,11 @@ class TestNoteName:
     def test_highest(self):
         assert _note_name(127) == "G9"
 
+    def test_every_note_matches_arithmetic(self):
+        names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+        for n in range(128):
+            assert _note_name(n) == f"{names[n % 12]}{n // 12 - 1}"
+
 
 class TestFormatMidiMsg:
     """Tests for _format_midi_msg with known byte sequences."""
@@ -50,6 +55,12 @@ class TestFormatMidiMsg:
         assert "C4" in msg
         assert "0.152" in msg
 
+    def test_out_of_range_note_byte(self):
+        # A malformed data byte above 127 is shown, not an IndexError
+        for status in (0x80, 0x90, 0xA0):
+            msg = _format_midi_msg(0.0, bytes([status, 200, 1]))
+            assert "(200)" in msg
+
     def test_note_on_channel_10(self):
         # Note On, channel 10 (0x99), note 36, velocity 127
         msg = _format_midi_msg(0.0, bytes([0x99, 36, 127]))
@@ -108,6 +119,10 @@ class TestFormatMidiMsg:
         assert "F0" in msg
         assert "F7" in msg
 
+    def test_sysex_hex_dump_is_uppercase_and_space_separated(self):
+        msg = _format_midi_msg(0.0, bytes([0xF0, 0x0A, 0xBC, 0xF7]))
+        assert msg.endswith("F0 0A BC F7")
+
     def test_system_realtime(self):
         # System real-time: timing clock (0xF8)
         msg = _format_midi_msg(0.0, bytes([0xF8]))
@@ -126,3 +141,18 @@ class TestFormatMidiMsg:
         msg = _format_midi_msg(0.0, bytes([0x90]))
         # Should still produce output without crashing
         assert len(msg) > 0
+
+    def test_truncated_program_change_is_unknown(self):
+        msg = _format_midi_msg(0.0, bytes([0xC0]))
+        assert "Unknown" in msg
+
+    def test_data_byte_first_is_unknown(self):
+        msg = _format_midi_msg(0.0, bytes([0x40, 60, 100]))
+        assert "Unknown" in msg
+        assert "40 3C 64" in msg
+
+    def test_channel_from_low_nibble(self):
+        for ch in range(16):
+            msg = _format_midi_msg(0.0, bytes([0xE0 | ch, 0x00, 0x40]))
+            assert "Pitch Bend" in msg
+            assert f"ch={ch + 1:<2}" in msg
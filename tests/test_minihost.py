@@ -58,11 +58,41 @@ def test_module_has_render_functions():
     assert hasattr(minihost, "render_midi_stream")
     assert hasattr(minihost, "render_midi_to_file")
     assert hasattr(minihost, "MidiRenderer")
+    assert hasattr(minihost, "midi_duration")
     assert callable(minihost.render_midi)
     assert callable(minihost.render_midi_stream)
     assert callable(minihost.render_midi_to_file)
 
 
+def test_python_layers_are_imported_lazily():
+    """Importing minihost loads the extension but not the pure-Python layers;
+    each is imported on first attribute access."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, minihost\n"
+        "print('minihost._async' in sys.modules, 'asyncio' in sys.modules)\n"
+        "minihost.open_async\n"
+        "print('minihost._async' in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert out == ["False", "False", "True"]
+
+
+def test_all_exports_resolve():
+    """Every name in __all__ resolves, including the lazily imported ones."""
+    for name in minihost.__all__:
+        assert getattr(minihost, name) is not None, name
+    assert minihost.scan_plugins is minihost.plugincache.scan
+    assert minihost.morph_params is minihost.morph.morph
+    assert set(minihost.__all__) <= set(dir(minihost))
+    with pytest.raises(AttributeError):
+        getattr(minihost, "no_such_attribute")
+
+
 def test_audio_device_class_has_expected_methods():
     """Test that AudioDevice class has expected methods."""
     expected_methods = [
@@ -101,6 +131,8 @@ def test_audio_device_class_has_midi_methods():
         "create_virtual_midi_input",
         "create_virtual_midi_output",
         "send_midi",
+        "send_midi_batch",
+        "all_notes_off",
     ]
     for method in expected_methods:
         assert hasattr(minihost.AudioDevice, method), (
@@ -142,26 +174,69 @@ def test_midi_port_enumeration():
         assert "index" in port
 
 
-def test_plugin_class_has_expected_methods():
+def test_midi_port_list_cache_is_opt_in(monkeypatch):
+    """cached=True re-enumerates only when the native generation moves."""
+    calls = []
+    generation = [7]
+
+    def fake_enumerate():
+        calls.append(1)
+        return [{"name": "Port A", "index": 0}]
+
+    monkeypatch.setattr(minihost, "_midi_get_input_ports_native", fake_enumerate)
+    monkeypatch.setattr(minihost, "_midi_port_generation", lambda: generation[0])
+    monkeypatch.setattr(minihost, "_midi_port_cache", {})
+
+    first = minihost.midi_get_input_ports(cached=True)
+    first[0]["name"] = "mutated"
+    second = minihost.midi_get_input_ports(cached=True)
+    assert second == [{"name": "Port A", "index": 0}]
+    assert len(calls) == 1
+
+    generation[0] += 1
+    minihost.midi_get_input_ports(cached=True)
+    assert len(calls) == 2
+
+    # The default never trusts the generation.
+    minihost.midi_get_input_ports()
+    minihost.midi_get_input_ports()
+    assert len(calls) == 4
+
+
+@pytest.fixture(scope="module")
+def plugin_attrs():
+    """Attribute names of minihost.Plugin, collected once per module."""
+    return frozenset(dir(minihost.Plugin))
+
+
+def test_plugin_class_has_expected_methods(plugin_attrs):
     """Test that Plugin class has expected methods."""
     expected_methods = [
         "get_param",
         "set_param",
         "get_param_info",
+        "get_param_infos",
+        "get_params",
         "param_to_text",
         "param_from_text",
         "get_state",
+        "get_state_into",
         "set_state",
         "set_transport",
         "clear_transport",
         "process",
+        "process_planar",
+        "process_int16",
         "process_midi",
         "process_auto",
         "process_sidechain",
         "process_double",
         "reset",
         "get_program_name",
+        "get_program_names",
         "get_bus_info",
+        "get_bus_infos",
+        "get_desc",
         "check_buses_layout",
         "begin_param_gesture",
         "end_param_gesture",
@@ -172,8 +247,8 @@ def test_plugin_class_has_expected_methods():
         "set_param_gesture_callback",
         "set_track_properties",
     ]
-    for method in expected_methods:
-        assert hasattr(minihost.Plugin, method), f"Plugin missing method: {method}"
+    missing = set(expected_methods) - plugin_attrs
+    assert not missing, f"Plugin missing methods: {sorted(missing)}"
 
 
 def test_plugin_chain_class_has_expected_methods():
@@ -219,13 +294,14 @@ def test_plugin_empty_path_raises():
         minihost.Plugin("")
 
 
-def test_plugin_class_has_expected_properties():
+def test_plugin_class_has_expected_properties(plugin_attrs):
     """Test that Plugin class has expected properties."""
     expected_props = [
         "num_params",
         "num_input_channels",
         "num_output_channels",
         "latency_samples",
+        "max_block_size",
         "tail_seconds",
         "bypass",
         "non_realtime",
@@ -242,8 +318,8 @@ def test_plugin_class_has_expected_properties():
         "is_midi_effect",
         "supports_mpe",
     ]
-    for prop in expected_props:
-        assert hasattr(minihost.Plugin, prop), f"Plugin missing property: {prop}"
+    missing = set(expected_props) - plugin_attrs
+    assert not missing, f"Plugin missing properties: {sorted(missing)}"
 
 
 def test_plugin_constructor_docstring():
@@ -262,20 +338,19 @@ def test_plugin_nonexistent_directory_raises():
         minihost.Plugin("/no/such/directory/plugin.vst3")
 
 
-def test_plugin_wrong_extension_raises():
-    """Test that loading wrong file type raises RuntimeError."""
-    import tempfile
-    import os
+@pytest.fixture(scope="session")
+def bad_extension_file(tmp_path_factory):
+    """A non-plugin ``.txt`` file, written once and shared by the load and
+    probe rejection tests."""
+    path = tmp_path_factory.mktemp("bad") / "not_a_plugin.txt"
+    path.write_bytes(b"not a plugin")
+    return str(path)
 
-    # Create a temp file with wrong extension
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-        f.write(b"not a plugin")
-        temp_path = f.name
-    try:
-        with pytest.raises(RuntimeError, match="Failed to open plugin"):
-            minihost.Plugin(temp_path)
-    finally:
-        os.unlink(temp_path)
+
+def test_plugin_wrong_extension_raises(bad_extension_file):
+    """Test that loading wrong file type raises RuntimeError."""
+    with pytest.raises(RuntimeError, match="Failed to open plugin"):
+        minihost.Plugin(bad_extension_file)
 
 
 def test_module_has_change_constants():
@@ -317,19 +392,64 @@ def test_probe_empty_path_raises():
         minihost.probe("")
 
 
-def test_probe_wrong_file_type_raises():
+def test_probe_wrong_file_type_raises(bad_extension_file):
     """Test that probing wrong file type raises RuntimeError."""
-    import tempfile
-    import os
+    with pytest.raises(RuntimeError, match="Failed to probe plugin"):
+        minihost.probe(bad_extension_file)
 
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-        f.write(b"not a plugin")
-        temp_path = f.name
+
+def test_probe_is_cached_by_path_and_stat(tmp_path, monkeypatch):
+    """Repeat probes of an unchanged file are served from the cache."""
+    calls = []
+
+    def fake_probe(path):
+        calls.append(path)
+        return {"name": "Fake", "path": path}
+
+    monkeypatch.setattr(minihost, "_probe_native", fake_probe)
+    minihost.probe.cache_clear()
+    plugin_file = tmp_path / "fake.vst3"
+    plugin_file.write_bytes(b"x")
     try:
-        with pytest.raises(RuntimeError, match="Failed to probe plugin"):
-            minihost.probe(temp_path)
+        first = minihost.probe(str(plugin_file))
+        first["name"] = "mutated"
+        second = minihost.probe(str(plugin_file))
+        assert len(calls) == 1
+        assert second["name"] == "Fake"
+
+        # A changed file (different size) is probed again.
+        plugin_file.write_bytes(b"xx")
+        minihost.probe(str(plugin_file))
+        assert len(calls) == 2
     finally:
-        os.unlink(temp_path)
+        minihost.probe.cache_clear()
+
+
+def test_probe_cache_sees_binary_replaced_inside_bundle(tmp_path, monkeypatch):
+    """Replacing the binary inside a bundle directory invalidates the entry."""
+    calls = []
+
+    def fake_probe(path):
+        calls.append(path)
+        return {"name": "Fake", "path": path}
+
+    monkeypatch.setattr(minihost, "_probe_native", fake_probe)
+    minihost.probe.cache_clear()
+    bundle = tmp_path / "fake.vst3"
+    binary_dir = bundle / "Contents" / "x86_64-linux"
+    binary_dir.mkdir(parents=True)
+    binary = binary_dir / "fake.so"
+    binary.write_bytes(b"x")
+    try:
+        minihost.probe(str(bundle))
+        minihost.probe(str(bundle))
+        assert len(calls) == 1
+
+        binary.write_bytes(b"xx")
+        minihost.probe(str(bundle))
+        assert len(calls) == 2
+    finally:
+        minihost.probe.cache_clear()
 
 
 def test_scan_directory_nonexistent_raises():
@@ -371,22 +491,45 @@ def test_scan_directory_file_not_directory_raises():
         os.unlink(temp_path)
 
 
-# Integration tests that require a real plugin - skip if no plugin available
-@pytest.fixture
-def plugin_path():
-    """Get a test plugin path from environment or skip."""
-    import os
+def test_make_midi_events_layout():
+    """make_midi_events matches the 8-byte C MH_MidiEvent record."""
+    pytest.importorskip("numpy")
+    ev = minihost.make_midi_events(3)
+    assert ev.shape == (3,)
+    assert ev.dtype.itemsize == 8
+    assert ev.dtype.names == ("sample_offset", "status", "data1", "data2")
+    assert ev.flags.c_contiguous
+    ev[1] = (256, 0x80, 60, 0)
+    assert tuple(ev[1].tolist()) == (256, 0x80, 60, 0)
+
+
+def test_make_midi_events_negative_raises():
+    """A negative event count is rejected."""
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        minihost.make_midi_events(-1)
+
 
-    path = os.environ.get("MINIHOST_TEST_PLUGIN")
-    if not path:
-        pytest.skip("Set MINIHOST_TEST_PLUGIN env var to run integration tests")
-    return path
+def test_make_param_changes_layout():
+    """make_param_changes matches the 12-byte C MH_ParamChange record."""
+    pytest.importorskip("numpy")
+    pc = minihost.make_param_changes(2)
+    assert pc.shape == (2,)
+    assert pc.dtype.itemsize == 12
+    assert pc.dtype.names == ("sample_offset", "param_index", "value")
+    pc[1] = (256, 3, 0.5)
+    assert tuple(pc[1].tolist()) == (256, 3, 0.5)
+    with pytest.raises(ValueError):
+        minihost.make_param_changes(-1)
 
 
-@pytest.fixture
-def plugin(plugin_path):
-    """Create a plugin instance for testing."""
-    return minihost.Plugin(plugin_path, sample_rate=48000, max_block_size=512)
+# Integration tests that require a real plugin use the plugin / plugin_path
+# fixtures from conftest.py, which skip when no plugin is available.
+#
+# Block size for tests that only check a process call succeeds (reset,
+# sample-rate change). Still runs the plugin's DSP, just on fewer frames, so
+# CPU-heavy synths don't spend a full 512-frame block per smoke call.
+SMOKE_FRAMES = 64
 
 
 class TestPluginIntegration:
@@ -433,6 +576,43 @@ class TestPluginIntegration:
             assert isinstance(info["category"], int)
             assert info["category"] >= 0
 
+    def test_param_batch_getters_match_single(self, plugin):
+        """get_param_infos / get_params agree with the per-index calls."""
+        n = plugin.num_params
+        infos = plugin.get_param_infos()
+        values = plugin.get_params()
+        assert len(infos) == len(values) == n
+        for i in range(min(n, 8)):
+            assert infos[i] == plugin.get_param_info(i)
+            assert values[i] == plugin.get_param(i)
+        with_values = plugin.get_param_infos(with_values=True)
+        assert [info.pop("value") for info in with_values] == values
+        assert with_values == infos
+        # Ranges are clamped like slices
+        assert len(plugin.get_param_infos(0, n + 10)) == n
+        assert plugin.get_params(n, 5) == []
+        with pytest.raises(IndexError):
+            plugin.get_params(n + 1, 1)
+
+    def test_find_param_resolves_every_name(self, plugin):
+        """find_param returns the first index for each name, any case."""
+        first = {}
+        for i, info in enumerate(plugin.get_param_infos()):
+            first.setdefault(info["name"].lower(), i)
+        for name, idx in list(first.items())[:32]:
+            assert plugin.find_param(name.upper()) == idx
+            # Second lookup is served from the name cache
+            assert plugin.find_param(name) == idx
+        with pytest.raises(RuntimeError, match="Parameter not found"):
+            plugin.find_param("\x00no such parameter\x00")
+
+    def test_max_block_size_matches_constructor(self, plugin_path):
+        p = minihost.Plugin(plugin_path, sample_rate=48000, max_block_size=256)
+        try:
+            assert p.max_block_size == 256
+        finally:
+            p.close()
+
     def test_state_save_restore(self, plugin):
         """Test state save and restore."""
         state = plugin.get_state()
@@ -440,22 +620,119 @@ class TestPluginIntegration:
         if len(state) > 0:
             plugin.set_state(state)
 
+    def test_get_state_into_reuses_buffer(self, plugin):
+        """get_state_into writes the same bytes as get_state into a bytearray."""
+        expected = plugin.get_state()
+        buf = bytearray(1)
+        n = plugin.get_state_into(buf)
+        assert n == len(expected)
+        assert bytes(buf[:n]) == expected
+        # A buffer that is already large enough is reused, not shrunk
+        big = bytearray(n + 64)
+        assert plugin.get_state_into(big) == n
+        assert len(big) == n + 64
+        if n > 0:
+            plugin.set_state(memoryview(big)[:n])
+
+    def test_get_state_into_rejects_bytes(self, plugin):
+        with pytest.raises(TypeError):
+            plugin.get_state_into(b"")
+
     def test_process_audio(self, plugin):
         """Test audio processing."""
-        import numpy as np
+        np = pytest.importorskip("numpy")
+        from minihost._testsignals import fill_sine
 
         in_ch = max(plugin.num_input_channels, 2)
         out_ch = max(plugin.num_output_channels, 2)
 
         input_audio = np.zeros((in_ch, 512), dtype=np.float32)
         output_audio = np.zeros((out_ch, 512), dtype=np.float32)
+        fill_sine(input_audio, 440.0, 48000.0, amplitude=0.5)
 
         plugin.process(input_audio, output_audio)
 
+    def test_process_planar_matches_process(self, plugin):
+        """Per-channel 1-D buffers give the same result as a 2-D array."""
+        from minihost._testsignals import fill_sine
+
+        np = pytest.importorskip("numpy")
+        in_ch = max(plugin.num_input_channels, 2)
+        out_ch = max(plugin.num_output_channels, 2)
+
+        input_audio = np.zeros((in_ch, 512), dtype=np.float32)
+        output_audio = np.zeros((out_ch, 512), dtype=np.float32)
+        fill_sine(input_audio, 440.0, 48000.0, amplitude=0.5)
+
+        plugin.reset()
+        plugin.process(input_audio, output_audio)
+        expected = output_audio.copy()
+
+        in_bufs = [input_audio[ch].copy() for ch in range(in_ch)]
+        out_bufs = [np.zeros(512, dtype=np.float32) for _ in range(out_ch)]
+        plugin.reset()
+        plugin.process_planar(in_bufs, out_bufs)
+
+        np.testing.assert_allclose(np.stack(out_bufs), expected, atol=1e-5)
+
+    def test_process_int16_matches_float_path(self, plugin):
+        """int16 processing equals float processing of the scaled input."""
+        from minihost._testsignals import fill_sine
+
+        np = pytest.importorskip("numpy")
+        in_ch = max(plugin.num_input_channels, 2)
+        out_ch = max(plugin.num_output_channels, 2)
+
+        input_audio = np.zeros((in_ch, 512), dtype=np.float32)
+        output_audio = np.zeros((out_ch, 512), dtype=np.float32)
+        fill_sine(input_audio, 440.0, 48000.0, amplitude=0.5)
+        pcm_in = np.round(input_audio * 32768.0).astype(np.int16)
+        input_audio[...] = pcm_in / np.float32(32768.0)
+
+        plugin.reset()
+        plugin.process(input_audio, output_audio)
+        expected = np.clip(np.rint(output_audio * 32768.0), -32768, 32767)
+
+        pcm_out = np.zeros((out_ch, 512), dtype=np.int16)
+        plugin.reset()
+        plugin.process_int16(pcm_in, pcm_out)
+
+        np.testing.assert_allclose(pcm_out, expected, atol=1)
+
+    def test_process_int16_rejects_float_input(self, plugin):
+        """Float samples are refused rather than truncated to int16."""
+        np = pytest.importorskip("numpy")
+        in_ch = max(plugin.num_input_channels, 2)
+        out_ch = max(plugin.num_output_channels, 2)
+
+        input_audio = np.zeros((in_ch, 512), dtype=np.float32)
+        pcm_out = np.zeros((out_ch, 512), dtype=np.int16)
+        with pytest.raises(TypeError):
+            plugin.process_int16(input_audio, pcm_out)
+
+    def test_process_planar_mismatched_lengths_raises(self, plugin):
+        np = pytest.importorskip("numpy")
+        out_ch = max(plugin.num_output_channels, 2)
+        in_bufs = [np.zeros(512, dtype=np.float32), np.zeros(256, dtype=np.float32)]
+        out_bufs = [np.zeros(512, dtype=np.float32) for _ in range(out_ch)]
+        with pytest.raises(RuntimeError, match="same length"):
+            plugin.process_planar(in_bufs, out_bufs)
+
+    def test_process_rejects_non_contiguous_output(self, plugin):
+        """A strided output would be processed into a discarded copy."""
+        np = pytest.importorskip("numpy")
+        in_ch = max(plugin.num_input_channels, 2)
+        out_ch = max(plugin.num_output_channels, 2)
+
+        input_audio = np.zeros((in_ch, 512), dtype=np.float32)
+        wide = np.zeros((out_ch, 1024), dtype=np.float32)
+
+        with pytest.raises(TypeError):
+            plugin.process(input_audio, wide[:, :512])
+
     def test_process_with_midi(self, plugin):
         """Test audio processing with MIDI."""
-        import numpy as np
-
+        np = pytest.importorskip("numpy")
         in_ch = max(plugin.num_input_channels, 2)
         out_ch = max(plugin.num_output_channels, 2)
 
@@ -468,6 +745,35 @@ class TestPluginIntegration:
 
         assert isinstance(midi_out, list)
 
+    def test_process_with_midi_event_array(self, plugin):
+        """Test process_midi with a structured MIDI event array."""
+        np = pytest.importorskip("numpy")
+        in_ch = max(plugin.num_input_channels, 2)
+        out_ch = max(plugin.num_output_channels, 2)
+
+        input_audio = np.zeros((in_ch, 512), dtype=np.float32)
+        output_audio = np.zeros((out_ch, 512), dtype=np.float32)
+
+        midi_in = minihost.make_midi_events(2)
+        midi_in[0] = (0, 0x90, 60, 100)
+        midi_in[1] = (256, 0x80, 60, 0)
+        midi_out = plugin.process_midi(input_audio, output_audio, midi_in)
+
+        assert isinstance(midi_out, list)
+
+    def test_process_rejects_foreign_8_byte_records(self, plugin):
+        """An 8-byte record that is not MH_MidiEvent is refused, not memcpy'd."""
+        np = pytest.importorskip("numpy")
+        in_ch = max(plugin.num_input_channels, 2)
+        out_ch = max(plugin.num_output_channels, 2)
+
+        input_audio = np.zeros((in_ch, 512), dtype=np.float32)
+        output_audio = np.zeros((out_ch, 512), dtype=np.float32)
+
+        bogus = np.zeros(2, dtype=[("a", "<f4"), ("b", "<f4")])
+        with pytest.raises(TypeError):
+            plugin.process_midi(input_audio, output_audio, bogus)
+
     def test_transport(self, plugin):
         """Test transport info."""
         plugin.set_transport(bpm=120.0, is_playing=True)
@@ -482,14 +788,13 @@ class TestPluginIntegration:
 
     def test_reset(self, plugin):
         """Test reset clears internal state."""
-        import numpy as np
-
+        np = pytest.importorskip("numpy")
         in_ch = max(plugin.num_input_channels, 2)
         out_ch = max(plugin.num_output_channels, 2)
 
         # Process some audio first
-        input_audio = np.zeros((in_ch, 512), dtype=np.float32)
-        output_audio = np.zeros((out_ch, 512), dtype=np.float32)
+        input_audio = np.zeros((in_ch, SMOKE_FRAMES), dtype=np.float32)
+        output_audio = np.zeros((out_ch, SMOKE_FRAMES), dtype=np.float32)
         plugin.process(input_audio, output_audio)
 
         # Reset should succeed
@@ -577,6 +882,12 @@ class TestPluginIntegration:
                 name = plugin.get_program_name(i)
                 assert isinstance(name, str)
 
+            # Batch query matches the per-index calls
+            names = plugin.get_program_names()
+            assert len(names) == num_programs
+            assert names[0] == plugin.get_program_name(0)
+            assert plugin.get_program_names(0, 1) == names[:1]
+
             # Set program
             plugin.program = 0
             assert plugin.program == 0
@@ -616,6 +927,25 @@ class TestPluginIntegration:
             assert isinstance(info, dict)
             assert "name" in info
 
+        # Batch query returns the same dicts in bus order
+        assert plugin.get_bus_infos(True) == [
+            plugin.get_bus_info(True, i) for i in range(num_in_buses)
+        ]
+        assert plugin.get_bus_infos(False) == [
+            plugin.get_bus_info(False, i) for i in range(num_out_buses)
+        ]
+
+    def test_get_desc_matches_probe(self, plugin):
+        """The loaded plugin describes itself with probe()'s keys and values."""
+        desc = plugin.get_desc()
+        probed = minihost.probe(plugin.path)
+        assert desc.keys() == probed.keys()
+        for key in ("name", "vendor", "version", "format", "unique_id"):
+            assert desc[key] == probed[key]
+        assert desc["path"] == plugin.path
+        assert desc["accepts_midi"] == plugin.accepts_midi
+        assert desc["num_outputs"] == plugin.num_output_channels
+
     def test_sidechain_properties(self, plugin):
         """Test sidechain channel property."""
         sc_ch = plugin.sidechain_channels
@@ -658,8 +988,7 @@ class TestPluginIntegration:
 
     def test_sample_rate_change(self, plugin):
         """Test sample rate change without reloading."""
-        import numpy as np
-
+        np = pytest.importorskip("numpy")
         # Get initial sample rate
         initial_rate = plugin.sample_rate
         assert initial_rate == 48000  # We opened with 48000
@@ -682,8 +1011,8 @@ class TestPluginIntegration:
         # Process should work at new sample rate
         in_ch = max(plugin.num_input_channels, 2)
         out_ch = max(plugin.num_output_channels, 2)
-        input_audio = np.zeros((in_ch, 512), dtype=np.float32)
-        output_audio = np.zeros((out_ch, 512), dtype=np.float32)
+        input_audio = np.zeros((in_ch, SMOKE_FRAMES), dtype=np.float32)
+        output_audio = np.zeros((out_ch, SMOKE_FRAMES), dtype=np.float32)
         plugin.process(input_audio, output_audio)
 
         # Change back to original rate
@@ -691,6 +1020,7 @@ class TestPluginIntegration:
         assert plugin.sample_rate == initial_rate
 
         # Process should still work
+        output_audio.fill(0.0)
         plugin.process(input_audio, output_audio)
 
     def test_scan_directory(self, plugin_path):
@@ -14,8 +14,6 @@ import os
 
 import pytest
 
-import minihost
-
 PLUGIN = (
     os.environ.get("MINIHOST_TEST_PLUGIN") or "/Library/Audio/Plug-Ins/VST3/Dexed.vst3"
 )
@@ -28,11 +26,10 @@ skip_if_no_plugin = pytest.mark.skipif(
 SR = 48000
 
 
-@pytest.fixture
-def plugin():
-    p = minihost.Plugin(PLUGIN, sample_rate=SR, max_block_size=512)
-    yield p
-    p.close()
+@pytest.fixture(scope="module")
+def plugin_path():
+    """The shared ``plugin`` fixture (conftest.py) loads this path."""
+    return PLUGIN
 
 
 @skip_if_no_plugin
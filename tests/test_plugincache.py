@@ -80,6 +80,35 @@ def test_discovery_finds_extensions_and_treats_bundles_as_leaves(cache_env):
     assert names == ["C.vst3", "deepD.vst3", "fxB.component", "synthA.vst3"]
 
 
+def test_scan_uncached_probes_bundles_without_the_cache(cache_env, monkeypatch):
+    plugins, _ = cache_env
+    for name in ("synthA.vst3", "brokenB.vst3", "lib.so"):
+        (plugins / name).mkdir()
+    _touch_plugin(plugins, "fileC.vst3")  # not a bundle: the native scan skips it
+    probed: list[str] = []
+
+    class FakeSession:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return None
+
+        def probe(self, path):
+            probed.append(os.path.basename(path))
+            if "broken" in path:
+                raise RuntimeError("cannot probe")
+            return {"name": os.path.basename(path), "path": ""}
+
+    monkeypatch.setattr(plugincache, "_open_session", FakeSession)
+    results = plugincache.scan_uncached(plugins)
+    assert probed == ["brokenB.vst3", "synthA.vst3"]
+    assert results == [{"name": "synthA.vst3", "path": str(plugins / "synthA.vst3")}]
+    assert not plugincache.cache_file().exists()
+    with pytest.raises(RuntimeError):
+        plugincache.scan_uncached(plugins / "missing")
+
+
 # -- caching behaviour ------------------------------------------------ #
 
 
@@ -240,3 +269,98 @@ def test_corrupt_cache_file_is_ignored(cache_env):
     plugincache.cache_file().write_text("{ not valid json ]")
     res = plugincache.scan(plugins)  # re-probes since cache unreadable
     assert {d["name"] for d in res} == {"synthA"}
+
+
+def test_save_leaves_no_temp_files(cache_env):
+    plugins, _ = cache_env
+    _touch_plugin(plugins, "synthA.vst3")
+    plugincache.scan(str(plugins))
+    cache_dir = plugincache.cache_file().parent
+    assert os.listdir(cache_dir) == ["plugins.json"]
+
+    # A failed write keeps the previous cache and cleans up its temp file.
+    with pytest.raises(TypeError):
+        plugincache._save_raw({"schema": 1, "entries": {"x": object()}})
+    assert os.listdir(cache_dir) == ["plugins.json"]
+    assert len(plugincache.scan(str(plugins))) == 1
+
+
+# -- parallel probing ------------------------------------------------- #
+
+
+def test_parallel_scan_matches_serial(cache_env, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Threads stand in for the worker processes so the fake probe applies.
+    monkeypatch.setattr(plugincache, "_executor", ThreadPoolExecutor)
+    plugins, calls = cache_env
+    for name in ("synthA.vst3", "fxB.vst3", "fxC.vst3", "broken.vst3"):
+        _touch_plugin(plugins, name)
+
+    progress: list[tuple[int, int]] = []
+    res = plugincache.scan(
+        plugins,
+        jobs=3,
+        include_errors=True,
+        on_progress=lambda d, t, _p: progress.append((d, t)),
+    )
+    assert [os.path.basename(d["path"]) for d in res] == [
+        "broken.vst3",
+        "fxB.vst3",
+        "fxC.vst3",
+        "synthA.vst3",
+    ]
+    assert res[0]["status"] == "error"
+    assert len(calls) == 4
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    # Cached on the second run, parallel or not.
+    assert len(plugincache.scan(plugins, jobs=3)) == 3
+    assert len(calls) == 4
+
+
+def _crashing_pool(crash_single: bool):
+    """Pool stand-in whose shared (multi-worker) pools always break; with
+    ``crash_single`` the one-worker retry pools break as well."""
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+
+    class CrashingPool:
+        def __init__(self, workers):
+            self.crash = workers > 1 or crash_single
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def submit(self, fn, path):
+            fut: Future = Future()
+            if self.crash:
+                fut.set_exception(BrokenProcessPool("worker died"))
+            else:
+                fut.set_result(fn(path))
+            return fut
+
+    return CrashingPool
+
+
+def test_crashed_worker_paths_are_reprobed(cache_env, monkeypatch):
+    monkeypatch.setattr(plugincache, "_executor", _crashing_pool(False))
+    plugins, calls = cache_env
+    _touch_plugin(plugins, "synthA.vst3")
+    _touch_plugin(plugins, "fxB.vst3")
+    res = plugincache.scan(plugins, jobs=2)
+    assert {d["name"] for d in res} == {"synthA", "fxB"}
+    assert len(calls) == 2  # retried in their own pools, not cached as errors
+
+
+def test_plugin_crashing_its_own_worker_is_an_error(cache_env, monkeypatch):
+    monkeypatch.setattr(plugincache, "_executor", _crashing_pool(True))
+    plugins, calls = cache_env
+    _touch_plugin(plugins, "synthA.vst3")
+    _touch_plugin(plugins, "fxB.vst3")
+    res = plugincache.scan(plugins, jobs=2, include_errors=True)
+    assert [d["status"] for d in res] == ["error", "error"]
+    assert calls == []  # never probed in the scanning process
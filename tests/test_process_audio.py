@@ -122,3 +122,45 @@ def test_process_audio_to_file_duplicates_mono_to_required_channels(tmp_path):
     )
     info = minihost.get_audio_info(str(out_path))
     assert info["channels"] == plugin.num_output_channels
+
+
+def test_duplicate_to_match_repeats_last_channel():
+    from minihost.process import _maybe_duplicate_to_match
+
+    data = np.arange(2 * 5, dtype=np.float32).reshape(2, 5)
+    out = _maybe_duplicate_to_match(
+        minihost.AudioBuffer.from_numpy(data), 4, True, "Input"
+    ).as_ndarray()
+    np.testing.assert_array_equal(out, data[[0, 1, 1, 1]])
+
+
+def test_slice_block_events_rebases_each_block():
+    from minihost.process import _slice_block_events
+
+    events = [(0, 0x90, 60, 100), (100, 0x80, 60, 0), (130, 0x90, 62, 90)]
+    positions = [ev[0] for ev in events]
+    idx = 0
+    blocks = []
+    for start in range(0, 192, 64):
+        block, idx = _slice_block_events(events, positions, idx, start, start + 64)
+        blocks.append(block)
+    assert blocks == [
+        [(0, 0x90, 60, 100)],
+        [(36, 0x80, 60, 0)],
+        [(2, 0x90, 62, 90)],
+    ]
+    assert idx == len(events)
+
+
+def test_fill_block_reports_whether_source_frames_were_copied():
+    from minihost.process import _fill_block
+
+    src = minihost.AudioBuffer.from_numpy(np.ones((2, 100), dtype=np.float32))
+    dst = minihost.AudioBuffer(2, 64)
+    assert _fill_block(dst, src, src.frames, 2, 64, 64) is True
+    out = dst.as_ndarray()
+    np.testing.assert_array_equal(out[:, :36], 1.0)
+    np.testing.assert_array_equal(out[:, 36:], 0.0)
+    assert _fill_block(dst, src, src.frames, 2, 128, 64) is False
+    np.testing.assert_array_equal(dst.as_ndarray(), 0.0)
+    assert _fill_block(dst, None, 0, 2, 0, 64) is False
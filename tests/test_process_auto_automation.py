@@ -17,27 +17,12 @@ Under the bug the parameter retains the value of the first change.
 Integration tests -- require a real plugin via ``MINIHOST_TEST_PLUGIN``.
 """
 
-import os
-
 import numpy as np
 import pytest
 
 import minihost
 
 
-@pytest.fixture
-def plugin_path():
-    path = os.environ.get("MINIHOST_TEST_PLUGIN")
-    if not path:
-        pytest.skip("MINIHOST_TEST_PLUGIN not set")
-    return path
-
-
-@pytest.fixture
-def plugin(plugin_path):
-    return minihost.Plugin(plugin_path, sample_rate=48000, max_block_size=512)
-
-
 def _find_varying_param(plugin):
     """Find a parameter whose normalized read-back clearly differs between
     0.0 and 1.0, so the automation effect is observable through get_param.
@@ -115,3 +100,23 @@ class TestProcessAutoMultiChange:
             [(0, idx, 0.0), (128, idx, 0.0), (300, idx, 1.0)],
         )
         self._assert_last_change_wins(plugin, idx, lo, hi)
+
+    def test_structured_array_changes(self, plugin):
+        """The make_param_changes array form is applied like the tuple list."""
+        found = _find_varying_param(plugin)
+        if found is None:
+            pytest.skip("no parameter with distinguishable 0.0/1.0 read-back")
+        idx, lo, hi = found
+        plugin.reset()
+        plugin.set_param(idx, 0.0)
+        changes = minihost.make_param_changes(2)
+        changes[0] = (0, idx, 0.0)
+        changes[1] = (self.BLOCK // 2, idx, 1.0)
+        self._run(plugin, changes)
+        self._assert_last_change_wins(plugin, idx, lo, hi)
+
+    def test_foreign_12_byte_records_rejected(self, plugin):
+        """A 12-byte record that is not MH_ParamChange raises, not memcpy'd."""
+        bogus = np.zeros(2, dtype=[("a", "<f4"), ("b", "<f4"), ("c", "<f4")])
+        with pytest.raises(TypeError):
+            self._run(plugin, bogus)
@@ -10,7 +10,11 @@ from minihost.render import (
     _collect_midi_events,
     _event_to_midi_tuple,
     _is_auto_tail,
+    _midi_plan,
+    midi_duration,
+    render_midi_to_file,
     _seconds_to_samples,
+    _tick_converter,
     _tick_to_seconds,
 )
 
@@ -196,6 +200,48 @@ class TestTickToSeconds:
         assert result == pytest.approx(0.5 + 9.0)
 
 
+class TestTickConverter:
+    """_tick_converter must agree exactly with _tick_to_seconds."""
+
+    def test_matches_tick_to_seconds_exactly(self):
+        # Two changes at tick 0 (the last wins) and several later segments.
+        tempo_map = [
+            (0, 500_000.0),
+            (0, 600_000.0),
+            (480, 1_000_000.0),
+            (500, 333_333.0),
+            (1920, 250_000.0),
+        ]
+        to_seconds = _tick_converter(tempo_map, 480)
+        for tick in [0, 1, 479, 480, 481, 500, 501, 1919, 1920, 1921, 9600]:
+            assert to_seconds(tick) == _tick_to_seconds(tick, tempo_map, 480)
+
+    def test_single_tempo(self):
+        to_seconds = _tick_converter([(0, 500_000.0)], 96)
+        assert to_seconds(0) == 0.0
+        assert to_seconds(96) == pytest.approx(0.5)
+
+    def test_max_tick_before_first_change(self):
+        # Every converted tick precedes the change at 1920, so it is
+        # dropped; results still match the full map exactly.
+        tempo_map = [(0, 500_000.0), (1920, 250_000.0)]
+        to_seconds = _tick_converter(tempo_map, 480, max_tick=1000)
+        for tick in [0, 1, 479, 999, 1000]:
+            assert to_seconds(tick) == _tick_to_seconds(tick, tempo_map, 480)
+
+    def test_max_tick_keeps_changes_in_range(self):
+        tempo_map = [(0, 500_000.0), (480, 1_000_000.0), (1920, 250_000.0)]
+        to_seconds = _tick_converter(tempo_map, 480, max_tick=1000)
+        for tick in [0, 480, 481, 1000]:
+            assert to_seconds(tick) == _tick_to_seconds(tick, tempo_map, 480)
+
+    def test_single_tempo_matches_tick_to_seconds_exactly(self):
+        tempo_map = [(0, 428_571.0)]
+        to_seconds = _tick_converter(tempo_map, 480)
+        for tick in [0, 1, 7, 479, 480, 12_345, 1_000_003]:
+            assert to_seconds(tick) == _tick_to_seconds(tick, tempo_map, 480)
+
+
 # ---------------------------------------------------------------------------
 # _collect_midi_events
 # ---------------------------------------------------------------------------
@@ -318,6 +364,36 @@ class TestCollectMidiEvents:
         assert channels == {0, 9}
 
 
+class TestChannelEvents:
+    """MidiFile.get_channel_events must match the dict-based path."""
+
+    def test_matches_collect_and_convert(self):
+        mf = _make_midi()
+        t1 = mf.add_track()
+        t2 = mf.add_track()
+        mf.add_tempo(t1, 0, 100.0)
+        mf.add_note_on(t1, 960, 1, 64, 90)
+        mf.add_note_on(t2, 0, 0, 60, 100)
+        mf.add_note_on(t2, 480, 0, 62, 0)  # zero velocity: a note-off
+        mf.add_control_change(t1, 480, 2, 7, 80)
+        mf.add_program_change(t2, 960, 3, 5)
+        mf.add_pitch_bend(t1, 10, 4, 12345)
+        expected = [
+            (ev["tick"],) + _event_to_midi_tuple(ev, 0)[1:]
+            for ev in _collect_midi_events(mf)
+        ]
+        assert mf.get_channel_events() == expected
+
+    def test_tempo_changes(self):
+        mf = _make_midi()
+        t = mf.add_track()
+        mf.add_tempo(t, 0, 90.0)
+        mf.add_tempo(t, 1920, 140.0)
+        changes = mf.get_tempo_changes()
+        assert [tick for tick, _ in changes] == [0, 1920]
+        assert [bpm for _, bpm in changes] == pytest.approx([90.0, 140.0])
+
+
 # ---------------------------------------------------------------------------
 # _event_to_midi_tuple
 # ---------------------------------------------------------------------------
@@ -401,6 +477,84 @@ class TestSecondsToSamples:
         assert _seconds_to_samples(0.0000001, 48000.0) == 0
 
 
+# ---------------------------------------------------------------------------
+# _midi_plan
+# ---------------------------------------------------------------------------
+
+
+class TestMidiPlan:
+    def test_reused_for_same_file_and_rate(self):
+        mf = _make_midi()
+        t = mf.add_track()
+        mf.add_note_on(t, 0, 0, 60, 100)
+        mf.add_note_off(t, 480, 0, 60)
+        plan = _midi_plan(mf, 48000.0)
+        assert _midi_plan(mf, 48000.0) is plan
+        assert _midi_plan(mf, 44100.0) is not plan
+        assert plan.events == [(0, 0x90, 60, 100), (24000, 0x80, 60, 0)]
+        assert plan.positions == [0, 24000]
+        assert plan.duration == pytest.approx(0.5)
+
+    def test_edit_invalidates_plan(self):
+        mf = _make_midi()
+        t = mf.add_track()
+        mf.add_note_on(t, 0, 0, 60, 100)
+        plan = _midi_plan(mf, 48000.0)
+        mf.add_note_off(t, 960, 0, 60)
+        fresh = _midi_plan(mf, 48000.0)
+        assert fresh is not plan
+        assert fresh.positions == [0, 48000]
+
+    def test_midi_duration_matches_plan(self):
+        mf = _make_midi()
+        t = mf.add_track()
+        mf.add_tempo(t, 0, 60.0)
+        mf.add_note_on(t, 0, 0, 60, 100)
+        mf.add_note_off(t, 960, 0, 60)
+        assert midi_duration(mf) == pytest.approx(2.0)
+        assert midi_duration(mf) == _midi_plan(mf, 44100.0).duration
+        mf.add_note_off(t, 1440, 0, 62)
+        assert midi_duration(mf) == pytest.approx(3.0)
+
+    def test_midi_duration_empty(self):
+        assert midi_duration(_make_midi()) == 0.0
+
+
+class _FailingPlugin:
+    """Stands in for a plugin whose processing raises part-way through."""
+
+    sample_rate = 48000.0
+    num_input_channels = 2
+    num_output_channels = 2
+    tail_seconds = 0.0
+    latency_samples = 0
+
+    def __init__(self, fail_after):
+        self._blocks = fail_after
+
+    def process_midi(self, inp, out, events):
+        if self._blocks == 0:
+            raise RuntimeError("plugin failed")
+        self._blocks -= 1
+
+
+class TestStreamToWav:
+    def test_failed_render_keeps_existing_file(self, tmp_path):
+        mf = _make_midi()
+        t = mf.add_track()
+        mf.add_note_on(t, 0, 0, 60, 100)
+        mf.add_note_off(t, 960, 0, 60)
+        out = tmp_path / "out.wav"
+        out.write_bytes(b"previous render")
+
+        with pytest.raises(RuntimeError, match="plugin failed"):
+            render_midi_to_file(
+                _FailingPlugin(fail_after=3), mf, str(out), tail_seconds=0
+            )
+        assert out.read_bytes() == b"previous render"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.wav"]
+
+
 # ---------------------------------------------------------------------------
 # Integration: tempo map + tick_to_seconds round-trip
 # ---------------------------------------------------------------------------
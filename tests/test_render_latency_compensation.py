@@ -134,3 +134,67 @@ def test_latency_handles_skip_larger_than_block():
     assert first_real_block is not None
     # First emitted sample should be plugin frame LATENCY.
     assert first_real_block[0, 0] == float(LATENCY)
+
+
+def test_render_block_without_copy_alternates_output_buffers():
+    # copy=False hands out the renderer's own full-block buffers, two of
+    # them in turn, so a block survives exactly one further call.
+    r = MidiRenderer(
+        _FakePlugin(latency_samples=0), _make_midi(), block_size=128, tail_seconds=0.1
+    )
+    a = r.render_block(copy=False)
+    b = r.render_block(copy=False)
+    assert a is not b
+    assert a[0, 0] == 0.0
+    assert b[0, 0] == 128.0
+    c = r.render_block(copy=False)
+    assert c is a
+    assert c[0, 0] == 256.0
+    # The default still returns an independent copy.
+    assert r.render_block() is not b
+
+
+def test_render_shorter_than_block_uses_persistent_buffers():
+    # A render that fits in one block sizes its buffers to the render, so
+    # the single block comes from them rather than a one-off allocation.
+    r = MidiRenderer(
+        _FakePlugin(latency_samples=0), _make_midi(), block_size=65536, tail_seconds=0.0
+    )
+    b = r.render_block(copy=False)
+    assert b is r._output_buffers[0]
+    assert b.frames == r.total_samples
+    assert r.is_finished
+
+
+def test_dense_blocks_pass_events_as_structured_array():
+    # A block holding many events hands them over as a make_midi_events
+    # array; the rebased offsets and bytes match the tuple path.
+    from minihost._core import MidiFile
+
+    mf = MidiFile()
+    t = mf.add_track()
+    for i in range(40):
+        mf.add_note_on(t, 0, 0, 20 + i, 100)
+    mf.add_note_on(t, 480, 0, 90, 64)  # 24000 samples in: a sparse block
+
+    seen = []
+
+    class _Recording(_FakePlugin):
+        def process_midi(self, input_buffer, output_buffer, midi_events):
+            super().process_midi(input_buffer, output_buffer, midi_events)
+            if len(midi_events):
+                seen.append(
+                    (
+                        isinstance(midi_events, np.ndarray),
+                        [tuple(int(x) for x in ev) for ev in midi_events],
+                    )
+                )
+
+    r = MidiRenderer(
+        _Recording(latency_samples=0), mf, block_size=256, tail_seconds=0.0
+    )
+    while not r.is_finished:
+        r.render_block()
+
+    assert seen[0] == (True, [(0, 0x90, 20 + i, 100) for i in range(40)])
+    assert seen[1] == (False, [(24000 % 256, 0x90, 90, 64)])
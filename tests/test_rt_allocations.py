@@ -61,6 +61,32 @@ def test_process_double_input_not_mutated():
     assert np.array_equal(inp, inp_copy), "process_double mutated caller input"
 
 
+@skip_if_no_plugin
+def test_process_double_float32_matches_float64():
+    # The float32 overload widens into a reused workspace; over varying
+    # block sizes it must agree with the float64 path on the same input.
+    rng = np.random.default_rng(seed=11)
+    p64 = minihost.Plugin(PLUGIN, sample_rate=48000, max_block_size=1024)
+    p32 = minihost.Plugin(PLUGIN, sample_rate=48000, max_block_size=1024)
+    for n in [256, 1024, 64]:
+        inp = rng.standard_normal((p64.num_input_channels, n)).astype(np.float32)
+        out64 = np.zeros((p64.num_output_channels, n), dtype=np.float64)
+        out32 = np.zeros((p32.num_output_channels, n), dtype=np.float32)
+        p64.process_double(inp.astype(np.float64), out64)
+        p32.process_double(inp, out32)
+        np.testing.assert_allclose(out32, out64.astype(np.float32), atol=1e-6)
+
+
+@skip_if_no_plugin
+def test_process_double_rejects_float64_into_float32():
+    # float64 samples must not be narrowed to float32 on the way in.
+    p = minihost.Plugin(PLUGIN, sample_rate=48000, max_block_size=256)
+    inp = np.zeros((p.num_input_channels, 256), dtype=np.float64)
+    out = np.zeros((p.num_output_channels, 256), dtype=np.float32)
+    with pytest.raises(TypeError):
+        p.process_double(inp, out)
+
+
 @skip_if_no_plugin
 def test_chain_process_auto_repeated_chunks():
     # Exercise the chain auto-chunk persistent-vector path with many param
@@ -0,0 +1,58 @@
+"""Tests for the _testsignals in-place signal generators."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from minihost._testsignals import fill_impulse, fill_noise, fill_sine
+
+
+class TestFillSine:
+    def test_matches_reference(self):
+        buf = np.zeros((2, 64), dtype=np.float32)
+        fill_sine(buf, 1000.0, 48000.0)
+        n = np.arange(64)
+        expected = np.sin(2 * math.pi * 1000.0 * n / 48000.0)
+        np.testing.assert_allclose(buf[0], expected, atol=1e-6)
+        np.testing.assert_array_equal(buf[0], buf[1])
+
+    def test_phase_continuous_across_blocks(self):
+        whole = np.zeros((1, 128), dtype=np.float32)
+        fill_sine(whole, 440.0, 48000.0)
+        block = np.zeros((1, 64), dtype=np.float32)
+        pos = fill_sine(block, 440.0, 48000.0)
+        assert pos == 64
+        np.testing.assert_array_equal(block[0], whole[0, :64])
+        fill_sine(block, 440.0, 48000.0, phase=pos)
+        np.testing.assert_allclose(block[0], whole[0, 64:], atol=1e-6)
+
+    def test_amplitude_and_1d(self):
+        buf = np.zeros(256, dtype=np.float32)
+        fill_sine(buf, 375.0, 48000.0, amplitude=0.5)
+        assert float(np.max(np.abs(buf))) == pytest.approx(0.5, abs=1e-3)
+
+
+class TestFillNoise:
+    def test_bounded_and_seeded(self):
+        a = np.zeros((2, 512), dtype=np.float32)
+        b = np.zeros((2, 512), dtype=np.float32)
+        fill_noise(a, amplitude=0.25, seed=7)
+        fill_noise(b, amplitude=0.25, seed=7)
+        np.testing.assert_array_equal(a, b)
+        assert float(np.max(np.abs(a))) <= 0.25
+        assert float(np.max(np.abs(a))) > 0.0
+
+
+class TestFillImpulse:
+    def test_single_impulse(self):
+        buf = np.ones((2, 16), dtype=np.float32)
+        fill_impulse(buf, position=3, amplitude=0.5)
+        assert buf[:, 3].tolist() == [0.5, 0.5]
+        assert float(np.abs(buf).sum()) == pytest.approx(1.0)
+
+    def test_out_of_range_raises(self):
+        buf = np.zeros((1, 16), dtype=np.float32)
+        with pytest.raises(ValueError):
+            fill_impulse(buf, position=16)
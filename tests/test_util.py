@@ -0,0 +1,32 @@
+"""Tests for minihost.as_audio."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from minihost._util import as_audio
+
+
+class TestAsAudio:
+    def test_contiguous_float32_is_returned_unchanged(self):
+        arr = np.zeros((2, 64), dtype=np.float32)
+        assert as_audio(arr) is arr
+
+    def test_column_slice_is_made_contiguous(self):
+        arr = np.arange(2 * 64, dtype=np.float32).reshape(2, 64)
+        out = as_audio(arr[:, 8:24])
+        assert out.flags.c_contiguous
+        assert out.dtype == np.float32
+        np.testing.assert_array_equal(out, arr[:, 8:24])
+
+    def test_float64_is_converted(self):
+        arr = np.ones((2, 16), dtype=np.float64)
+        out = as_audio(arr)
+        assert out.dtype == np.float32
+        np.testing.assert_array_equal(out, 1.0)
+
+    def test_transpose_is_made_contiguous(self):
+        arr = np.zeros((64, 2), dtype=np.float32)
+        out = as_audio(arr.T)
+        assert out.shape == (2, 64)
+        assert out.flags.c_contiguous
@@ -182,8 +182,12 @@ def check_linear_chain(plugin_path: str) -> None:
     ref_p2 = _new_plugin(plugin_path)
     chain = minihost.PluginChain([ref_p1, ref_p2])
     ref_out = np.zeros_like(src)
+    # Outputs are written in place, so render each block into a contiguous
+    # buffer; a column slice of ref_out is not C-contiguous.
+    blk = np.zeros((CHANNELS, BLOCK), dtype=np.float32)
     for t0 in range(0, TOTAL_FRAMES, BLOCK):
-        chain.process_auto(src[:, t0 : t0 + BLOCK], ref_out[:, t0 : t0 + BLOCK], [], [])
+        chain.process_auto(src[:, t0 : t0 + BLOCK], blk, [], [])
+        ref_out[:, t0 : t0 + BLOCK] = blk
 
     # Candidate: graph executor
     g = _RefGraph()
@@ -207,8 +211,10 @@ def check_fanout_mix(plugin_path: str) -> None:
     # Reference: render once through plugin, double it
     ref_p = _new_plugin(plugin_path)
     wet = np.zeros_like(src)
+    blk = np.zeros((CHANNELS, BLOCK), dtype=np.float32)
     for t0 in range(0, TOTAL_FRAMES, BLOCK):
-        ref_p.process_auto(src[:, t0 : t0 + BLOCK], wet[:, t0 : t0 + BLOCK], [], [])
+        ref_p.process_auto(src[:, t0 : t0 + BLOCK], blk, [], [])
+        wet[:, t0 : t0 + BLOCK] = blk
     ref_out = wet + wet
 
     # Candidate: fan-out into mix
@@ -249,10 +255,12 @@ def check_automation_slicing(plugin_path: str) -> None:
     # Reference: Plugin.process_auto block-by-block, slicing the schedule
     ref_p = _new_plugin(plugin_path)
     ref_out = np.zeros_like(src)
+    blk = np.zeros((CHANNELS, BLOCK), dtype=np.float32)
     for t0 in range(0, TOTAL_FRAMES, BLOCK):
         t1 = t0 + BLOCK
         autos = [(off - t0, p, v) for (off, p, v) in schedule if t0 <= off < t1]
-        ref_p.process_auto(src[:, t0:t1], ref_out[:, t0:t1], [], autos)
+        ref_p.process_auto(src[:, t0:t1], blk, [], autos)
+        ref_out[:, t0:t1] = blk
 
     # Candidate: graph w/ same automation expressed in absolute time
     g = _RefGraph()